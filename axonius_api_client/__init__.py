@@ -4,7 +4,7 @@ from . import api, auth, cli, constants, exceptions, http, logs, tools, version
 from .api import Adapters, Devices, Enforcements, System, Users
 from .auth import ApiKey
 from .connect import Connect
-from .http import Http
+from .http import AsyncHttp, Http
 
 __version__ = version.__version__
 LOG = logs.LOG
@@ -14,6 +14,7 @@ __all__ = (
     "Connect",
     # http client
     "Http",
+    "AsyncHttp",
     # authentication
     "ApiKey",
     # api
@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
 """API models package."""
-from . import adapters, assets, enforcements, entry, mixins, parsers, routers, system
+from . import (
+    adapters,
+    assets,
+    enforcements,
+    entry,
+    mixins,
+    paging,
+    parsers,
+    routers,
+    system,
+)
 from .adapters import Adapters
 from .assets import Devices, Users
 from .enforcements import Enforcements, RunAction
@@ -20,6 +30,7 @@ __all__ = (
     "adapters",
     "enforcements",
     "mixins",
+    "paging",
     "system",
     "parsers",
     "entry",
@@ -1,21 +1,27 @@
 # -*- coding: utf-8 -*-
 """API models package."""
 from ...exceptions import ApiError
-from . import base, base_csv, base_json, base_table
+from . import base, base_columnar, base_csv, base_json, base_sqlite, base_table
 from .base import Base
+from .base_columnar import Columnar
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_sqlite import Sqlite
 from .base_table import Table
 
 __all__ = (
     "Base",
+    "Columnar",
     "Csv",
     "Json",
+    "Sqlite",
     "Table",
     "base",
+    "base_columnar",
     "base_csv",
     "base_json",
+    "base_sqlite",
     "base_table",
 )
 
@@ -27,6 +33,8 @@ CALLBACKS_MAP = {
     "table": Table,
     "base": Base,
     "json_to_csv": JsonToCsv,
+    "columnar": Columnar,
+    "sqlite": Sqlite,
 }
 
 
@@ -1,13 +1,35 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
-import copy
+import concurrent.futures
+import gzip
+import io
+import itertools
+import os
 import sys
 
-from ...constants import (DEFAULT_PATH, FIELD_JOINER, FIELD_TRIM_LEN,
-                          FIELD_TRIM_STR, SCHEMAS_CUSTOM)
+from ...constants import (
+    DEFAULT_PATH,
+    EXPORT_BUFFER_SIZE,
+    EXPORT_COMPRESS_LEVELS,
+    EXPORT_COMPRESS_SUFFIXES,
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    FIELD_TRIM_STR,
+    ROW_CHUNK_SIZE,
+    ROW_WORKERS,
+    SCHEMAS_CUSTOM,
+    TAGS_STREAM_SIZE,
+)
 from ...exceptions import ApiError
-from ...tools import (calc_percent, echo_error, echo_ok, echo_warn, get_path,
-                      join_kv, listify)
+from ...tools import (
+    calc_percent,
+    echo_error,
+    echo_ok,
+    echo_warn,
+    get_path,
+    join_kv,
+    listify,
+)
 
 
 class Base:
@@ -15,6 +37,7 @@ class Base:
 
     CB_NAME = "base"
     FIND_KEYS = ["name", "name_qual", "column_title", "name_base"]
+    CHECKPOINTS = True
 
     def __init__(
         self, apiobj, store, state=None, fields_map=None, getargs=None,
@@ -47,6 +70,20 @@ class Base:
         self.TAG_ROWS_REMOVE = []
         """:obj:`list` of :obj:`dict`: assets to remove tags from in do_tagging."""
 
+        self.TAG_IDS_ADD = set()
+        """:obj:`set` of :obj:`str`: internal_axon_id of assets to add tags to."""
+
+        self.TAG_IDS_REMOVE = set()
+        """:obj:`set` of :obj:`str`: internal_axon_id of assets to remove tags from."""
+
+        self.TAG_FUTURES = []
+        """:obj:`list`: batches of tags being added or removed in the background."""
+
+        self.RESUME = None
+        """:obj:`dict`: output of :meth:`get_checkpoint` to resume from in start."""
+
+        self._row_pool = None
+        self._row_transformed = None
         self._init()
 
     def _init(self):
@@ -76,9 +113,23 @@ class Base:
         final_columns = join + join.join(self.final_columns)
         self.echo(msg=f"Final Columns: {final_columns}")
 
+        self.LOG.debug(f"Compiled row plan with {len(self.row_plan['steps'])} steps")
+
+        if self.RESUME:
+            self.TAG_IDS_ADD.update(self.RESUME["tag_ids_add"])
+            self.TAG_IDS_REMOVE.update(self.RESUME["tag_ids_remove"])
+            self.TAG_ROWS_ADD += [
+                {"internal_axon_id": x} for x in self.RESUME["tag_rows_add"]
+            ]
+            self.TAG_ROWS_REMOVE += [
+                {"internal_axon_id": x} for x in self.RESUME["tag_rows_remove"]
+            ]
+            self.echo(msg=f"Resuming from checkpoint at offset {self.RESUME['offset']}")
+
     def stop(self, **kwargs):
         """Run stop callbacks."""
         self.do_tagging()
+        self.stop_row_pool()
         self.echo(msg=f"Stopping {self}")
 
     def process_row(self, row):
@@ -86,6 +137,59 @@ class Base:
         self.do_pre_row()
         return self.do_row(row=row)
 
+    def process_rows(self, rows):
+        """Handle callbacks for the assets of a page.
+
+        Notes:
+            If row_workers in :attr:`STATE` is greater than 1, the rows are sent
+            to a pool of processes in chunks of row_chunk_size rows to run the
+            steps of :attr:`row_plan`. The transformed rows are handed back to
+            :meth:`process_row` in the same order as the rows of the page.
+
+        Yields:
+            :obj:`list` of :obj:`dict`: output of :meth:`process_row` for each row
+        """
+        pool = self.get_row_pool()
+
+        if pool is None:
+            for row in rows:
+                yield self.process_row(row=row)
+            return
+
+        size = self.STATE.get("row_chunk_size", ROW_CHUNK_SIZE) or ROW_CHUNK_SIZE
+        rows = iter(rows)
+        chunks = []
+
+        for chunk in iter(lambda: list(itertools.islice(rows, size)), []):
+            for row in chunk:
+                self.add_report_adapters_missing(row=row)
+            chunks.append(chunk)
+
+        for chunk, new_rows in zip(chunks, pool.map(transform_rows, chunks)):
+            for row, row_new_rows in zip(chunk, new_rows):
+                self._row_transformed = row_new_rows
+                yield self.process_row(row=row)
+
+    def get_row_pool(self):
+        """Get the pool of processes to transform rows with, if row_workers > 1."""
+        workers = self.STATE.get("row_workers", ROW_WORKERS) or ROW_WORKERS
+
+        if workers > 1 and self._row_pool is None:
+            self._row_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_row_worker,
+                initargs=(self.row_plan,),
+            )
+            self.LOG.debug(f"Started {workers} processes to transform rows")
+
+        return self._row_pool
+
+    def stop_row_pool(self):
+        """Shut down the pool of processes used to transform rows."""
+        if self._row_pool is not None:
+            self._row_pool.shutdown(wait=True)
+            self._row_pool = None
+
     def do_pre_row(self):
         """Pass."""
         self.STATE.setdefault("rows_processed_total", 0)
@@ -96,19 +200,13 @@ class Base:
         """Pass."""
         self.process_tags_to_add(row=row)
         self.process_tags_to_remove(row=row)
-        self.add_report_adapters_missing(row=row)
 
-        for schema in self.schemas_selected:
-            self.do_excludes(row=row, schema=schema)
-            self.do_add_null_values(row=row, schema=schema)
-            self.do_flatten_fields(row=row, schema=schema)
+        if self._row_transformed is not None:
+            new_rows, self._row_transformed = self._row_transformed, None
+            return new_rows
 
-        new_rows = self.do_explode_field(row=row)
-        for new_row in new_rows:
-            self.do_join_values(row=new_row)
-            self.do_change_field_titles(row=new_row)
-
-        return new_rows
+        self.add_report_adapters_missing(row=row)
+        return transform_row(row=row, plan=self.row_plan)
 
     def echo_page_progress(self):
         """Asset callback to echo progress per N rows using an echo method."""
@@ -145,20 +243,11 @@ class Base:
             return
 
         null_value = self.GETARGS.get("field_null_value", None)
-        field = schema[key]
-
-        if schema["is_complex"]:
-            row[field] = listify(row.get(field, []))
-
-            for item in row[field]:
-                for sub_schema in self.get_sub_schemas(schema=schema):
-                    self.do_add_null_values(schema=sub_schema, row=item, key="name")
-        else:
-            row[field] = row.get(field, null_value)
+        self._row_null(row, self._get_null_plan(schema=schema, key=key), null_value)
 
     def do_excludes(self, row, schema):
         """Asset callback to remove fields from row."""
-        if not self.GETARGS.get("field_excludes", []):
+        if not self.field_excludes:
             return
 
         if self.is_excluded(schema=schema):
@@ -166,11 +255,10 @@ class Base:
             return
 
         if schema["is_complex"]:
-            items = listify(row.get(schema["name_qual"], []))
-            for sub_schema in schema["sub_fields"]:
-                if self.is_excluded(schema=sub_schema):
-                    for item in items:
-                        item.pop(sub_schema["name"], None)
+            names = [
+                x["name"] for x in schema["sub_fields"] if self.is_excluded(schema=x)
+            ]
+            self._row_excludes_sub(row, schema["name_qual"], names)
 
     def do_join_values(self, row):
         """Join values."""
@@ -179,25 +267,15 @@ class Base:
 
         joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
         trim_len = self.GETARGS.get("field_join_trim", FIELD_TRIM_LEN)
-        trim_str = FIELD_TRIM_STR
-
-        for field in row:
-            if isinstance(row[field], list):
-                row[field] = joiner.join([str(x) for x in row[field]])
-
-            if trim_len and isinstance(row[field], str):
-                field_len = len(row[field])
-                if len(row[field]) >= trim_len:
-                    msg = trim_str.format(field_len=field_len, trim_len=trim_len)
-                    row[field] = joiner.join([row[field][:trim_len], msg])
+        self._row_join(row, joiner, trim_len)
 
     def do_change_field_titles(self, row):
         """Asset callback to change qual name to title."""
         if not self.GETARGS.get("field_titles", False):
             return
 
-        for schema in self.final_schemas:
-            row[schema["column_title"]] = row.pop(schema["name_qual"], None)
+        renames = [(x["name_qual"], x["column_title"]) for x in self.final_schemas]
+        self._row_rename(row, renames)
 
     def do_flatten_fields(self, row, schema):
         """Asset callback to flatten complex fields."""
@@ -218,54 +296,124 @@ class Base:
             return
 
         null_value = self.GETARGS.get("field_null_value", None)
+        subs = self._get_flatten_subs(schema=schema)
+        self._row_flatten(row, schema["name_qual"], subs, null_value)
+
+    @staticmethod
+    def _row_null(row, null_plan, null_value):
+        """Null out missing fields using the output of _get_null_plan."""
+        field, sub_plans = null_plan
+
+        if sub_plans is None:
+            row[field] = row.get(field, null_value)
+            return
+
+        row[field] = listify(row.get(field, []))
 
-        items = listify(row.pop(schema["name_qual"], []))
+        for item in row[field]:
+            for sub_plan in sub_plans:
+                Base._row_null(item, sub_plan, null_value)
 
-        for sub_schema in self.get_sub_schemas(schema=schema):
-            row[sub_schema["name_qual"]] = []
+    @staticmethod
+    def _row_pop(row, field):
+        """Remove an excluded field from row."""
+        row.pop(field, None)
+
+    @staticmethod
+    def _row_excludes_sub(row, field, names):
+        """Remove excluded sub fields from each item of a complex field in row."""
+        if not names:
+            return
+
+        for item in listify(row.get(field, [])):
+            for name in names:
+                item.pop(name, None)
+
+    @staticmethod
+    def _row_flatten(row, field, subs, null_value):
+        """Flatten a complex field using the output of _get_flatten_subs."""
+        items = listify(row.pop(field, []))
+
+        for name, name_qual in subs:
+            values = row[name_qual] = []
 
             for item in items:
-                value = item.pop(sub_schema["name"], null_value)
-                value = value if isinstance(value, list) else [value]
-                row[sub_schema["name_qual"]] += value
+                value = item.pop(name, null_value)
+                if isinstance(value, list):
+                    values += value
+                else:
+                    values.append(value)
+
+    @staticmethod
+    def _row_join(row, joiner, trim_len, trim_str=FIELD_TRIM_STR):
+        """Join list values and trim string values in row."""
+        for field, value in row.items():
+            if isinstance(value, list):
+                value = row[field] = joiner.join([str(x) for x in value])
 
-    def do_explode_field(self, row):
-        """Explode a field into multiple rows."""
-        explode = self.GETARGS.get("field_explode", "")
-        null_value = self.GETARGS.get("field_null_value", None)
+            if trim_len and isinstance(value, str):
+                field_len = len(value)
+                if field_len >= trim_len:
+                    msg = trim_str.format(field_len=field_len, trim_len=trim_len)
+                    row[field] = joiner.join([value[:trim_len], msg])
+
+    @staticmethod
+    def _row_rename(row, renames):
+        """Rename fields in row using a list of (name, new name)."""
+        for name, new_name in renames:
+            row[new_name] = row.pop(name, None)
+
+    def _get_null_plan(self, schema, key="name_qual"):
+        """Get the field and the sub field plans used to null out missing fields."""
+        if not schema["is_complex"]:
+            return (schema[key], None)
+
+        sub_plans = [
+            self._get_null_plan(schema=x, key="name")
+            for x in self.get_sub_schemas(schema=schema)
+        ]
+        return (schema[key], sub_plans)
+
+    def _get_flatten_subs(self, schema):
+        """Get the name and qualified name of the sub fields to flatten."""
+        return [(x["name"], x["name_qual"]) for x in self.get_sub_schemas(schema=schema)]
 
+    def do_explode_field(self, row):
+        """Explode a field into multiple rows.
+
+        Notes:
+            Each new row is a shallow copy of the row without the exploded field,
+            so the values of all other fields are shared between the new rows
+            instead of being copied for each item of the exploded field. Nothing
+            after this step modifies those values in place.
+        """
+        return self._row_explode(row, self.row_plan["explode"])
+
+    @classmethod
+    def _row_explode(cls, row, explode):
         if not explode:
             return [row]
 
-        schema = self.schema_to_explode
+        field, subs, null_value = explode
+        items = listify(row.get(field, []))
 
-        if self.is_excluded(schema=schema):
+        if not items or subs == []:
+            if subs is not None:
+                cls._row_flatten(row, field, subs, null_value)
             return [row]
 
-        original_row = copy.deepcopy(row)
+        base = {k: v for k, v in row.items() if k != field}
 
-        if schema["is_complex"]:
-            new_rows_map = {}
-            items = listify(row.pop(schema["name_qual"], []))
-
-            for sub_schema in self.get_sub_schemas(schema=schema):
-                for idx, item in enumerate(items):
-                    new_rows_map.setdefault(idx, copy.deepcopy(row))
-                    value = item.pop(sub_schema["name"], null_value)
-                    new_rows_map[idx][sub_schema["name_qual"]] = value
-        else:
-            new_rows_map = {}
-            items = listify(row.pop(schema["name_qual"], []))
-
-            for idx, item in enumerate(items):
-                new_rows_map.setdefault(idx, copy.deepcopy(row))
-                new_rows_map[idx][schema["name_qual"]] = item
+        if subs is None:
+            return [{**base, field: item} for item in items]
 
-        new_rows = [new_rows_map[idx] for idx in new_rows_map]
+        new_rows = []
 
-        if not new_rows:
-            self._do_flatten_fields(row=original_row, schema=schema)
-            return [original_row]
+        for item in items:
+            new_row = dict(base)
+            for name, name_qual in subs:
+                new_row[name_qual] = item.pop(name, null_value)
+            new_rows.append(new_row)
 
         return new_rows
 
@@ -273,22 +421,80 @@ class Base:
         """Pass."""
         self.do_tag_add()
         self.do_tag_remove()
+        self.do_tag_wait()
 
     def do_tag_add(self):
         """Pass."""
         tags_add = listify(self.GETARGS.get("tags_add", []))
         rows_add = self.TAG_ROWS_ADD
         if tags_add and rows_add:
-            self.echo(msg=f"Adding tags {tags_add} to {len(rows_add)} assets")
-            self.APIOBJ.labels.add(rows=rows_add, labels=tags_add)
+            if self.GETARGS.get("tags_stream", False):
+                self.do_tag_flush(rows=rows_add, labels=tags_add, method="add")
+            else:
+                self.echo(msg=f"Adding tags {tags_add} to {len(rows_add)} assets")
+                self.APIOBJ.labels.add(rows=rows_add, labels=tags_add)
 
     def do_tag_remove(self):
         """Pass."""
         tags_remove = listify(self.GETARGS.get("tags_remove", []))
         rows_remove = self.TAG_ROWS_REMOVE
         if tags_remove and rows_remove:
-            self.echo(msg=f"Removing tags {tags_remove} from {len(rows_remove)} assets")
-            self.APIOBJ.labels.remove(rows=rows_remove, labels=tags_remove)
+            if self.GETARGS.get("tags_stream", False):
+                self.do_tag_flush(rows=rows_remove, labels=tags_remove, method="remove")
+            else:
+                msg = f"Removing tags {tags_remove} from {len(rows_remove)} assets"
+                self.echo(msg=msg)
+                self.APIOBJ.labels.remove(rows=rows_remove, labels=tags_remove)
+
+    def do_tag_flush(self, rows, labels, method):
+        """Add or remove tags for the queued rows in a background thread.
+
+        Args:
+            rows (:obj:`list` of :obj:`dict`): queued rows, emptied once submitted
+            labels (:obj:`list` of :obj:`str`): tags to add or remove
+            method (:obj:`str`): ``"add"`` or ``"remove"``
+        """
+        self.do_tag_check()
+
+        if not hasattr(self, "_tag_executor"):
+            self._tag_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.CB_NAME}_tags"
+            )
+
+        batch = list(rows)
+        del rows[:]
+
+        func = getattr(self.APIOBJ.labels, method)
+        future = self._tag_executor.submit(func, rows=batch, labels=labels)
+        self.TAG_FUTURES.append(future)
+        self.LOG.debug(f"Queued {method} of tags {labels} for {len(batch)} assets")
+
+    def do_tag_check(self):
+        """Re-raise the exception of any background tag batch that failed."""
+        for future in [x for x in self.TAG_FUTURES if x.done()]:
+            future.result()
+
+    def do_tag_wait(self):
+        """Wait for all background tag batches to finish and remove them."""
+        if not hasattr(self, "_tag_executor"):
+            return
+
+        try:
+            for future in self.TAG_FUTURES:
+                future.result()
+        finally:
+            self._tag_executor.shutdown(wait=True)
+            del self._tag_executor
+            del self.TAG_FUTURES[:]
+
+        tags_add = listify(self.GETARGS.get("tags_add", []))
+        if tags_add and self.TAG_IDS_ADD:
+            self.echo(msg=f"Added tags {tags_add} to {len(self.TAG_IDS_ADD)} assets")
+
+        tags_remove = listify(self.GETARGS.get("tags_remove", []))
+        if tags_remove and self.TAG_IDS_REMOVE:
+            count = len(self.TAG_IDS_REMOVE)
+            self.echo(msg=f"Removed tags {tags_remove} from {count} assets")
 
     def process_tags_to_add(self, row):
         """Pass."""
@@ -296,10 +502,12 @@ class Base:
         if not tags:
             return
 
-        tag_row = {"internal_axon_id": row["internal_axon_id"]}
+        axon_id = row["internal_axon_id"]
 
-        if tag_row not in self.TAG_ROWS_ADD:
-            self.TAG_ROWS_ADD.append(tag_row)
+        if axon_id not in self.TAG_IDS_ADD:
+            self.TAG_IDS_ADD.add(axon_id)
+            self.TAG_ROWS_ADD.append({"internal_axon_id": axon_id})
+            self.check_tag_stream(rows=self.TAG_ROWS_ADD, labels=tags, method="add")
 
     def process_tags_to_remove(self, row):
         """Pass."""
@@ -307,10 +515,23 @@ class Base:
         if not tags:
             return
 
-        tag_row = {"internal_axon_id": row["internal_axon_id"]}
+        axon_id = row["internal_axon_id"]
+
+        if axon_id not in self.TAG_IDS_REMOVE:
+            self.TAG_IDS_REMOVE.add(axon_id)
+            self.TAG_ROWS_REMOVE.append({"internal_axon_id": axon_id})
+            self.check_tag_stream(
+                rows=self.TAG_ROWS_REMOVE, labels=tags, method="remove"
+            )
+
+    def check_tag_stream(self, rows, labels, method):
+        """Flush the queued rows if tags_stream is enabled and enough are queued."""
+        if not self.GETARGS.get("tags_stream", False):
+            return
 
-        if tag_row not in self.TAG_ROWS_REMOVE:
-            self.TAG_ROWS_REMOVE.append(tag_row)
+        size = self.GETARGS.get("tags_stream_size", TAGS_STREAM_SIZE) or TAGS_STREAM_SIZE
+        if len(rows) >= size:
+            self.do_tag_flush(rows=rows, labels=labels, method=method)
 
     def add_report_adapters_missing(self, row):
         """Pass."""
@@ -323,31 +544,16 @@ class Base:
         field_name = schema["name_qual"]
 
         adapters_row = row.get("adapters", [])
-        adapter_map = self.adapter_map
-        missing = []
-
-        for adapter in adapter_map["all"]:
-            if adapter in adapters_row:
-                continue
-
-            if adapter not in adapter_map["all_fields"]:
-                continue
-
-            if adapter not in missing:
-                missing.append(adapter)
-
-        row[field_name] = missing
+        row[field_name] = [
+            x for x in self.adapter_map["all_with_fields"] if x not in adapters_row
+        ]
 
     def is_excluded(self, schema):
         """Check if a name supplied to field_excludes matches one of GET_SCHEMA_KEYS."""
-        excludes = listify(self.GETARGS.get("field_excludes", []))
-
-        for exclude in excludes:
-            for key in self.FIND_KEYS:
-                name = schema.get(key, None)
-                if (name and exclude) and name == exclude:
-                    return True
-        return False
+        excludes = self.field_excludes
+        return bool(excludes) and any(
+            schema.get(key, None) in excludes for key in self.FIND_KEYS
+        )
 
     def open_fd_arg(self):
         """Pass."""
@@ -358,6 +564,14 @@ class Base:
 
     def open_fd_path(self):
         """Pass."""
+        self.get_export_path()
+        self._fd_close = self.GETARGS.get("export_fd_close", True)
+        self._fd = self.open_fd_compress(path=self._file_path)
+        self.echo(msg=f"Exporting to file '{self._file_path}' ({self._file_mode_ing})")
+        return self._fd
+
+    def get_export_path(self):
+        """Resolve and create export_file in export_path, checking export_overwrite."""
         self._export_file = self.GETARGS.get("export_file", None)
         self._export_path = self.GETARGS.get("export_path", DEFAULT_PATH)
         self._export_overwrite = self.GETARGS.get("export_overwrite", False)
@@ -368,20 +582,82 @@ class Base:
 
         if self._file_path.exists():
             self._file_mode = "overwrote"
-            mode = "overwriting"
+            self._file_mode_ing = "overwriting"
         else:
             self._file_mode = "created"
-            mode = "creating"
+            self._file_mode_ing = "creating"
 
         if self._file_path.exists() and not self._export_overwrite:
             msg = f"Export file '{fp}' already exists and overwite is False!"
             self.echo(msg=msg, error=ApiError, level="error")
 
         self._file_path.touch(mode=0o600)
-        self._fd_close = self.GETARGS.get("export_fd_close", True)
-        self._fd = self._file_path.open(mode="w", encoding="utf-8")
-        self.echo(msg=f"Exporting to file '{fp}' ({mode})")
-        return self._fd
+        return self._file_path
+
+    def open_fd_compress(self, path):
+        """Open a file for writing text, compressed if export_compress is set.
+
+        Notes:
+            If export_compress is not supplied, it is picked from the suffix of
+            the file (see :data:`axonius_api_client.constants.EXPORT_COMPRESS_SUFFIXES`).
+            zstd requires zstandard and lz4 requires lz4 to be installed.
+        """
+        compress = self.GETARGS.get("export_compress", None)
+        if compress is None:
+            compress = EXPORT_COMPRESS_SUFFIXES.get(path.suffix.lower(), "none")
+
+        level = self.GETARGS.get("export_compress_level", None)
+        if level is None:
+            level = EXPORT_COMPRESS_LEVELS.get(compress)
+
+        buffer_size = self.GETARGS.get("export_buffer_size", EXPORT_BUFFER_SIZE)
+        buffer_size = buffer_size or EXPORT_BUFFER_SIZE
+
+        self._fd_raw = path.open(mode="wb", buffering=buffer_size)
+
+        if compress == "none":
+            stream = self._fd_raw
+        elif compress == "gzip":
+            stream = gzip.GzipFile(fileobj=self._fd_raw, mode="wb", compresslevel=level)
+        elif compress == "zstd":
+            try:
+                import zstandard
+            except ImportError as exc:
+                self._fd_raw.close()
+                msg = (
+                    "zstandard must be installed to use zstd compression "
+                    f"(pip install axonius_api_client[compress]): {exc}"
+                )
+                self.echo(msg=msg, error=ApiError, level="error")
+            stream = zstandard.ZstdCompressor(level=level).stream_writer(self._fd_raw)
+        elif compress == "lz4":
+            try:
+                import lz4.frame
+            except ImportError as exc:
+                self._fd_raw.close()
+                msg = (
+                    "lz4 must be installed to use lz4 compression "
+                    f"(pip install axonius_api_client[compress]): {exc}"
+                )
+                self.echo(msg=msg, error=ApiError, level="error")
+            stream = lz4.frame.open(
+                self._fd_raw, mode="wb", compression_level=level
+            )
+        else:
+            self._fd_raw.close()
+            valid = ["none", *EXPORT_COMPRESS_LEVELS]
+            msg = f"Invalid export_compress {compress!r}, valid: {valid}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if compress != "none" and self.STATE.get("checkpoint_file", None):
+            stream.close()
+            self._fd_raw.close()
+            msg = f"Export compression {compress!r} can not be used with checkpoints"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._fd_compress = compress
+        self.LOG.debug(f"Export compression {compress!r} level {level}")
+        return io.TextIOWrapper(stream, encoding="utf-8")
 
     def open_fd_stdout(self):
         """Pass."""
@@ -391,8 +667,75 @@ class Base:
         self.echo(msg="Exporting to stdout")
         return self._fd
 
+    def check_checkpoint(self):
+        """Check that these callbacks can be checkpointed and resumed."""
+        if not self.CHECKPOINTS:
+            msg = f"Checkpoints are not supported by {self}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+    def get_checkpoint(self):
+        """Get what is needed to resume these callbacks after the rows so far.
+
+        Notes:
+            Anything written to the export file is flushed and synced to disk, so
+            the offset of the file is the end of the rows processed so far.
+
+        Returns:
+            :obj:`dict`: checkpoint to set as :attr:`RESUME` when resuming
+        """
+        checkpoint = {
+            "export": self.CB_NAME,
+            "file": None,
+            "offset": None,
+            "tag_ids_add": sorted(self.TAG_IDS_ADD),
+            "tag_ids_remove": sorted(self.TAG_IDS_REMOVE),
+            "tag_rows_add": [x["internal_axon_id"] for x in self.TAG_ROWS_ADD],
+            "tag_rows_remove": [x["internal_axon_id"] for x in self.TAG_ROWS_REMOVE],
+        }
+
+        if getattr(self, "_fd", None) is not None:
+            self._fd.flush()
+            self._fd_raw.flush()
+            os.fsync(self._fd_raw.fileno())
+            checkpoint["file"] = str(self._file_path)
+            checkpoint["offset"] = self._fd_raw.tell()
+
+        return checkpoint
+
+    def open_fd_resume(self):
+        """Open the export file from :attr:`RESUME` and truncate it to its offset."""
+        file_path = get_path(obj=self.GETARGS.get("export_path", DEFAULT_PATH))
+        self._file_path = fp = (file_path / self.GETARGS["export_file"]).resolve()
+        offset = self.RESUME["offset"]
+
+        if str(fp) != self.RESUME["file"]:
+            msg = f"Export file '{fp}' does not match checkpoint {self.RESUME['file']!r}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if not fp.is_file() or fp.stat().st_size < offset:
+            msg = f"Export file '{fp}' is missing or smaller than offset {offset}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._file_mode = "resumed"
+        self._fd_compress = "none"
+        self._fd_close = self.GETARGS.get("export_fd_close", True)
+        self._fd_raw = fp.open(mode="r+b")
+        self._fd_raw.truncate(offset)
+        self._fd_raw.seek(offset)
+        self._fd = io.TextIOWrapper(self._fd_raw, encoding="utf-8")
+        self.echo(msg=f"Exporting to file '{fp}' (resuming at offset {offset})")
+        return self._fd
+
     def open_fd(self):
         """Open a file descriptor."""
+        if self.STATE.get("checkpoint_file", None):
+            if not self.GETARGS.get("export_file", None):
+                msg = f"export_file must be supplied to use checkpoints with {self}"
+                self.echo(msg=msg, error=ApiError, level="error")
+
+            if self.RESUME and self.RESUME["file"]:
+                return self.open_fd_resume()
+
         if "export_fd" in self.GETARGS:
             self.open_fd_arg()
         elif self.GETARGS.get("export_file", None):
@@ -401,13 +744,21 @@ class Base:
             self.open_fd_stdout()
         return self._fd
 
-    def close_fd(self):
-        """Close a file descriptor."""
-        self._fd.write("\n")
-        if getattr(self, "_fd_close", False):
-            name = str(getattr(self._fd, "name", self._fd))
-            self.echo(msg=f"Finished exporting to {name!r}")
-            self._fd.close()
+    def close_fd(self, newline=True):
+        """Close a file descriptor, even if writing the newline fails."""
+        try:
+            if newline:
+                self._fd.write("\n")
+        finally:
+            if getattr(self, "_fd_close", False):
+                fd_raw = getattr(self, "_fd_raw", None)
+                name = str(getattr(fd_raw or self._fd, "name", self._fd))
+                self.echo(msg=f"Finished exporting to {name!r}")
+                try:
+                    self._fd.close()
+                finally:
+                    if fd_raw is not None:
+                        fd_raw.close()
 
     def echo(
         self,
@@ -448,6 +799,85 @@ class Base:
                 continue
             yield sub_schema
 
+    @property
+    def field_excludes(self):
+        """Pass."""
+        if hasattr(self, "_field_excludes"):
+            return self._field_excludes
+
+        excludes = listify(self.GETARGS.get("field_excludes", []))
+        self._field_excludes = {x for x in excludes if x}
+        return self._field_excludes
+
+    @property
+    def row_plan(self):
+        """Compile the steps to run against each row based on GETARGS.
+
+        Notes:
+            Resolves exclusions, sub fields, null values, flatten targets, join
+            settings and title renames once, so that :meth:`do_row` only has to
+            run the precomputed steps for each row.
+        """
+        if hasattr(self, "_row_plan"):
+            return self._row_plan
+
+        do_excludes = bool(self.field_excludes)
+        do_null = self.GETARGS.get("field_null", False)
+        do_flatten = self.GETARGS.get("field_flatten", False)
+        null_value = self.GETARGS.get("field_null_value", None)
+        schema_to_explode = self.schema_to_explode
+
+        steps = []
+
+        for schema in self.schemas_selected:
+            field = schema["name_qual"]
+
+            if self.is_excluded(schema=schema):
+                if do_excludes:
+                    steps.append((self._row_pop, (field,)))
+                continue
+
+            is_complex = schema["is_complex"]
+
+            if do_excludes and is_complex:
+                names = [
+                    x["name"] for x in schema["sub_fields"] if self.is_excluded(schema=x)
+                ]
+                if names:
+                    steps.append((self._row_excludes_sub, (field, names)))
+
+            if do_null:
+                null_plan = self._get_null_plan(schema=schema)
+                steps.append((self._row_null, (null_plan, null_value)))
+
+            if do_flatten and is_complex and schema_to_explode != schema:
+                subs = self._get_flatten_subs(schema=schema)
+                steps.append((self._row_flatten, (field, subs, null_value)))
+
+        join = None
+        if self.GETARGS.get("field_join", False):
+            joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
+            join = (joiner, self.GETARGS.get("field_join_trim", FIELD_TRIM_LEN))
+
+        titles = None
+        if self.GETARGS.get("field_titles", False):
+            titles = [(x["name_qual"], x["column_title"]) for x in self.final_schemas]
+
+        explode = None
+        if schema_to_explode and not self.is_excluded(schema=schema_to_explode):
+            subs = None
+            if schema_to_explode["is_complex"]:
+                subs = self._get_flatten_subs(schema=schema_to_explode)
+            explode = (schema_to_explode["name_qual"], subs, null_value)
+
+        self._row_plan = {
+            "steps": steps,
+            "join": join,
+            "titles": titles,
+            "explode": explode,
+        }
+        return self._row_plan
+
     @property
     def custom_schemas(self):
         """Pass."""
@@ -574,7 +1004,10 @@ class Base:
     @property
     def adapter_map(self):
         """Pass."""
-        self._adapters_meta = getattr(self, "_adapters_meta", self.APIOBJ.adapters.get())
+        if hasattr(self, "_adapter_map"):
+            return self._adapter_map
+
+        self._adapters_meta = self.APIOBJ.adapters.get()
         amap = {
             "has_cnx": [],
             "all": [],
@@ -584,13 +1017,16 @@ class Base:
         for adapter in self._adapters_meta:
             name_raw = adapter["name_raw"]
 
-            if adapter not in amap["all"]:
+            if name_raw not in amap["all"]:
                 amap["all"].append(name_raw)
             if adapter["cnx"]:
                 amap["has_cnx"].append(name_raw)
 
-        amap = {k: list(v) for k, v in amap.items()}
-        return amap
+        all_fields = set(amap["all_fields"])
+        amap["all_with_fields"] = [x for x in amap["all"] if x in all_fields]
+
+        self._adapter_map = amap
+        return self._adapter_map
 
     @property
     def args_map(self):
@@ -607,10 +1043,15 @@ class Base:
             ["field_null_value", "Missing field value:", None],
             ["tags_add", "Add tags:", []],
             ["tags_remove", "Remove tags:", []],
+            ["tags_stream", "Apply tags while fetching:", False],
+            ["tags_stream_size", "Apply tags per row count:", TAGS_STREAM_SIZE],
             ["report_adapters_missing", "Report Missing Adapters:", False],
             ["export_file", "Export to file:", None],
             ["export_path", "Export file to path:", DEFAULT_PATH],
             ["export_overwrite", "Export overwrite file:", False],
+            ["export_compress", "Export compression:", None],
+            ["export_compress_level", "Export compression level:", None],
+            ["export_buffer_size", "Export buffer size:", EXPORT_BUFFER_SIZE],
             ["export_schema", "Export schema:", False],
             ["page_progress", "Progress per row count:", 10000],
             ["json_flat", "Produce flat json:", False],
@@ -637,3 +1078,42 @@ class Base:
     def __repr__(self):
         """Show info for this object."""
         return self.__str__()
+
+
+ROW_PLAN = None
+""":obj:`dict`: :attr:`Base.row_plan` of the callbacks in a row worker process."""
+
+
+def init_row_worker(plan):
+    """Set the row plan to use in a row worker process."""
+    global ROW_PLAN
+    ROW_PLAN = plan
+
+
+def transform_rows(rows):
+    """Transform a chunk of rows in a row worker process using :data:`ROW_PLAN`."""
+    return [transform_row(row=row, plan=ROW_PLAN) for row in rows]
+
+
+def transform_row(row, plan):
+    """Run the steps of :attr:`Base.row_plan` against a row.
+
+    Args:
+        row (:obj:`dict`): row to transform
+        plan (:obj:`dict`): output of :attr:`Base.row_plan`
+
+    Returns:
+        :obj:`list` of :obj:`dict`: the transformed row, or the rows it was
+            exploded into
+    """
+    for step, args in plan["steps"]:
+        step(row, *args)
+
+    new_rows = Base._row_explode(row, plan["explode"])
+    for new_row in new_rows:
+        if plan["join"]:
+            Base._row_join(new_row, *plan["join"])
+        if plan["titles"]:
+            Base._row_rename(new_row, plan["titles"])
+
+    return new_rows
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""API models for working with device and user assets."""
+import io
+import json
+
+from ...constants import FIELD_JOINER
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import Base
+
+COLUMNAR_FORMAT = "auto"
+COLUMNAR_FORMATS = ["auto", "parquet", "arrow", "json"]
+COLUMNAR_ROW_GROUP_SIZE = 10000
+COLUMNAR_JSON_VERSION = 1
+
+
+class Columnar(Base):
+    """Export assets to a typed columnar file.
+
+    Notes:
+        The type of each column is picked from the ``type_norm`` of its schema
+        in :attr:`final_schemas`. Rows are buffered per column and written as a
+        row group every **columnar_row_group_size** rows to:
+
+        * ``"parquet"``: a Parquet file, requires pyarrow
+        * ``"arrow"``: an Arrow IPC file, requires pyarrow
+        * ``"json"``: a JSON line with the columns, followed by one JSON line
+          per row group with the values of each column
+        * ``"auto"``: Parquet if pyarrow is installed, otherwise JSON
+
+        If parquet or arrow are requested and pyarrow is not installed, JSON is
+        used instead. Multiple values in a column that is not a list (i.e. an
+        aggregated field with values from more than one adapter) are joined with
+        **field_join_value** for strings and reduced to the first value for
+        other types.
+    """
+
+    CB_NAME = "columnar"
+    CHECKPOINTS = False
+
+    def _init(self, **kwargs):
+        """Pass."""
+        self.GETARGS["field_null"] = True
+        self.GETARGS["field_flatten"] = True
+        self.GETARGS["field_join"] = False
+
+    def start(self, **kwargs):
+        """Build the columns and open the file descriptor."""
+        super(Columnar, self).start(**kwargs)
+        self._columns = self.get_columns()
+        self._buffers = {x["name"]: [] for x in self._columns}
+        self._buffer_rows = 0
+        self._rows_written = 0
+        self._format, self._pa = self.get_format()
+        self._writer = None
+
+        self.open_fd()
+        self.echo(msg=f"Writing {len(self._columns)} columns as {self._format}")
+
+    def stop(self, **kwargs):
+        """Write the last row group and close the file descriptor."""
+        super(Columnar, self).stop(**kwargs)
+        self.write_row_group()
+
+        if self._format == "json":
+            if not self._rows_written:
+                self._write_json_header()
+        else:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            self._writer.close()
+
+        self.echo(msg=f"Wrote {self._rows_written} rows as {self._format}")
+        self.close_fd(newline=False)
+
+    def process_row(self, row):
+        """Add the processed rows to the column buffers."""
+        self.do_pre_row()
+
+        return_row = [{"internal_axon_id": row["internal_axon_id"]}]
+        new_rows = self.do_row(row=row)
+
+        for new_row in listify(new_rows):
+            for column in self._columns:
+                value = new_row.get(column["name"], None)
+                self._buffers[column["name"]].append(column["coerce"](value))
+
+            self._buffer_rows += 1
+            del new_row
+
+        del new_rows
+        del row
+
+        row_group_size = self.GETARGS.get(
+            "columnar_row_group_size", COLUMNAR_ROW_GROUP_SIZE
+        )
+        if self._buffer_rows >= (row_group_size or COLUMNAR_ROW_GROUP_SIZE):
+            self.write_row_group()
+
+        return return_row
+
+    def write_row_group(self):
+        """Write the buffered rows as a row group and empty the buffers."""
+        if not self._buffer_rows:
+            return
+
+        if self._format == "json":
+            if not self._rows_written:
+                self._write_json_header()
+            group = {"rows": self._buffer_rows, "columns": self._buffers}
+            self._fd.write(json.dumps(group))
+            self._fd.write("\n")
+        else:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            table = self._pa.Table.from_pydict(self._buffers, schema=self._schema)
+            self._writer.write_table(table)
+
+        self.LOG.debug(f"Wrote row group of {self._buffer_rows} rows")
+        self._rows_written += self._buffer_rows
+        self._buffers = {x["name"]: [] for x in self._columns}
+        self._buffer_rows = 0
+
+    def get_format(self):
+        """Get the format to write and pyarrow if it is needed."""
+        fmt = self.GETARGS.get("columnar_format", COLUMNAR_FORMAT) or COLUMNAR_FORMAT
+
+        if fmt not in COLUMNAR_FORMATS:
+            msg = f"Invalid columnar_format {fmt!r}, valid: {COLUMNAR_FORMATS}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if fmt == "json":
+            return fmt, None
+
+        try:
+            import pyarrow
+            import pyarrow.ipc  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:
+            if fmt != "auto":
+                msg = (
+                    f"pyarrow is not installed, writing {fmt} as json "
+                    f"(pip install axonius_api_client[columnar]): {exc}"
+                )
+                self.echo(msg=msg, warning=True)
+            return "json", None
+
+        return ("parquet" if fmt == "auto" else fmt), pyarrow
+
+    def get_columns(self):
+        """Get the name, type and coerce method for each column."""
+        explode = self.schema_to_explode.get("name_qual", "")
+        joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
+
+        columns = []
+
+        for name, schema in zip(self.final_columns, self.final_schemas):
+            type_norm = schema.get("type_norm", "string")
+            parent = schema.get("parent", "root")
+
+            is_flat_sub = parent not in ["root", explode]
+            is_list = bool(schema.get("is_list")) and not schema["is_complex"]
+            is_list = is_list or type_norm.startswith("list_") or is_flat_sub
+
+            base = get_base_type(type_norm=type_norm)
+            columns.append(
+                {
+                    "name": name,
+                    "type": base,
+                    "is_list": is_list,
+                    "coerce": get_coerce(base=base, is_list=is_list, joiner=joiner),
+                }
+            )
+
+        return columns
+
+    def _write_json_header(self):
+        header = {
+            "version": COLUMNAR_JSON_VERSION,
+            "columns": [
+                {"name": x["name"], "type": x["type"], "is_list": x["is_list"]}
+                for x in self._columns
+            ],
+        }
+        self._fd.write(json.dumps(header))
+        self._fd.write("\n")
+
+    def _open_writer(self):
+        pa = self._pa
+        types = {
+            "string": pa.string(),
+            "bool": pa.bool_(),
+            "integer": pa.int64(),
+            "number": pa.float64(),
+        }
+
+        fields = []
+        for column in self._columns:
+            ptype = types[column["type"]]
+            ptype = pa.list_(ptype) if column["is_list"] else ptype
+            fields.append(pa.field(column["name"], ptype))
+
+        self._schema = pa.schema(fields)
+
+        sink = self._fd
+        if isinstance(self._fd, io.TextIOBase):
+            sink = getattr(self._fd, "buffer", None)
+            if sink is None:
+                msg = f"Unable to write {self._format} to text only {self._fd}"
+                self.echo(msg=msg, error=ApiError, level="error")
+            self._fd.flush()
+
+        if self._format == "arrow":
+            return pa.ipc.new_file(sink, self._schema)
+
+        return pa.parquet.ParquetWriter(
+            sink,
+            self._schema,
+            compression=self.GETARGS.get("columnar_compression", "snappy"),
+        )
+
+    @property
+    def args_map(self):
+        """Pass."""
+        args = super(Columnar, self).args_map
+        return args + [
+            ["columnar_format", "Columnar format:", COLUMNAR_FORMAT],
+            ["columnar_row_group_size", "Rows per group:", COLUMNAR_ROW_GROUP_SIZE],
+            ["columnar_compression", "Parquet compression:", "snappy"],
+        ]
+
+
+def get_base_type(type_norm):
+    """Get the column type for the normalized type of a schema."""
+    base = type_norm[5:] if type_norm.startswith("list_") else type_norm
+
+    if base in ["bool", "integer", "number"]:
+        return base
+    return "string"
+
+
+def get_coerce(base, is_list, joiner=FIELD_JOINER):
+    """Get a method that coerces values into the type of a column.
+
+    Args:
+        base (:obj:`str`): output of :func:`get_base_type`
+        is_list (:obj:`bool`): column holds lists of **base**
+        joiner (:obj:`str`, optional): default
+            :data:`axonius_api_client.constants.FIELD_JOINER` - used to join
+            multiple values of a string column that is not a list
+
+    Returns:
+        :obj:`callable`: coerce method
+    """
+    coerce_one = COERCE_MAP[base]
+
+    if is_list:
+
+        def coerce(value):
+            if value is None:
+                return None
+            return [coerce_one(x) for x in listify(value)]
+
+    else:
+
+        def coerce(value):
+            if isinstance(value, list):
+                if not value:
+                    return None
+                if len(value) > 1 and base == "string":
+                    return joiner.join(coerce_string(x) for x in value)
+                value = value[0]
+            return coerce_one(value)
+
+    return coerce
+
+
+def coerce_string(value):
+    """Coerce a value into a string, serializing lists and dicts as JSON."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def coerce_bool(value):
+    """Coerce a value into a bool."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in ["true", "yes", "1"]
+    return bool(value)
+
+
+def coerce_integer(value):
+    """Coerce a value into an integer, or None if it is not a number."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def coerce_number(value):
+    """Coerce a value into a float, or None if it is not a number."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+COERCE_MAP = {
+    "string": coerce_string,
+    "bool": coerce_bool,
+    "integer": coerce_integer,
+    "number": coerce_number,
+}
@@ -33,11 +33,6 @@ class Csv(Base):
 
         self.open_fd()
 
-        try:
-            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
-        except Exception:
-            self.LOG.error("Unable to write UTF8 BOM!")
-
         self._stream = csv.DictWriter(
             self._fd,
             fieldnames=self.final_columns,
@@ -46,6 +41,15 @@ class Csv(Base):
             restval=restval,
             dialect=dialect,
         )
+
+        if self.RESUME:
+            return
+
+        try:
+            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
+        except Exception:
+            self.LOG.error("Unable to write UTF8 BOM!")
+
         self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
         self.do_export_schema()
 
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
 import json
-import textwrap
 
+from ...exceptions import ApiError
 from ...tools import listify
 from .base import Base
 
 JSON_FLAT = False
+JSON_BACKEND = "json"
+JSON_BACKENDS = ["json", "orjson", "auto"]
+JSON_BUFFER_SIZE = 1024 * 1024
 
 
 class Json(Base):
@@ -17,22 +20,33 @@ class Json(Base):
     def start(self, **kwargs):
         """Create jsonstream and associated file descriptor."""
         super(Json, self).start(**kwargs)
-        flat = self.GETARGS.get("json_flat", JSON_FLAT)
-
-        self._first_row = True
         self.open_fd()
-        begin = "" if flat else "["
-        self._fd.write(begin)
 
-    def stop(self, **kwargs):
-        """Close jsonstream and associated file descriptor."""
-        super(Json, self).stop(**kwargs)
-        flat = self.GETARGS.get("json_flat", JSON_FLAT)
+        self._writer = JsonWriter(
+            fd=self._fd,
+            flat=self.GETARGS.get("json_flat", JSON_FLAT),
+            backend=self.GETARGS.get("json_backend", JSON_BACKEND) or JSON_BACKEND,
+        )
+
+        if self.RESUME:
+            self._writer.count = self.RESUME["json_count"]
+        else:
+            self._writer.start()
 
-        self.do_export_schema()
-        end = "" if flat else "\n]"
-        self._fd.write(end)
-        self.close_fd()
+    def stop(self, **kwargs):
+        """Close jsonstream and associated file descriptor.
+
+        Notes:
+            The rows buffered by the JSON writer are written and the file
+            descriptor is closed even if stop callbacks raise an error.
+        """
+        try:
+            super(Json, self).stop(**kwargs)
+            self.do_export_schema()
+            self._writer.stop()
+        finally:
+            self._writer.flush()
+            self.close_fd()
 
     def process_row(self, row):
         """Write row to jsonstreams and delete it."""
@@ -53,23 +67,14 @@ class Json(Base):
 
     def write_row(self, row):
         """Pass."""
-        flat = self.GETARGS.get("json_flat", JSON_FLAT)
-
-        indent = None if flat else 2
-        prefix = " " * indent if indent else ""
+        self._writer.write(row=row)
 
-        if flat:
-            pre = "" if self._first_row else "\n"
-        else:
-            pre = "\n" if self._first_row else ",\n"
-
-        self._first_row = False
-        self._fd.write(pre)
-
-        value = json.dumps(row, indent=indent)
-        value = textwrap.indent(value, prefix=prefix) if indent else value
-        self._fd.write(value)
-        del value
+    def get_checkpoint(self):
+        """Flush the JSON writer and add its row count to the checkpoint."""
+        self._writer.flush()
+        checkpoint = super(Json, self).get_checkpoint()
+        checkpoint["json_count"] = self._writer.count
+        return checkpoint
 
     def do_export_schema(self):
         """Pass."""
@@ -79,3 +84,131 @@ class Json(Base):
             row = {"schemas": self.final_schemas}
             self.write_row(row=row)
             del row
+
+    @property
+    def args_map(self):
+        """Pass."""
+        args = super(Json, self).args_map
+        return args + [["json_backend", "JSON serializer:", JSON_BACKEND]]
+
+
+class JsonWriter:
+    """Write rows to a file descriptor as a JSON list or as one JSON object per line.
+
+    Notes:
+        Rows in a JSON list are serialized with an indent of 2 and every line is
+        indented 2 more to nest them in the list. JSON escapes newlines in
+        strings, so the only newlines in a serialized row are the ones added by
+        indenting. Serialized rows are buffered and written to the file
+        descriptor once the buffer reaches **buffer_size** characters.
+
+        The orjson backend writes the same data, but not the same bytes as the
+        json backend: it does not escape non-ASCII characters, does not put a
+        space after separators in flat rows and may write floats differently.
+    """
+
+    def __init__(self, fd, flat=JSON_FLAT, backend=JSON_BACKEND, buffer_size=None):
+        """Write rows to a file descriptor as a JSON list or as JSON lines.
+
+        Args:
+            fd (:obj:`io.TextIOBase`): file descriptor to write to
+            flat (:obj:`bool`, optional): default ``False`` -
+
+                * if ``True`` write one JSON object per line
+                * if ``False`` write an indented JSON list
+
+            backend (:obj:`str`, optional): default ``"json"`` - serializer to use:
+
+                * ``"json"``: :mod:`json` from the standard library
+                * ``"orjson"``: orjson, which must be installed (output is
+                  equivalent JSON, but not byte for byte the same as json)
+                * ``"auto"``: orjson if it is installed, otherwise :mod:`json`
+
+            buffer_size (:obj:`int`, optional): default ``None`` - number of
+                characters to buffer before writing, ``None`` will use
+                :data:`JSON_BUFFER_SIZE`
+        """
+        self.fd = fd
+        self.flat = flat
+        self.buffer_size = buffer_size or JSON_BUFFER_SIZE
+        self.backend, self._dumps = self._get_dumps(backend=backend, flat=flat)
+        self.count = 0
+        self._buffer = []
+        self._buffer_len = 0
+
+    def __str__(self):
+        """Show object info."""
+        return (
+            f"{self.__class__.__name__}(flat={self.flat}, backend={self.backend!r}, "
+            f"count={self.count})"
+        )
+
+    def __repr__(self):
+        """Show object info."""
+        return self.__str__()
+
+    def start(self):
+        """Write the beginning of the JSON list."""
+        if not self.flat:
+            self._write("[")
+
+    def write(self, row):
+        """Serialize a row and add it to the buffer."""
+        value = self._dumps(row)
+
+        if self.flat:
+            pre = "\n" if self.count else ""
+        else:
+            pre = ",\n  " if self.count else "\n  "
+            value = value.replace("\n", "\n  ")
+
+        self.count += 1
+        self._write(pre)
+        self._write(value)
+
+    def stop(self):
+        """Write the end of the JSON list and flush the buffer."""
+        try:
+            if not self.flat:
+                self._write("\n]")
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Write the buffer to the file descriptor."""
+        if self._buffer:
+            self.fd.write("".join(self._buffer))
+            self._buffer = []
+            self._buffer_len = 0
+
+    def _write(self, value):
+        self._buffer.append(value)
+        self._buffer_len += len(value)
+
+        if self._buffer_len >= self.buffer_size:
+            self.flush()
+
+    @staticmethod
+    def _get_dumps(backend, flat):
+        if backend not in JSON_BACKENDS:
+            valid = ", ".join(JSON_BACKENDS)
+            raise ApiError(f"Invalid JSON backend {backend!r}, valid: {valid}")
+
+        if backend in ["orjson", "auto"]:
+            try:
+                import orjson
+            except ImportError as exc:
+                if backend == "orjson":
+                    raise ApiError(
+                        "orjson must be installed to use it "
+                        f"(pip install axonius_api_client[fast]): {exc}"
+                    )
+            else:
+                option = 0 if flat else orjson.OPT_INDENT_2
+
+                def dumps(row):
+                    return orjson.dumps(row, option=option).decode("utf-8")
+
+                return "orjson", dumps
+
+        return "json", json.JSONEncoder(indent=None if flat else 2).encode
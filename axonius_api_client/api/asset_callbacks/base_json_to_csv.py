@@ -1,52 +1,120 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import gzip
+import io
 import json
 import tempfile
 
 from ...tools import listify
 from .base_csv import Csv
 
+SPOOL_COMPRESS = False
+
 
 class JsonToCsv(Csv):
     """Pass."""
 
     CB_NAME = "json_to_csv"
+    CHECKPOINTS = False
 
     def start(self, **kwargs):
         """Create temp file for writing to."""
         super(Csv, self).start(**kwargs)
-        self._temp_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
-        self.echo(msg=f"Writing JSON to temporary file {self._temp_file.name!r}")
+        self._columns = dict.fromkeys(self.final_columns)
+        self._spool_rows = 0
+        self.open_spool()
 
     def stop(self, **kwargs):
-        """Create CSV file, process each row in temp file, then close temp and csv."""
+        """Create CSV file, process each row in temp file, then close temp and csv.
+
+        Notes:
+            Rows are processed as they are fetched and spooled to the temp file as
+            JSON lines, while every column seen is added to the columns predicted
+            by :attr:`final_columns`. Once all rows are fetched, the CSV header is
+            written with all of those columns and the temp file is read back one
+            line at a time, so only one row is held in memory at any point.
+        """
         super(Csv, self).stop(**kwargs)
-        self._start(**kwargs)
 
-        self.echo(msg="Re-reading temporary file and converting to CSV")
-        self._temp_file.file.seek(0)
-        for line in self._temp_file.file.readlines():
-            self.STATE["rows_processed_total"] = 0
-            self.do_pre_row()
+        self._final_columns = list(self._columns)
+        self.do_start(**kwargs)
+
+        self.echo(msg=f"Re-reading {self._spool_rows} rows from temporary file")
+        page_progress = self.GETARGS.get("page_progress", 10000)
 
-            row = json.loads(line.strip())
-            new_rows = self.do_row(row=row)
-            for new_row in listify(new_rows):
-                self._stream.writerow(new_row)
-                del new_row
-            del new_rows
+        for idx, line in enumerate(self.read_spool(), start=1):
+            self._stream.writerow(json.loads(line))
 
-        self.echo(msg=f"Closing and deleting temporary file {self._temp_file.name!r}")
-        self._temp_file.file.close()
-        self._stop(**kwargs)
+            if isinstance(page_progress, int) and page_progress:
+                if idx % page_progress == 0 or idx == self._spool_rows:
+                    self.echo(msg=f"Wrote {idx} / {self._spool_rows} rows to CSV")
+
+        self.close_spool()
+        self.do_stop(**kwargs)
 
     def process_row(self, row):
-        """Write row to temp file with no processing."""
+        """Process row and write the new rows to temp file."""
         self.do_pre_row()
 
         return_row = [{"internal_axon_id": row["internal_axon_id"]}]
-        row = json.dumps(row)
-        self._temp_file.file.write(f"{row}\n")
+        new_rows = self.do_row(row=row)
+
+        for new_row in listify(new_rows):
+            self._columns.update(dict.fromkeys(new_row))
+            self._spool.write(f"{json.dumps(new_row)}\n")
+            self._spool_rows += 1
+            del new_row
+
+        del new_rows
         del row
 
         return return_row
+
+    def open_spool(self):
+        """Open the temp file to spool rows to, compressed if json_to_csv_compress."""
+        compress = self.GETARGS.get("json_to_csv_compress", SPOOL_COMPRESS)
+
+        self._temp_file = tempfile.TemporaryFile(mode="w+b")
+
+        if compress:
+            raw = gzip.GzipFile(fileobj=self._temp_file, mode="wb", compresslevel=1)
+        else:
+            raw = self._temp_file
+
+        self._spool = io.TextIOWrapper(raw, encoding="utf-8", write_through=False)
+        self.echo(msg=f"Writing JSON to temporary file (compressed: {compress})")
+        return self._spool
+
+    def read_spool(self):
+        """Yield each line that was written to the temp file."""
+        compress = self.GETARGS.get("json_to_csv_compress", SPOOL_COMPRESS)
+
+        self._spool.flush()
+        if compress:
+            self._spool.detach().close()
+        else:
+            self._spool.detach()
+
+        self._temp_file.seek(0)
+
+        if compress:
+            raw = gzip.GzipFile(fileobj=self._temp_file, mode="rb")
+        else:
+            raw = self._temp_file
+
+        self._spool = io.TextIOWrapper(raw, encoding="utf-8")
+        yield from self._spool
+
+    def close_spool(self):
+        """Close and delete the temp file."""
+        self.echo(msg="Closing and deleting temporary file")
+        self._spool.close()
+        self._temp_file.close()
+
+    @property
+    def args_map(self):
+        """Pass."""
+        args = super(JsonToCsv, self).args_map
+        return args + [
+            ["json_to_csv_compress", "Compress temporary file:", SPOOL_COMPRESS],
+        ]
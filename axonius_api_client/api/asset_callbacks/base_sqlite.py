@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""API models for working with device and user assets."""
+import json
+import re
+import sqlite3
+
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import Base
+
+SQLITE_BATCH_SIZE = 1000
+SQLITE_INDEXES = ["internal_axon_id"]
+SQLITE_AFFINITIES = {"integer": "INTEGER", "bool": "INTEGER", "number": "REAL"}
+
+
+class Sqlite(Base):
+    """Export assets to tables in a SQLite database.
+
+    Notes:
+        The database is written to **export_file** in **export_path**. A table
+        named **sqlite_table** (default: the asset type, i.e. ``devices``) is
+        created with a column for each of :attr:`final_columns`, using an
+        affinity picked from the ``type_norm`` of its schema.
+
+        Complex fields that are not flattened are moved into a child table named
+        ``<sqlite_table>_<field>``, with a row for each of their items keyed by
+        ``internal_axon_id``. Values of list fields are stored as JSON arrays.
+
+        Rows are inserted in a transaction every **sqlite_batch_size** rows and
+        the indexes in **sqlite_indexes** are created once all rows are inserted.
+    """
+
+    CB_NAME = "sqlite"
+    CHECKPOINTS = False
+
+    def start(self, **kwargs):
+        """Create the tables in a new database."""
+        super(Sqlite, self).start(**kwargs)
+
+        if not self.GETARGS.get("export_file", None):
+            msg = "export_file must be supplied to export to sqlite"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._table = self.GETARGS.get("sqlite_table", None) or self.get_table_name()
+        self._tables = self.get_tables()
+        self._batch = {x["name"]: [] for x in self._tables}
+        self._batch_rows = 0
+        self._rows_written = 0
+
+        self.open_db()
+
+        for table in self._tables:
+            self._conn.execute(table["create"])
+        self._conn.commit()
+
+        self.echo(msg=f"Created {len(self._tables)} tables in '{self._file_path}'")
+
+    def stop(self, **kwargs):
+        """Insert the last batch, create the indexes and close the database."""
+        super(Sqlite, self).stop(**kwargs)
+        self.write_batch()
+        self.create_indexes()
+        self.echo(msg=f"Wrote {self._rows_written} rows to table {self._table!r}")
+        self.close_db()
+
+    def process_row(self, row):
+        """Add the processed rows to the batch of rows to insert."""
+        self.do_pre_row()
+
+        return_row = [{"internal_axon_id": row["internal_axon_id"]}]
+        new_rows = self.do_row(row=row)
+
+        for new_row in listify(new_rows):
+            self.add_row(row=new_row)
+            del new_row
+
+        del new_rows
+        del row
+
+        batch_size = self.GETARGS.get("sqlite_batch_size", SQLITE_BATCH_SIZE)
+        if self._batch_rows >= (batch_size or SQLITE_BATCH_SIZE):
+            self.write_batch()
+
+        return return_row
+
+    def add_row(self, row):
+        """Add a row to the main table and its complex values to the child tables."""
+        main, *children = self._tables
+        asset_id = row.get(self._id_key, None)
+
+        self._batch[main["name"]].append(
+            [to_sql(row.get(x["key"], None), x["is_list"]) for x in main["columns"]]
+        )
+
+        for child in children:
+            for item in listify(row.get(child["key"], None)):
+                if not isinstance(item, dict):
+                    continue
+
+                values = [asset_id] + [
+                    to_sql(item.get(x["key"], None), x["is_list"])
+                    for x in child["columns"][1:]
+                ]
+                self._batch[child["name"]].append(values)
+
+        self._batch_rows += 1
+
+    def write_batch(self):
+        """Insert the batch of rows in one transaction."""
+        if not self._batch_rows:
+            return
+
+        with self._conn:
+            for table in self._tables:
+                rows = self._batch[table["name"]]
+                if rows:
+                    self._conn.executemany(table["insert"], rows)
+                    table["rows"] += len(rows)
+
+        self.LOG.debug(f"Inserted batch of {self._batch_rows} rows")
+        self._rows_written += self._batch_rows
+        self._batch = {x["name"]: [] for x in self._tables}
+        self._batch_rows = 0
+
+    def create_indexes(self):
+        """Create the indexes from sqlite_indexes and for the child tables."""
+        main, *children = self._tables
+        names = {x["name"]: x["name"] for x in main["columns"]}
+        names.update({x["name_qual"]: x["name"] for x in main["columns"]})
+        indexes = listify(self.GETARGS.get("sqlite_indexes", SQLITE_INDEXES))
+
+        todo = []
+        for index in indexes:
+            if index not in names:
+                valid = list(names)
+                msg = f"Index column {index!r} not found, valid columns: {valid}"
+                self.echo(msg=msg, error=ApiError, level="error")
+            todo.append((main["name"], names[index]))
+
+        todo += [(x["name"], "internal_axon_id") for x in children]
+
+        with self._conn:
+            for table, column in todo:
+                index = get_name(f"ix_{table}_{column}")
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote(index)} "
+                    f"ON {quote(table)} ({quote(column)})"
+                )
+
+        self.echo(msg=f"Created {len(todo)} indexes")
+
+    def open_db(self):
+        """Open a connection to a new database in export_file."""
+        self.get_export_path()
+
+        if self._file_mode == "overwrote":
+            self._file_path.unlink()
+
+        fp = self._file_path
+        self._conn = sqlite3.connect(str(fp))
+        self.echo(msg=f"Exporting to database '{fp}' ({self._file_mode_ing})")
+        return self._conn
+
+    def close_db(self):
+        """Close the connection to the database."""
+        self._conn.close()
+        self.echo(msg=f"Finished exporting to '{self._file_path}'")
+
+    def get_table_name(self):
+        """Get the name of the main table from the type of asset."""
+        return get_name(self.APIOBJ.__class__.__name__.lower())
+
+    def get_tables(self):
+        """Get the columns and statements for the main table and child tables."""
+        use_titles = self.GETARGS.get("field_titles", False)
+        key = "column_title" if use_titles else "name"
+        explode = self.schema_to_explode.get("name_qual", "")
+        self._id_key = "internal_axon_id"
+
+        main = get_table(name=self._table, key=None)
+        tables = [main]
+
+        for name, schema in zip(self.final_columns, self.final_schemas):
+            if schema["name_qual"] == "internal_axon_id":
+                self._id_key = name
+
+            if schema["is_complex"] and schema["name_qual"] != explode:
+                child = get_table(name=get_name(f"{self._table}_{name}"), key=name)
+                child["columns"].append(
+                    get_column(name="internal_axon_id", schema={})
+                )
+                for sub_schema in self.get_sub_schemas(schema=schema):
+                    child["columns"].append(
+                        get_column(
+                            name=sub_schema[key],
+                            schema=sub_schema,
+                            key=sub_schema["name"],
+                        )
+                    )
+                tables.append(child)
+                continue
+
+            main["columns"].append(get_column(name=name, schema=schema))
+
+        for table in tables:
+            names = ", ".join(quote(x["name"]) for x in table["columns"])
+            types = ", ".join(
+                f"{quote(x['name'])} {x['affinity']}" for x in table["columns"]
+            )
+            marks = ", ".join("?" for x in table["columns"])
+            name = quote(table["name"])
+            table["create"] = f"CREATE TABLE IF NOT EXISTS {name} ({types})"
+            table["insert"] = f"INSERT INTO {name} ({names}) VALUES ({marks})"
+
+        return tables
+
+    @property
+    def args_map(self):
+        """Pass."""
+        args = super(Sqlite, self).args_map
+        return args + [
+            ["sqlite_table", "SQLite table:", None],
+            ["sqlite_batch_size", "SQLite rows per transaction:", SQLITE_BATCH_SIZE],
+            ["sqlite_indexes", "SQLite index columns:", SQLITE_INDEXES],
+        ]
+
+
+def get_table(name, key):
+    """Pass."""
+    return {"name": name, "key": key, "columns": [], "rows": 0}
+
+
+def get_column(name, schema, key=None):
+    """Get the name, affinity and row key of a column for a schema."""
+    type_norm = schema.get("type_norm", "string")
+    is_list = type_norm.startswith("list_") or bool(
+        schema.get("is_list") and not schema.get("is_complex")
+    )
+    affinity = "TEXT" if is_list else SQLITE_AFFINITIES.get(type_norm, "TEXT")
+    return {
+        "name": name,
+        "name_qual": schema.get("name_qual", name),
+        "key": key or name,
+        "affinity": affinity,
+        "is_list": is_list,
+    }
+
+
+def get_name(value):
+    """Replace characters that need quoting in a table or index name with _."""
+    return re.sub(r"\W+", "_", value).strip("_")
+
+
+def quote(value):
+    """Quote an identifier for SQLite."""
+    value = value.replace('"', '""')
+    return f'"{value}"'
+
+
+def to_sql(value, is_list=False):
+    """Convert a value into something SQLite can store.
+
+    Notes:
+        Values of list columns are stored as JSON arrays. For other columns,
+        a list with one value is stored as that value and a list with more than
+        one value (i.e. from more than one adapter) is stored as a JSON array.
+    """
+    if is_list:
+        return None if value is None else json.dumps(listify(value))
+
+    if isinstance(value, list):
+        if not value:
+            return None
+        if len(value) == 1:
+            value = value[0]
+
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+
+    return value
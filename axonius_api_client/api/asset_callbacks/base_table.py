@@ -3,16 +3,31 @@
 
 import tabulate
 
-from ...constants import TABLE_FORMAT, TABLE_MAX_ROWS
+from ...constants import (
+    TABLE_FORMAT,
+    TABLE_MAX_ROWS,
+    TABLE_STREAM_SIZE,
+    TABLE_STREAM_TRIM,
+    TABLE_STREAM_WIDTH,
+)
 from ...exceptions import ApiError
 from ...tools import listify
 from .base import Base
 
 
 class Table(Base):
-    """Pass."""
+    """Print assets as a table.
+
+    Notes:
+        If **table_stream** is True, rows are printed a page of
+        **table_stream_size** rows at a time instead of all at once in
+        :meth:`stop`. The width of each column is computed from the first page
+        (up to **table_stream_width** characters) and every page after that is
+        printed with the same widths, truncating any cells that are wider.
+    """
 
     CB_NAME = "table"
+    CHECKPOINTS = False
 
     def _init(self):
         """Pass."""
@@ -39,11 +54,20 @@ class Table(Base):
         """Create file descriptor."""
         super(Table, self).start(**kwargs)
         self._rows = []
+        self._widths = []
+        self._pages = 0
         self.open_fd()
 
     def stop(self, **kwargs):
         """Close file descriptor."""
         super(Table, self).stop(**kwargs)
+
+        if self.GETARGS.get("table_stream", False):
+            if self._rows or not self._pages:
+                self.write_page()
+            self.close_fd()
+            return
+
         tablefmt = self.GETARGS["table_format"]
         rows = getattr(self, "_rows", [])
 
@@ -60,11 +84,52 @@ class Table(Base):
         self.do_pre_row()
         self.check_stop()
 
+        return_row = [{"internal_axon_id": row.get("internal_axon_id", None)}]
         new_rows = self.do_row(row=row)
         # XXX textwrap key/values
         self._rows += listify(new_rows)
+
+        if self.GETARGS.get("table_stream", False):
+            page_size = self.GETARGS.get("table_stream_size", TABLE_STREAM_SIZE)
+            if len(self._rows) >= (page_size or TABLE_STREAM_SIZE):
+                self.write_page()
+            return return_row
+
         return new_rows
 
+    def write_page(self):
+        """Print the rows seen since the last page with fixed column widths."""
+        columns = self.final_columns
+
+        if not self._widths:
+            max_width = self.GETARGS.get("table_stream_width", TABLE_STREAM_WIDTH)
+            self._widths = get_widths(
+                columns=columns, rows=self._rows, max_width=max_width
+            )
+
+        headers = [
+            trim_cell(value=x, width=w).ljust(w) for x, w in zip(columns, self._widths)
+        ]
+        rows = [
+            [trim_cell(value=row.get(x), width=w) for x, w in zip(columns, self._widths)]
+            for row in self._rows
+        ]
+
+        table = tabulate.tabulate(
+            tabular_data=rows,
+            headers=headers,
+            tablefmt=self.GETARGS["table_format"],
+            showindex=False,
+            disable_numparse=True,
+        )
+
+        self._fd.write(table)
+        self._fd.write("\n")
+        self._fd.flush()
+        self._pages += 1
+        self.LOG.debug(f"Printed table page {self._pages} with {len(rows)} rows")
+        self._rows = []
+
     def check_stop(self):
         """Pass."""
         max_rows = self.GETARGS["table_max_rows"]
@@ -89,4 +154,49 @@ class Table(Base):
             ["table_format", "Use table format:", TABLE_FORMAT],
             ["table_max_rows", "Maximum table rows:", TABLE_MAX_ROWS],
             ["table_api_fields", "Include API fields:", False],
+            ["table_stream", "Print table in pages:", False],
+            ["table_stream_size", "Rows per table page:", TABLE_STREAM_SIZE],
+            ["table_stream_width", "Maximum column width:", TABLE_STREAM_WIDTH],
+        ]
+
+
+def get_widths(columns, rows, max_width=TABLE_STREAM_WIDTH):
+    """Get the width of each column from its header and the values in rows.
+
+    Args:
+        columns (:obj:`list` of :obj:`str`): column names
+        rows (:obj:`list` of :obj:`dict`): rows to measure
+        max_width (:obj:`int`, optional): default :data:`TABLE_STREAM_WIDTH` -
+            widest a column can be, 0 or None for no limit
+
+    Returns:
+        :obj:`list` of :obj:`int`: width of each column
+    """
+    widths = []
+    for column in columns:
+        lines = [column] + [
+            line for row in rows for line in cell_lines(value=row.get(column))
         ]
+        width = max(len(x) for x in lines)
+        widths.append(min(width, max_width) if max_width else width)
+    return widths
+
+
+def cell_lines(value):
+    """Get the lines of a cell as strings."""
+    if value is None:
+        return [""]
+    if isinstance(value, list):
+        value = "\n".join(str(x) for x in value)
+    return str(value).splitlines() or [""]
+
+
+def trim_cell(value, width, trim_str=TABLE_STREAM_TRIM):
+    """Truncate every line of a cell to width characters."""
+    lines = []
+    for line in cell_lines(value=value):
+        if len(line) > width:
+            keep = max(width - len(trim_str), 0)
+            line = (line[:keep] + trim_str)[:width]
+        lines.append(line)
+    return "\n".join(lines)
@@ -1,18 +1,65 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import asyncio
+import logging
 import math
+import os
 import time
 
-from ...constants import MAX_PAGE_SIZE, PAGE_SIZE
+import requests
+
+from ...constants import (
+    CHECKPOINT_PAGES,
+    CHECKPOINT_VERSION,
+    FIELDS_CACHE_DISK_TTL,
+    FIELDS_CACHE_PATH,
+    FIELDS_CACHE_TTL,
+    MAX_PAGE_SIZE,
+    PAGE_ADAPTIVE,
+    PAGE_PREFETCH,
+    PAGE_SIZE,
+    PAGE_SIZE_MIN,
+    PAGE_TARGET_SECONDS,
+    PAGE_TIMEOUT_RETRIES,
+    PAGE_WORKERS,
+    ROW_CHUNK_SIZE,
+    ROW_WORKERS,
+)
 from ...exceptions import ApiError, JsonError, NotFoundError
-from ...tools import dt_now, dt_parse, dt_sec_ago, json_dump, listify
+from ...logs import LazyFormat
+from ...metrics import timed_iter
+from ...tools import (
+    dt_now,
+    dt_parse,
+    dt_sec_ago,
+    get_path,
+    json_dump,
+    json_load,
+    listify,
+    path_read,
+)
 from ..adapters import Adapters
 from ..asset_callbacks import get_callbacks_cls
 from ..mixins import ModelMixins
+from ..paging import PagePrefetcher, PageSizer, fetch_concurrent
 from .fields import Fields
 from .labels import Labels
 from .saved_query import SavedQuery
 
+CHECKPOINT_STATE_KEYS = [
+    "page_number",
+    "page_cursor",
+    "page_size",
+    "rows_fetched_total",
+    "rows_processed_total",
+    "rows_to_fetch_total",
+    "rows_to_fetch_left",
+    "pages_to_fetch_total",
+    "pages_to_fetch_left",
+    "fetch_seconds_total",
+]
+""":obj:`list` of :obj:`str`: keys of the paging state saved in checkpoints"""
+
 
 class AssetMixin(ModelMixins):
     """API model for working with user and device assets."""
@@ -53,6 +100,18 @@ class AssetMixin(ModelMixins):
         history_date = self.validate_history_date(value=history_date)
         return self._count(query=query, history_date=history_date)
 
+    async def count_async(self, query=None, history_date=None):
+        """Get the count of assets with asyncio.
+
+        Args:
+            **kwargs: see :meth:`count`
+
+        Returns:
+            :obj:`int`: count of assets matching query
+        """
+        history_date = await self.validate_history_date_async(value=history_date)
+        return await self._count_async(query=query, history_date=history_date)
+
     def count_by_saved_query(self, name, history_date=None):
         """Get the count of assets that would be returned by a saved query.
 
@@ -91,6 +150,17 @@ class AssetMixin(ModelMixins):
 
         return list(gen)
 
+    async def get_async(self, **kwargs):
+        """Get objects for a given query using paging with asyncio.
+
+        Args:
+            **kwargs: passed to :meth:`get_generator_async`
+
+        Returns:
+            :obj:`list` of :obj:`dict`: rows
+        """
+        return [x async for x in self.get_generator_async(**kwargs)]
+
     def get_generator(
         self,
         query=None,
@@ -111,6 +181,19 @@ class AssetMixin(ModelMixins):
         sort_field=None,
         sort_descending=False,
         history_date=None,
+        prefetch_pages=PAGE_PREFETCH,
+        page_workers=PAGE_WORKERS,
+        page_ordered=True,
+        page_stream=False,
+        page_adaptive=PAGE_ADAPTIVE,
+        page_target_seconds=PAGE_TARGET_SECONDS,
+        page_size_min=PAGE_SIZE_MIN,
+        page_target_bytes=None,
+        row_workers=ROW_WORKERS,
+        row_chunk_size=ROW_CHUNK_SIZE,
+        checkpoint_file=None,
+        checkpoint_pages=CHECKPOINT_PAGES,
+        resume=False,
         **kwargs,
     ):
         """Get an iterator of objects for a given query using paging.
@@ -142,13 +225,253 @@ class AssetMixin(ModelMixins):
                 default default :data:`MAX_PAGE_SIZE` -
                 return N assets per page
             page_start (:obj:`int`, optional): default ``0`` - start at page N
+            prefetch_pages (:obj:`int`, optional): default :data:`PAGE_PREFETCH` -
+                fetch up to N pages in a background thread while rows from the
+                current page are being processed, ``0`` fetches pages serially
+            page_workers (:obj:`int`, optional): default :data:`PAGE_WORKERS` -
+                if greater than 1, fetch the pages after the first page
+                concurrently using N threads (requires **use_cursor** = ``False``)
+            page_ordered (:obj:`bool`, optional): default ``True`` -
+                process pages fetched concurrently in the order of the pages,
+                if ``False`` process pages in the order they are returned
+            page_stream (:obj:`bool`, optional): default ``False`` -
+                decode the rows of each page as they are received instead of
+                reading and decoding the whole page at once, keeping only a few
+                rows in memory at a time (can not be used with **prefetch_pages**
+                or **page_workers**)
+            page_adaptive (:obj:`bool`, optional): default :data:`PAGE_ADAPTIVE` -
+                start with **page_size** and change the size of each page after
+                that so it takes about **page_target_seconds** to fetch, and
+                retry a page that times out with a smaller page size (can not be
+                used with **page_workers**)
+            page_target_seconds (:obj:`float`, optional): default
+                :data:`PAGE_TARGET_SECONDS` - seconds each page should take to
+                fetch with **page_adaptive**
+            page_size_min (:obj:`int`, optional): default :data:`PAGE_SIZE_MIN` -
+                smallest page size to use with **page_adaptive**
+            page_target_bytes (:obj:`int`, optional): default ``None`` - if
+                supplied, also keep the response of each page under this many
+                bytes with **page_adaptive**
+            row_workers (:obj:`int`, optional): default :data:`ROW_WORKERS` -
+                if greater than 1, transform the rows of each page in the
+                callbacks (flatten, explode, join, etc) using N processes
+            row_chunk_size (:obj:`int`, optional): default :data:`ROW_CHUNK_SIZE` -
+                number of rows to send to a process at a time with **row_workers**
+            checkpoint_file (:obj:`str`, optional): default ``None`` - save the
+                paging state, arguments and export file offset to this file
+                every **checkpoint_pages** pages so the fetch can be resumed
+                (can not be used with **prefetch_pages** or **page_workers**)
+            checkpoint_pages (:obj:`int`, optional): default
+                :data:`CHECKPOINT_PAGES` - pages to process in between checkpoints
+            resume (:obj:`bool`, optional): default ``False`` - if
+                **checkpoint_file** exists, continue fetching after the last page
+                saved in it and truncate the export file back to its offset
+
+        Raises:
+            :exc:`ApiError`: if **page_workers** is greater than 1 and
+                **use_cursor** is ``True``
+            :exc:`ApiError`: if **page_stream** is ``True`` and **prefetch_pages**
+                or **page_workers** are used
+            :exc:`ApiError`: if **page_adaptive** is ``True`` and **page_workers**
+                is greater than 1
 
         Yields:
             :obj:`dict`: asset matching **query**
         """
+        fields_map = fields_map or self.fields.get()
+        history_date = self.validate_history_date(value=history_date)
+
+        callbacks, store, state = self._start_generator(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            fields_map=fields_map,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            row_start=row_start,
+            page_size=page_size,
+            page_start=page_start,
+            page_sleep=page_sleep,
+            use_cursor=use_cursor,
+            export=export,
+            include_details=include_details,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+            history_date=history_date,
+            prefetch_pages=prefetch_pages,
+            page_workers=page_workers,
+            page_ordered=page_ordered,
+            page_stream=page_stream,
+            page_adaptive=page_adaptive,
+            page_target_seconds=page_target_seconds,
+            page_size_min=page_size_min,
+            page_target_bytes=page_target_bytes,
+            row_workers=row_workers,
+            row_chunk_size=row_chunk_size,
+            checkpoint_file=checkpoint_file,
+            checkpoint_pages=checkpoint_pages,
+            resume=resume,
+            **kwargs,
+        )
+
+        pages = self._get_pages(state=state, store=store)
+
+        if state["prefetch_pages"]:
+            pages = PagePrefetcher(pages=pages, size=state["prefetch_pages"])
+
+        try:
+            for page in pages:
+                yield from self._process_page(
+                    page=page, state=state, callbacks=callbacks
+                )
+
+                if state["stop_fetch"]:
+                    break
+
+                self._save_checkpoint(state=state, store=store, callbacks=callbacks)
+        finally:
+            pages.close()
+
+        state["stop_fetch"] = True
+
+        self.LOG.info("FINISHED FETCH store=%s", store)
+        self.LOG.debug("FINISHED FETCH state=%s", LazyFormat(json_dump, state))
+
+        callbacks.stop()
+        self._clear_checkpoint(state=state)
+
+    async def get_generator_async(self, fields_map=None, history_date=None, **kwargs):
+        """Get an async iterator of objects for a given query using paging.
+
+        Notes:
+            Pages are fetched serially, so prefetch_pages, page_workers and
+            page_stream are not supported. Callbacks that send requests of their
+            own (i.e. for tagging or adapter reports) still send them synchronously.
+
+        Args:
+            **kwargs: see :meth:`get_generator`
+
+        Yields:
+            :obj:`dict`: asset matching **query**
+        """
+        fields_map = fields_map or await self.fields.get_async()
+        history_date = await self.validate_history_date_async(value=history_date)
+
+        callbacks, store, state = self._start_generator(
+            fields_map=fields_map, history_date=history_date, **kwargs
+        )
+
+        if state["prefetch_pages"] or state["page_workers"] > 1 or state["page_stream"]:
+            raise ApiError(
+                "prefetch_pages, page_workers and page_stream are not supported in async"
+            )
+
+        if state["checkpoint_file"]:
+            raise ApiError("checkpoint_file is not supported in async")
+
+        while not state["stop_fetch"]:
+            if state["use_cursor"]:
+                page = await self._get_page_cursor_async(state=state, store=store)
+            else:
+                page = await self._get_page_normal_async(state=state, store=store)
+
+            rows_fetched = state["rows_fetched_this_page"]
+
+            for row in self._process_page(page=page, state=state, callbacks=callbacks):
+                yield row
+
+            if state["stop_fetch"] or not rows_fetched:
+                break
+
+            if state["max_pages"] and state["page_number"] >= state["max_pages"]:
+                stop_msg = "'page_number' greater than 'max_pages'"
+                state["stop_msg"] = stop_msg
+                self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+                break
+
+            if state["use_cursor"]:
+                state["page_number"] += 1
+
+            await asyncio.sleep(state["page_sleep"])
+
+        state["stop_fetch"] = True
+
+        self.LOG.info("FINISHED FETCH store=%s", store)
+        self.LOG.debug("FINISHED FETCH state=%s", LazyFormat(json_dump, state))
+
+        callbacks.stop()
+
+    def _start_generator(
+        self,
+        fields_map,
+        query=None,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        max_rows=None,
+        max_pages=None,
+        row_start=0,
+        page_size=MAX_PAGE_SIZE,
+        page_start=0,
+        page_sleep=0,
+        use_cursor=True,
+        export=None,
+        include_details=False,
+        sort_field=None,
+        sort_descending=False,
+        history_date=None,
+        prefetch_pages=PAGE_PREFETCH,
+        page_workers=PAGE_WORKERS,
+        page_ordered=True,
+        page_stream=False,
+        page_adaptive=PAGE_ADAPTIVE,
+        page_target_seconds=PAGE_TARGET_SECONDS,
+        page_size_min=PAGE_SIZE_MIN,
+        page_target_bytes=None,
+        row_workers=ROW_WORKERS,
+        row_chunk_size=ROW_CHUNK_SIZE,
+        checkpoint_file=None,
+        checkpoint_pages=CHECKPOINT_PAGES,
+        resume=False,
+        **kwargs,
+    ):
+        """Validate the arguments for :meth:`get_generator` and start the callbacks.
+
+        Args:
+            fields_map (:obj:`dict`): output from :meth:`Fields.get`
+            history_date (:obj:`str`): output from :meth:`validate_history_date`
+            **kwargs: see :meth:`get_generator`
+
+        Returns:
+            :obj:`tuple` of (:obj:`.asset_callbacks.Base`, :obj:`dict`, :obj:`dict`):
+                started callbacks object, store, state
+        """
         page_size = self._get_page_size(page_size=page_size, max_rows=max_rows)
+        page_workers = page_workers or 1
 
-        fields_map = fields_map or self.fields.get()
+        if page_workers > 1 and use_cursor:
+            raise ApiError(
+                f"page_workers={page_workers} can not be used with use_cursor=True"
+            )
+
+        if page_stream and (prefetch_pages or page_workers > 1):
+            raise ApiError(
+                "page_stream=True can not be used with prefetch_pages or page_workers"
+            )
+
+        if page_adaptive and page_workers > 1:
+            raise ApiError("page_adaptive=True can not be used with page_workers")
+
+        if checkpoint_file and (prefetch_pages or page_workers > 1):
+            raise ApiError(
+                "checkpoint_file can not be used with prefetch_pages or page_workers"
+            )
+
+        if resume and not checkpoint_file:
+            raise ApiError("resume=True requires checkpoint_file")
 
         fields = self.fields.validate(
             fields=fields,
@@ -163,8 +486,6 @@ class AssetMixin(ModelMixins):
                 value=sort_field, fields_map=fields_map
             )
 
-        history_date = self.validate_history_date(value=history_date)
-
         store = {
             "query": query,
             "fields": fields,
@@ -181,6 +502,18 @@ class AssetMixin(ModelMixins):
             "page_cursor": None,
             "page_sleep": page_sleep,
             "page_size": page_size,
+            "prefetch_pages": prefetch_pages or 0,
+            "page_workers": page_workers,
+            "page_ordered": page_ordered,
+            "page_stream": page_stream,
+            "page_adaptive": page_adaptive,
+            "page_target_seconds": page_target_seconds or PAGE_TARGET_SECONDS,
+            "page_size_min": page_size_min or PAGE_SIZE_MIN,
+            "page_target_bytes": page_target_bytes,
+            "row_workers": row_workers or 1,
+            "row_chunk_size": row_chunk_size or ROW_CHUNK_SIZE,
+            "checkpoint_file": str(checkpoint_file) if checkpoint_file else None,
+            "checkpoint_pages": checkpoint_pages or CHECKPOINT_PAGES,
             "page_number": page_start or 1,
             "page_start": page_start,
             "pages_to_fetch_left": None,
@@ -208,85 +541,508 @@ class AssetMixin(ModelMixins):
             store=store,
         )
 
+        if checkpoint_file:
+            callbacks.check_checkpoint()
+
+            if resume:
+                self._load_checkpoint(state=state, store=store, callbacks=callbacks)
+
         callbacks.start()
 
-        self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
-        self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
+        self.LOG.info("STARTING FETCH store=%s", LazyFormat(json_dump, store))
+        self.LOG.debug("STARTING FETCH state=%s", LazyFormat(json_dump, state))
 
-        while not state["stop_fetch"]:
-            if state["use_cursor"]:
-                page = self._get_page_cursor(state=state, store=store)
-            else:
-                page = self._get_page_normal(state=state, store=store)
+        return callbacks, store, state
 
-            rows = page.pop("assets")
+    def _load_checkpoint(self, state, store, callbacks):
+        """Load the paging state and callbacks checkpoint from checkpoint_file.
 
-            self.LOG.debug(f"FETCHED PAGE: {json_dump(page)}")
-            self.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+        Notes:
+            If checkpoint_file does not exist, the fetch starts from the beginning.
 
-            if not rows:
-                stop_msg = "no more rows returned"
-                state["stop_fetch"] = True
-                state["stop_msg"] = stop_msg
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
-                break
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            store (:obj:`dict`): request arguments from :meth:`get_generator`
+            callbacks (:obj:`.asset_callbacks.Base`): callbacks object
 
-            for row in rows:
-                row_items = callbacks.process_row(row=row)
+        Raises:
+            :exc:`ApiError`: if the checkpoint was saved by a different version,
+                export format or request arguments
+        """
+        path = get_path(obj=state["checkpoint_file"])
 
-                for row_item in listify(obj=row_items):
-                    yield row_item
+        if not path.is_file():
+            self.LOG.info("No checkpoint found in %r, starting from scratch", str(path))
+            return
 
-                if state["stop_fetch"]:
-                    break
+        _, checkpoint = path_read(obj=path, is_json=True)
 
-                if (
-                    state["max_rows"]
-                    and state["rows_processed_total"] >= state["max_rows"]
-                ):
-                    stop_msg = "'rows_processed_total' greater than 'max_rows'"
-                    state["stop_msg"] = stop_msg
-                    state["stop_fetch"] = True
-                    break
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ApiError(
+                f"Checkpoint {str(path)!r} has version {checkpoint.get('version')!r}"
+                f", expected {CHECKPOINT_VERSION}"
+            )
+
+        if checkpoint["callbacks"]["export"] != callbacks.CB_NAME:
+            raise ApiError(
+                f"Checkpoint {str(path)!r} was saved by export "
+                f"{checkpoint['callbacks']['export']!r}, not {callbacks.CB_NAME!r}"
+            )
+
+        if json_load(json_dump(store, sort_keys=True)) != checkpoint["store"]:
+            raise ApiError(
+                f"Checkpoint {str(path)!r} was saved for different arguments:"
+                f"\n{json_dump(checkpoint['store'])}"
+            )
+
+        state.update({k: checkpoint["state"][k] for k in CHECKPOINT_STATE_KEYS})
+
+        if state["use_cursor"]:
+            state["page_number"] += 1
+
+        callbacks.RESUME = checkpoint["callbacks"]
+        self.LOG.info(
+            "Resuming from checkpoint %r saved %s after %s rows",
+            str(path),
+            checkpoint["saved"],
+            state["rows_processed_total"],
+        )
+
+    def _save_checkpoint(self, state, store, callbacks):
+        """Save the paging state and callbacks checkpoint to checkpoint_file.
+
+        Notes:
+            The checkpoint is written to a temporary file that then replaces
+            checkpoint_file, so checkpoint_file always has a complete checkpoint.
+
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            store (:obj:`dict`): request arguments from :meth:`get_generator`
+            callbacks (:obj:`.asset_callbacks.Base`): callbacks object
+        """
+        if not state["checkpoint_file"]:
+            return
+
+        if state["page_number"] % state["checkpoint_pages"]:
+            return
+
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "saved": dt_now().isoformat(),
+            "state": {k: state[k] for k in CHECKPOINT_STATE_KEYS},
+            "store": store,
+            "callbacks": callbacks.get_checkpoint(),
+        }
+
+        path = get_path(obj=state["checkpoint_file"])
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        path_tmp = path.with_name(f"{path.name}.tmp")
+        path_tmp.write_text(json_dump(checkpoint, sort_keys=True))
+        os.replace(path_tmp, path)
+
+        self.LOG.debug(
+            "Saved checkpoint to %r after page %s", str(path), state["page_number"]
+        )
+
+    def _clear_checkpoint(self, state):
+        """Remove checkpoint_file once a fetch has finished."""
+        if not state["checkpoint_file"]:
+            return
+
+        path = get_path(obj=state["checkpoint_file"])
+        if path.is_file():
+            path.unlink()
+            self.LOG.debug("Removed checkpoint %r", str(path))
+
+    def _process_page(self, page, state, callbacks):
+        """Process the rows of a fetched page through the callbacks.
+
+        Args:
+            page (:obj:`dict`): page of assets
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            callbacks (:obj:`.asset_callbacks.Base`): callbacks object
+
+        Yields:
+            :obj:`dict`: asset returned from the callbacks
+        """
+        rows = page.pop("assets")
+        rows_processed = 0
+        timings = {}
+
+        if self.LOG.isEnabledFor(logging.DEBUG):
+            self.LOG.debug("FETCHED PAGE: %s", LazyFormat(json_dump, page))
+            self.LOG.debug("CURRENT PAGING STATE: %s", LazyFormat(json_dump, state))
+
+        row_items_iter = timed_iter(
+            iterable=callbacks.process_rows(rows=rows),
+            timings=timings,
+            key="callbacks_seconds",
+        )
+
+        for row_items in row_items_iter:
+            rows_processed += 1
+
+            for row_item in listify(obj=row_items):
+                yield row_item
 
             if state["stop_fetch"]:
-                stop_msg = state["stop_msg"]
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
                 break
 
-            if state["max_pages"] and state["page_number"] >= state["max_pages"]:
-                stop_msg = "'page_number' greater than 'max_pages'"
+            if state["max_rows"] and state["rows_processed_total"] >= state["max_rows"]:
+                stop_msg = "'rows_processed_total' greater than 'max_rows'"
                 state["stop_msg"] = stop_msg
                 state["stop_fetch"] = True
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
                 break
 
+        if self.http.METRICS.enabled:
+            self._emit_page(
+                values=self._get_page_values(
+                    rows=rows,
+                    rows_processed=rows_processed,
+                    state=state,
+                    timings=timings,
+                )
+            )
+
+        if not rows_processed:
+            stop_msg = "no more rows returned"
+            state["stop_msg"] = stop_msg
+            state["stop_fetch"] = True
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+        elif state["stop_fetch"]:
+            stop_msg = state["stop_msg"]
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+
+    def _get_page_values(self, rows, rows_processed, state, timings):
+        """Get the values of the page event for a processed page.
+
+        Notes:
+            With page_stream, rows is an iterator, so the rows that were processed
+            are counted instead. fetch_seconds is left out with prefetch_pages, since
+            the paging state may already be for a later page, and with page_stream,
+            since the rows are fetched while they are processed.
+
+        Args:
+            rows (:obj:`list` or :obj:`typing.Iterator`): rows of the page
+            rows_processed (:obj:`int`): number of rows processed by the callbacks
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            timings (:obj:`dict`): callbacks_seconds of the page
+
+        Returns:
+            :obj:`dict`: values to emit with :meth:`_emit_page`
+        """
+        values = dict(timings)
+        values["rows"] = len(rows) if isinstance(rows, list) else rows_processed
+
+        if not (state["prefetch_pages"] or state["page_stream"]):
+            values["fetch_seconds"] = state["fetch_seconds_this_page"]
+
+        return values
+
+    def _get_pages(self, state, store):
+        """Fetch pages of assets until no rows are returned or max_pages is hit.
+
+        Notes:
+            This may run in a background thread if prefetching is enabled, so it
+            only stops fetching on its own conditions and leaves
+            state["stop_fetch"] to the consumer of the pages.
+
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            store (:obj:`dict`): request arguments from :meth:`get_generator`
+
+        Yields:
+            :obj:`dict`: page of assets
+        """
+        sizer = self._get_page_sizer(state=state)
+        page_number = None
+
+        while not state["stop_fetch"]:
+            if sizer:
+                page = self._get_page_adaptive(state=state, store=store, sizer=sizer)
+                size = self._get_page_bytes(state=state)
+            elif state["use_cursor"]:
+                page = self._get_page_cursor(state=state, store=store)
+            else:
+                page = self._get_page_normal(state=state, store=store)
+
+            yield page
+
+            if not state["rows_fetched_this_page"]:
+                return
+
+            if sizer:
+                self._set_page_adaptive_state(
+                    state=state, sizer=sizer, page_number=page_number, size=size
+                )
+                page_number = state["page_number"]
+
+            if state["max_pages"] and state["page_number"] >= state["max_pages"]:
+                stop_msg = "'page_number' greater than 'max_pages'"
+                state["stop_msg"] = stop_msg
+                self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+                return
+
+            if state["page_workers"] > 1 and not state["use_cursor"]:
+                yield from self._get_pages_concurrent(state=state, store=store)
+                return
+
             if state["use_cursor"]:
                 state["page_number"] += 1
 
             time.sleep(state["page_sleep"])
 
-        self.LOG.info(f"FINISHED FETCH store={store}")
-        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+    def _get_page_sizer(self, state):
+        """Get the page sizer to use if page_adaptive is enabled.
 
-        callbacks.stop()
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+
+        Returns:
+            :obj:`.paging.PageSizer`: or ``None`` if page_adaptive is not enabled
+        """
+        if not state["page_adaptive"]:
+            return None
+
+        max_size = self._get_page_size(page_size=MAX_PAGE_SIZE, max_rows=None)
+        sizer = PageSizer(
+            page_size=state["page_size"],
+            target_seconds=state["page_target_seconds"],
+            min_size=state["page_size_min"],
+            max_size=max_size,
+            target_bytes=state["page_target_bytes"],
+        )
+        self.LOG.debug("Adapting page size with %s", sizer)
+        return sizer
+
+    def _get_page_adaptive(self, state, store, sizer):
+        """Fetch a page, retrying with a smaller page size if the page times out.
+
+        Notes:
+            With page_stream, the response is read while the rows are processed,
+            so only timeouts waiting for the response to start are retried.
+
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            store (:obj:`dict`): request arguments from :meth:`get_generator`
+            sizer (:obj:`.paging.PageSizer`): output of :meth:`_get_page_sizer`
+
+        Raises:
+            :exc:`requests.exceptions.Timeout`: if the page still times out after
+                :data:`PAGE_TIMEOUT_RETRIES` retries or at page_size_min
+
+        Returns:
+            :obj:`dict`: page of assets
+        """
+        retries = 0
+
+        while True:
+            try:
+                if state["use_cursor"]:
+                    return self._get_page_cursor(state=state, store=store)
+                return self._get_page_normal(state=state, store=store)
+            except requests.exceptions.Timeout as exc:
+                page_size = sizer.backoff()
+
+                if page_size is None or retries >= PAGE_TIMEOUT_RETRIES:
+                    raise
+
+                retries += 1
+                self.LOG.warning(
+                    "Page timed out, retry %s/%s with page size %s: %s",
+                    retries,
+                    PAGE_TIMEOUT_RETRIES,
+                    page_size,
+                    exc,
+                )
+                state["page_size"] = page_size
+
+    def _get_page_bytes(self, state):
+        """Get the size of the last response if page_target_bytes is supplied."""
+        if not state["page_target_bytes"]:
+            return None
+
+        response = self.http.LAST_RESPONSE if self.http.SAVE_LAST else None
+        try:
+            return int(getattr(response, "body_size", None))
+        except (TypeError, ValueError):
+            return None
+
+    def _set_page_adaptive_state(self, state, sizer, page_number, size=None):
+        """Pick the next page size and update the paging state with it.
+
+        Notes:
+            The page number and pages left returned for skip/limit paging are
+            based on the size of the page that was just fetched, so they are
+            counted from the rows left instead. The page size is never more than
+            the rows left to fetch under max_rows.
+
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            sizer (:obj:`.paging.PageSizer`): output of :meth:`_get_page_sizer`
+            page_number (:obj:`int`): number of the previous page, or ``None``
+                if this is the first page
+            size (:obj:`int`, optional): default ``None`` - bytes in the response
+        """
+        if not state["use_cursor"] and page_number is not None:
+            state["page_number"] = page_number + 1
+
+        page_size = sizer.update(
+            seconds=state["fetch_seconds_this_page"],
+            rows=state["rows_fetched_this_page"],
+            size=size,
+        )
+
+        if state["max_rows"]:
+            rows_left = state["max_rows"] - state["rows_fetched_total"]
+            page_size = max(1, min(page_size, rows_left))
+
+        state["page_size"] = page_size
+
+        if state["rows_to_fetch_left"] is not None:
+            state["pages_to_fetch_left"] = math.ceil(
+                max(state["rows_to_fetch_left"], 0) / state["page_size"]
+            )
+            state["pages_to_fetch_total"] = (
+                state["page_number"] + state["pages_to_fetch_left"]
+            )
+
+    def _get_pages_concurrent(self, state, store):
+        """Fetch the pages after the first page concurrently using skip/limit.
+
+        Notes:
+            The first page must already be fetched by :meth:`_get_page_normal` so
+            that the total number of assets is known. Pages that return no rows
+            (i.e. assets removed since the first page) are skipped. page_sleep is
+            not used between concurrent fetches.
+
+        Args:
+            state (:obj:`dict`): paging state from :meth:`get_generator`
+            store (:obj:`dict`): request arguments from :meth:`get_generator`
+
+        Yields:
+            :obj:`dict`: page of assets
+        """
+        page_size = state["page_size"]
+        row_first = state["rows_fetched_total"] - state["rows_fetched_this_page"]
+        row_stop = state["rows_to_fetch_total"]
+
+        if state["max_rows"]:
+            row_stop = min(row_stop, row_first + state["max_rows"])
+
+        row_starts = range(state["rows_fetched_total"], row_stop, page_size)
+
+        if state["max_pages"]:
+            row_starts = [
+                x for x in row_starts if (x // page_size) + 1 <= state["max_pages"]
+            ]
+
+        def fetch(row_start):
+            page_start_dt = dt_now()
+            page = self._fetch_page_normal(
+                state=state, store=store, row_start=row_start
+            )
+            return page, dt_sec_ago(obj=page_start_dt, exact=True)
+
+        self.LOG.debug(
+            "Fetching %s pages with %s workers", len(row_starts), state["page_workers"]
+        )
+
+        results = fetch_concurrent(
+            fetch=fetch,
+            args=row_starts,
+            workers=state["page_workers"],
+            ordered=state["page_ordered"],
+        )
+
+        try:
+            for page, seconds in results:
+                if not page["assets"]:
+                    continue
+
+                self._set_page_normal_state(state=state, page=page, seconds=seconds)
+                yield page
+
+            stop_msg = "all pages fetched concurrently"
+            state["stop_msg"] = stop_msg
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+        finally:
+            results.close()
 
     def _get_page_cursor(self, state, store):
         page_start_dt = dt_now()
 
-        page = self._get_cursor(
-            query=store["query"],
-            fields=store["fields"],
-            row_start=state["rows_fetched_total"],
-            page_size=state["page_size"],
-            cursor=state["page_cursor"],
-            include_details=store["include_details"],
-            sort_field=store["sort_field"],
-            sort_descending=store["sort_descending"],
-            history_date=store["history_date"],
+        if state["page_stream"]:
+            args = self._get_page_cursor_args(state=state, store=store)
+            cursor = args.pop("cursor")
+            params = self._get_params(**args)
+            params["cursor"] = cursor
+            return self._get_page_stream(
+                path=self.router.cached,
+                params=params,
+                page_start_dt=page_start_dt,
+                state=state,
+                set_state=self._set_page_cursor_state,
+            )
+
+        page = self._get_cursor(**self._get_page_cursor_args(state=state, store=store))
+        seconds = dt_sec_ago(obj=page_start_dt, exact=True)
+        self._set_page_cursor_state(state=state, page=page, seconds=seconds)
+        return page
+
+    async def _get_page_cursor_async(self, state, store):
+        page_start_dt = dt_now()
+        page = await self._get_cursor_async(
+            **self._get_page_cursor_args(state=state, store=store)
+        )
+        seconds = dt_sec_ago(obj=page_start_dt, exact=True)
+        self._set_page_cursor_state(state=state, page=page, seconds=seconds)
+        return page
+
+    def _get_page_stream(self, path, params, page_start_dt, state, set_state):
+        """Get a page of assets with rows that are decoded as they are iterated.
+
+        Notes:
+            The paging state is updated by **set_state** once all of the rows of
+            the page have been iterated, since the page metadata may not be
+            received until after the rows.
+
+        Returns:
+            :obj:`dict`: page with "assets" as an iterator of rows
+        """
+        page = {}
+
+        def callback(data, count):
+            page.update(data)
+            seconds = dt_sec_ago(obj=page_start_dt, exact=True)
+            set_state(state=state, page=page, seconds=seconds, rows=count)
+
+        page["assets"] = self.request_stream(
+            method="post",
+            path=path,
+            json=params,
+            key="assets",
+            callback=callback,
+            idempotent=True,
         )
+        return page
+
+    def _get_page_cursor_args(self, state, store):
+        return {
+            "query": store["query"],
+            "fields": store["fields"],
+            "row_start": state["rows_fetched_total"],
+            "page_size": state["page_size"],
+            "cursor": state["page_cursor"],
+            "include_details": store["include_details"],
+            "sort_field": store["sort_field"],
+            "sort_descending": store["sort_descending"],
+            "history_date": store["history_date"],
+        }
 
-        state["fetch_seconds_this_page"] = dt_sec_ago(obj=page_start_dt, exact=True)
+    def _set_page_cursor_state(self, state, page, seconds, rows=None):
+        state["fetch_seconds_this_page"] = seconds
         state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
 
         # only first page has totalResources with integer when cursor paging!!
@@ -295,7 +1051,9 @@ class AssetMixin(ModelMixins):
         if rows_to_fetch_total is not None:
             state["rows_to_fetch_total"] = rows_to_fetch_total
 
-        state["rows_fetched_this_page"] = len(page["assets"])
+        state["rows_fetched_this_page"] = (
+            len(page["assets"]) if rows is None else rows
+        )
         state["rows_fetched_total"] += state["rows_fetched_this_page"]
         state["rows_to_fetch_left"] = (
             state["rows_to_fetch_total"] - state["rows_fetched_total"]
@@ -308,27 +1066,68 @@ class AssetMixin(ModelMixins):
         )
 
         state["page_cursor"] = page.get("cursor")
-        return page
 
     def _get_page_normal(self, state, store):
         page_start_dt = dt_now()
 
-        page = self._get(
-            query=store["query"],
-            fields=store["fields"],
-            row_start=state["rows_fetched_total"],
-            page_size=state["page_size"],
-            include_details=store["include_details"],
-            sort_field=store["sort_field"],
-            sort_descending=store["sort_descending"],
-            history_date=store["history_date"],
+        if state["page_stream"]:
+            args = self._get_page_normal_args(
+                state=state, store=store, row_start=state["rows_fetched_total"]
+            )
+            return self._get_page_stream(
+                path=self.router.root,
+                params=self._get_params(**args),
+                page_start_dt=page_start_dt,
+                state=state,
+                set_state=self._set_page_normal_state,
+            )
+
+        page = self._fetch_page_normal(
+            state=state, store=store, row_start=state["rows_fetched_total"]
+        )
+
+        seconds = dt_sec_ago(obj=page_start_dt, exact=True)
+        self._set_page_normal_state(state=state, page=page, seconds=seconds)
+        return page
+
+    async def _get_page_normal_async(self, state, store):
+        page_start_dt = dt_now()
+
+        page = await self._get_async(
+            **self._get_page_normal_args(
+                state=state, store=store, row_start=state["rows_fetched_total"]
+            )
+        )
+
+        seconds = dt_sec_ago(obj=page_start_dt, exact=True)
+        self._set_page_normal_state(state=state, page=page, seconds=seconds)
+        return page
+
+    def _fetch_page_normal(self, state, store, row_start):
+        return self._get(
+            **self._get_page_normal_args(state=state, store=store, row_start=row_start)
         )
 
-        state["fetch_seconds_this_page"] = dt_sec_ago(obj=page_start_dt, exact=True)
+    def _get_page_normal_args(self, state, store, row_start):
+        return {
+            "query": store["query"],
+            "fields": store["fields"],
+            "row_start": row_start,
+            "page_size": state["page_size"],
+            "include_details": store["include_details"],
+            "sort_field": store["sort_field"],
+            "sort_descending": store["sort_descending"],
+            "history_date": store["history_date"],
+        }
+
+    def _set_page_normal_state(self, state, page, seconds, rows=None):
+        state["fetch_seconds_this_page"] = seconds
         state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
 
         state["rows_to_fetch_total"] = page["page"]["totalResources"]
-        state["rows_fetched_this_page"] = len(page["assets"])
+        state["rows_fetched_this_page"] = (
+            len(page["assets"]) if rows is None else rows
+        )
         state["rows_fetched_total"] += state["rows_fetched_this_page"]
         state["rows_to_fetch_left"] = (
             state["rows_to_fetch_total"] - state["rows_fetched_total"]
@@ -338,7 +1137,6 @@ class AssetMixin(ModelMixins):
         state["pages_to_fetch_left"] = (
             state["pages_to_fetch_total"] - state["page_number"]
         )
-        return page
 
     def get_by_id(self, id):
         """Get the full metadata of all adapters for a single asset.
@@ -456,34 +1254,94 @@ class AssetMixin(ModelMixins):
         if not field_manual:
             fields_map = fields_map or self.fields.get()
 
+        kwargs["query"] = self._build_query_by_value(
+            value=value,
+            field=field,
+            not_flag=not_flag,
+            pre=pre,
+            post=post,
+            field_manual=field_manual,
+            fields_map=fields_map,
+        )
+
+        return self.get(fields_map=fields_map, **kwargs)
+
+    async def get_by_value_async(
+        self,
+        value,
+        field,
+        not_flag=False,
+        pre="",
+        post="",
+        field_manual=False,
+        fields_map=False,
+        **kwargs,
+    ):
+        """Build query to get an asset by field value with asyncio."""
+        if not field_manual:
+            fields_map = fields_map or await self.fields.get_async()
+
+        kwargs["query"] = self._build_query_by_value(
+            value=value,
+            field=field,
+            not_flag=not_flag,
+            pre=pre,
+            post=post,
+            field_manual=field_manual,
+            fields_map=fields_map,
+        )
+
+        return await self.get_async(fields_map=fields_map, **kwargs)
+
+    def _build_query_by_value(
+        self, value, field, not_flag, pre, post, field_manual, fields_map
+    ):
+        """Build query to get an asset by field value."""
         field = self.fields.get_field_name(
             value=field, fields_map=fields_map, field_manual=field_manual
         )
 
         inner = f'{field} == "{value}"'
 
-        kwargs["query"] = self._build_query(
+        return self._build_query(
             inner=inner, pre=pre, post=post, not_flag=not_flag,
         )
 
-        return self.get(fields_map=fields_map, **kwargs)
-
     def history_dates(self):
         """Get all known historical dates for this asset type."""
         return self._history_dates()
 
+    async def history_dates_async(self):
+        """Get all known historical dates for this asset type with asyncio."""
+        return await self._history_dates_async()
+
     def validate_history_date(self, value):
         """Validate that a given date is known historical date."""
         if not value:
             return None
+        dt_search = self._parse_history_date(value=value)
+        known_dates = self.history_dates()
+        return self._match_history_date(dt_search=dt_search, known_dates=known_dates)
+
+    async def validate_history_date_async(self, value):
+        """Validate that a given date is known historical date with asyncio."""
+        if not value:
+            return None
+        dt_search = self._parse_history_date(value=value)
+        known_dates = await self.history_dates_async()
+        return self._match_history_date(dt_search=dt_search, known_dates=known_dates)
+
+    def _parse_history_date(self, value):
+        """Parse a date into the format used by :meth:`history_dates`."""
         valid_fmts = "YYYY-MM-DD or YYYYMMDD"
         try:
             dt = dt_parse(obj=value)
-            dt_search = dt.strftime("%Y-%m-%d")
+            return dt.strftime("%Y-%m-%d")
         except Exception:
             raise ApiError(f"Could not parse date {value!r}, try {valid_fmts}")
 
-        known_dates = self.history_dates()
+    def _match_history_date(self, dt_search, known_dates):
+        """Find a parsed date in the known historical dates."""
         if dt_search not in known_dates:
             expl = "known history dates"
             known = "\n  " + "\n  ".join(list(known_dates))
@@ -503,7 +1361,7 @@ class AssetMixin(ModelMixins):
         lines = [pre, inner, post]
         query = " ".join([x.strip() for x in lines if x.strip()]).strip()
 
-        self.LOG.debug(f"Built query: {query!r}")
+        self.LOG.debug("Built query: %r", query)
         # XXX error if no OR / AND in pre & post
         return query
 
@@ -520,6 +1378,11 @@ class AssetMixin(ModelMixins):
         self.labels = Labels(parent=self)
         self.saved_query = SavedQuery(parent=self)
         self.fields = Fields(parent=self)
+        self.fields.cache_ttl = kwargs.get("fields_cache_ttl", FIELDS_CACHE_TTL)
+        self.fields.cache_path = kwargs.get("fields_cache_path", FIELDS_CACHE_PATH)
+        self.fields.cache_disk_ttl = kwargs.get(
+            "fields_cache_disk_ttl", FIELDS_CACHE_DISK_TTL
+        )
 
         super(AssetMixin, self)._init(auth=auth, **kwargs)
 
@@ -536,10 +1399,30 @@ class AssetMixin(ModelMixins):
         Returns:
             :obj:`int`: count of assets matching query
         """
+        return self.request(**self._count_args(query, history_date))
+
+    async def _count_async(self, query=None, history_date=None):
+        """Direct API method to get the count of assets with asyncio.
+
+        Args:
+            **kwargs: see :meth:`_count`
+
+        Returns:
+            :obj:`int`: count of assets matching query
+        """
+        return await self.request_async(**self._count_args(query, history_date))
+
+    def _count_args(self, query, history_date):
+        """Build the request arguments for :meth:`_count`."""
         params = {}
         params["filter"] = query
         params["history"] = history_date
-        return self.request(method="post", path=self.router.count, json=params)
+        return {
+            "method": "post",
+            "path": self.router.count,
+            "json": params,
+            "idempotent": True,
+        }
 
     def _get(
         self,
@@ -573,6 +1456,66 @@ class AssetMixin(ModelMixins):
             :obj:`list` of :obj:`dict`: assets matching **query** with key/value pairs
                 requested as per **fields**
         """
+        params = self._get_params(
+            query=query,
+            fields=fields,
+            row_start=row_start,
+            page_size=page_size,
+            include_details=include_details,
+            history_date=history_date,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+        )
+        return self.request(
+            method="post", path=self.router.root, json=params, idempotent=True
+        )
+
+    async def _get_async(
+        self,
+        query=None,
+        fields=None,
+        row_start=0,
+        page_size=PAGE_SIZE,
+        include_details=False,
+        history_date=None,
+        sort_field=None,
+        sort_descending=False,
+    ):
+        """Direct API method to get a page of assets with asyncio.
+
+        Args:
+            **kwargs: see :meth:`_get`
+
+        Returns:
+            :obj:`list` of :obj:`dict`: assets matching **query** with key/value pairs
+                requested as per **fields**
+        """
+        params = self._get_params(
+            query=query,
+            fields=fields,
+            row_start=row_start,
+            page_size=page_size,
+            include_details=include_details,
+            history_date=history_date,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+        )
+        return await self.request_async(
+            method="post", path=self.router.root, json=params, idempotent=True
+        )
+
+    def _get_params(
+        self,
+        query,
+        fields,
+        row_start,
+        page_size,
+        include_details,
+        history_date,
+        sort_field,
+        sort_descending,
+    ):
+        """Build the request body for :meth:`_get` and :meth:`_get_cursor`."""
         page_size = self._get_page_size(page_size=page_size, max_rows=None)
 
         params = {}
@@ -591,8 +1534,7 @@ class AssetMixin(ModelMixins):
             params["fields"] = fields
 
         self._LAST_GET = params
-
-        return self.request(method="post", path=self.router.root, json=params)
+        return params
 
     def _get_cursor(
         self,
@@ -607,27 +1549,48 @@ class AssetMixin(ModelMixins):
         sort_descending=False,
     ):
         """Get a page for a given query."""
-        page_size = self._get_page_size(page_size=page_size, max_rows=None)
-
-        params = {}
+        params = self._get_params(
+            query=query,
+            fields=fields,
+            row_start=row_start,
+            page_size=page_size,
+            include_details=include_details,
+            history_date=history_date,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+        )
         params["cursor"] = cursor
-        params["skip"] = row_start
-        params["limit"] = page_size
-        params["include_details"] = include_details
-        params["history"] = history_date
-        params["sort"] = sort_field
-        params["desc"] = "1" if sort_descending else None
-        params["filter"] = query
-
-        if fields:
-            if isinstance(fields, list):
-                fields = ",".join(fields)
-
-            params["fields"] = fields
-
-        self._LAST_GET = params
+        return self.request(
+            method="post", path=self.router.cached, json=params, idempotent=True
+        )
 
-        return self.request(method="post", path=self.router.cached, json=params)
+    async def _get_cursor_async(
+        self,
+        query=None,
+        fields=None,
+        row_start=0,
+        page_size=PAGE_SIZE,
+        cursor=None,
+        include_details=False,
+        history_date=None,
+        sort_field=None,
+        sort_descending=False,
+    ):
+        """Get a page for a given query with asyncio."""
+        params = self._get_params(
+            query=query,
+            fields=fields,
+            row_start=row_start,
+            page_size=page_size,
+            include_details=include_details,
+            history_date=history_date,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+        )
+        params["cursor"] = cursor
+        return await self.request_async(
+            method="post", path=self.router.cached, json=params, idempotent=True
+        )
 
     def _get_by_id(self, id):
         """Direct API method to get the full metadata of all adapters for a single asset.
@@ -652,3 +1615,8 @@ class AssetMixin(ModelMixins):
         """Get all known historical dates for this asset type."""
         path = self.router.history_dates
         return self.request(method="get", path=path)
+
+    async def _history_dates_async(self):
+        """Get all known historical dates for this asset type with asyncio."""
+        path = self.router.history_dates
+        return await self.request_async(method="get", path=path)
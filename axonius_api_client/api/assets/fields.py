@@ -1,25 +1,101 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import functools
 import re
-
-from ...constants import (AGG_ADAPTER_ALTS, AGG_ADAPTER_NAME, GET_SCHEMA_KEYS,
-                          GET_SCHEMAS_KEYS)
+import threading
+import time
+
+from ...constants import (
+    AGG_ADAPTER_ALTS,
+    AGG_ADAPTER_NAME,
+    FIELDS_CACHE_DISK_TTL,
+    FIELDS_CACHE_PATH,
+    FIELDS_CACHE_TTL,
+    GET_SCHEMA_KEYS,
+    GET_SCHEMAS_KEYS,
+)
 from ...exceptions import ApiError, NotFoundError
-from ...tools import listify, split_str, strip_right
+from ...tools import get_path, listify, path_read, path_write, split_str, strip_right
 from ..mixins import ChildMixins
 from ..parsers.fields import parse_fields
+from ..routers import API_VERSION
 
 
 class Fields(ChildMixins):
     """Child API model for working with fields for the parent asset type."""
 
-    def get(self):
+    def get(self, cache=True):
         """Get the schema of all adapters and their fields.
 
+        Notes:
+            The parsed fields are cached in memory for :attr:`cache_ttl` seconds,
+            which is disabled by default. While cached, the same fields are returned
+            to every caller, so they must not be modified. If :attr:`cache_path` is
+            set, the fields returned by the API are also cached on disk for
+            :attr:`cache_disk_ttl` seconds in a file named after the URL and
+            version of the instance and the asset type.
+
+        Args:
+            cache (:obj:`bool`, optional): default ``True`` -
+
+                * if ``True`` return cached fields if they have not expired
+                * if ``False`` get the fields from the API and update the caches
+
+        Returns:
+            :obj:`dict`: parsed output from :meth:`ParserFields.parse`
+        """
+        with self._cache_lock:
+            fields = self._cache_get_memory() if cache else None
+
+            if fields is None:
+                path = self._cache_get_path(version=self._get_version())
+                raw = self._cache_read_disk(path=path) if cache else None
+
+                if raw is None:
+                    raw = self._get()
+                    self._cache_write_disk(path=path, raw=raw)
+
+                fields = self._cache_set_memory(fields=parse_fields(raw=raw))
+            return fields
+
+    async def get_async(self, cache=True):
+        """Get the schema of all adapters and their fields with asyncio.
+
+        Args:
+            cache (:obj:`bool`, optional): default ``True`` - see :meth:`get`
+
         Returns:
             :obj:`dict`: parsed output from :meth:`ParserFields.parse`
         """
-        return parse_fields(raw=self._get())
+        fields = self._cache_get_memory() if cache else None
+
+        if fields is None:
+            path = self._cache_get_path(version=await self._get_version_async())
+            raw = self._cache_read_disk(path=path) if cache else None
+
+            if raw is None:
+                raw = await self._get_async()
+                self._cache_write_disk(path=path, raw=raw)
+
+            fields = self._cache_set_memory(fields=parse_fields(raw=raw))
+        return fields
+
+    def cache_clear(self, disk=True):
+        """Remove the cached fields for this asset type.
+
+        Args:
+            disk (:obj:`bool`, optional): default ``True`` - also remove the
+                files for this asset type under :attr:`cache_path`
+        """
+        with self._cache_lock:
+            self._cache = None
+            self._version = None
+
+            if disk and self.cache_path:
+                pattern = f"{self._cache_get_prefix()}*.json"
+                for path in get_path(obj=self.cache_path).glob(pattern):
+                    self.LOG.debug(f"Removing cached fields file {str(path)!r}")
+                    path.unlink()
 
     def get_adapter_names(self, value, fields_map=None):
         """Find an adapter by name regex."""
@@ -56,20 +132,32 @@ class Fields(ChildMixins):
         msg = msg.format(value, "\n  ".join(list(fields_map)))
         raise NotFoundError(msg)
 
-    def get_field_schemas(self, value, schemas, **kwargs):
-        """Find a schema for a field by regex of name."""
-        keys = kwargs.get("keys", GET_SCHEMAS_KEYS)
-        search = re.compile(value.lower().strip(), re.I)
+    def get_index(self, fields_map=None):
+        """Get the lookup index for a fields map.
+
+        Notes:
+            The index for the last fields map is kept, so repeated lookups against
+            the same fields map (i.e. the one cached by :meth:`get`) do not have
+            to rebuild it.
 
-        matches = []
+        Args:
+            fields_map (:obj:`dict`, optional): default ``None`` - output from
+                :meth:`get`, ``None`` will use :meth:`get`
 
-        for schema in schemas:
-            if not schema.get("selectable"):
-                continue
+        Returns:
+            :obj:`FieldsIndex`: lookup index for **fields_map**
+        """
+        fields_map = fields_map or self.get()
+        index = self._index
 
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
+        if index is None or index.fields_map is not fields_map:
+            index = self._index = FieldsIndex(fields_map=fields_map)
+        return index
+
+    def get_field_schemas(self, value, schemas, **kwargs):
+        """Find a schema for a field by regex of name."""
+        keys = kwargs.get("keys", GET_SCHEMAS_KEYS)
+        index = kwargs.get("index") or SchemasIndex(schemas=schemas)
 
         # XXX fix test case for this
         # os\. will fail for adapters that do not have os.type/dist/etc
@@ -79,24 +167,21 @@ class Fields(ChildMixins):
         #         keys, value, "\n".join(self._prettify_schemas(schemas=schemas)),
         #     )
         #     raise NotFoundError(msg)
-        return matches
+        return index.search(value=value, keys=keys)
 
     def get_field_schema(self, value, schemas, **kwargs):
         """Find a schema for a field by name."""
         keys = kwargs.get("keys", GET_SCHEMA_KEYS)
-        search = value.lower().strip()
-
-        for schema in schemas:
-            if not schema.get("selectable"):
-                continue
-
-            for key in keys:
-                if search == schema[key].lower():
-                    return schema
-
-        msg = "No field found where any of {} equals {!r}, valid fields: \n{}"
-        msg = msg.format(keys, value, "\n".join(self._prettify_schemas(schemas=schemas)))
-        raise NotFoundError(msg)
+        index = kwargs.get("index") or SchemasIndex(schemas=schemas)
+        schema = index.get(value=value, keys=keys)
+
+        if schema is None:
+            msg = "No field found where any of {} equals {!r}, valid fields: \n{}"
+            msg = msg.format(
+                keys, value, "\n".join(self._prettify_schemas(schemas=schemas))
+            )
+            raise NotFoundError(msg)
+        return schema
 
     def get_field_name(self, value, field_manual=False, fields_map=None):
         """Pass."""
@@ -110,47 +195,53 @@ class Fields(ChildMixins):
 
         field = fields[0]
 
-        fields_map = fields_map or self.get()
-        adapter = self.get_adapter_name(value=adapter, fields_map=fields_map)
-        schemas = fields_map[adapter]
-        schema = self.get_field_schema(value=field, schemas=schemas)
+        index = self.get_index(fields_map=fields_map)
+        adapter = self.get_adapter_name(value=adapter, fields_map=index.fields_map)
+        schema = self.get_field_schema(
+            value=field, schemas=index.fields_map[adapter], index=index[adapter]
+        )
         return schema["name_qual"]
 
     def get_field_names_re(self, value, fields_map=None):
         """Pass."""
         splits = self.split_searches(value=value)
-        fields_map = fields_map or self.get()
+        index = self.get_index(fields_map=fields_map)
 
-        matches = []
+        matches = {}
 
         for adapter_re, fields in splits:
-            adapters = self.get_adapter_names(value=adapter_re, fields_map=fields_map)
+            adapters = self.get_adapter_names(
+                value=adapter_re, fields_map=index.fields_map
+            )
 
             for adapter in adapters:
                 for field in fields:
                     fschemas = self.get_field_schemas(
-                        value=field, schemas=fields_map[adapter]
+                        value=field,
+                        schemas=index.fields_map[adapter],
+                        index=index[adapter],
                     )
-                    names = [x["name_qual"] for x in fschemas]
-                    matches += [x for x in names if x not in matches]
-        return matches
+                    matches.update(dict.fromkeys(x["name_qual"] for x in fschemas))
+        return list(matches)
 
     def get_field_names_eq(self, value, fields_map=None):
         """Pass."""
         splits = self.split_searches(value=value)
-        fields_map = fields_map or self.get()
+        index = self.get_index(fields_map=fields_map)
 
-        matches = []
+        matches = {}
 
         for adapter_name, names in splits:
-            adapter = self.get_adapter_name(value=adapter_name, fields_map=fields_map)
+            adapter = self.get_adapter_name(
+                value=adapter_name, fields_map=index.fields_map
+            )
             for name in names:
-                schemas = fields_map[adapter]
-                schema = self.get_field_schema(value=name, schemas=schemas)
-                if schema["name_qual"] not in matches:
-                    matches.append(schema["name_qual"])
+                schema = self.get_field_schema(
+                    value=name, schemas=index.fields_map[adapter], index=index[adapter]
+                )
+                matches[schema["name_qual"]] = None
 
-        return matches
+        return list(matches)
 
     def validate(
         self,
@@ -178,15 +269,16 @@ class Fields(ChildMixins):
 
         fields_map = fields_map or self.get()
 
-        for field in self.get_field_names_eq(value=fields, fields_map=fields_map):
-            if field not in selected:
-                selected.append(field)
-
-        for field in self.get_field_names_re(value=fields_regex, fields_map=fields_map):
-            if field not in selected:
-                selected.append(field)
-
-        return selected
+        selected = dict.fromkeys(selected)
+        selected.update(
+            dict.fromkeys(self.get_field_names_eq(value=fields, fields_map=fields_map))
+        )
+        selected.update(
+            dict.fromkeys(
+                self.get_field_names_re(value=fields_regex, fields_map=fields_map)
+            )
+        )
+        return list(selected)
 
     def split_searches(self, value):
         """Pass."""
@@ -222,6 +314,118 @@ class Fields(ChildMixins):
 
         return adapter_split, fields
 
+    def _init(self, parent):
+        """Post init method for subclasses to use for extra setup.
+
+        Args:
+            parent (:obj:`.api.mixins.Model`): parent API model of this child
+        """
+        self.cache_ttl = FIELDS_CACHE_TTL
+        """:obj:`int`: seconds to cache fields in memory, disabled if 0 or None"""
+
+        self.cache_path = FIELDS_CACHE_PATH
+        """:obj:`str`: path to cache fields on disk, disabled if None"""
+
+        self.cache_disk_ttl = FIELDS_CACHE_DISK_TTL
+        """:obj:`int`: seconds to use fields cached on disk"""
+
+        self._cache = None
+        self._cache_lock = threading.RLock()
+        self._index = None
+        self._version = None
+        super(Fields, self)._init(parent=parent)
+
+    def _cache_get_memory(self):
+        """Get the fields cached in memory if they have not expired."""
+        if self._cache and self.cache_ttl:
+            age = time.monotonic() - self._cache["created"]
+            if age < self.cache_ttl:
+                self.LOG.debug(f"Using fields cached in memory {age:.2f} seconds ago")
+                return self._cache["fields"]
+        return None
+
+    def _cache_set_memory(self, fields):
+        """Cache fields in memory."""
+        self._cache = {"created": time.monotonic(), "fields": fields}
+        return fields
+
+    def _cache_get_prefix(self):
+        """Get the prefix of the files for this asset type under cache_path."""
+        parsed = self.http.URLPARSED
+        prefix = f"fields_{parsed.hostname}_{parsed.port}_{self.router._object_type}_"
+        return re.sub(r"[^\w.-]", "_", prefix)
+
+    def _cache_get_path(self, version):
+        """Get the path of the file to cache fields on disk."""
+        if not self.cache_path or version is None:
+            return None
+        name = re.sub(r"[^\w.-]", "_", f"{self._cache_get_prefix()}{version}.json")
+        return get_path(obj=self.cache_path) / name
+
+    def _cache_read_disk(self, path):
+        """Read the fields returned by the API that were cached on disk."""
+        if not path or not path.is_file():
+            return None
+
+        try:
+            _, data = path_read(obj=path, is_json=True)
+            age = time.time() - data["created"]
+            raw = data["raw"]
+        except Exception as exc:
+            self.LOG.warning(f"Unable to read cached fields {str(path)!r}: {exc}")
+            return None
+
+        if self.cache_disk_ttl and age >= self.cache_disk_ttl:
+            return None
+
+        self.LOG.debug(f"Using fields cached in {str(path)!r} {age:.2f} seconds ago")
+        return raw
+
+    def _cache_write_disk(self, path, raw):
+        """Cache the fields returned by the API on disk."""
+        if not path:
+            return
+
+        data = {"created": time.time(), "url": self.http.url, "raw": raw}
+
+        try:
+            path_write(obj=path, data=data, overwrite=True, is_json=True, indent=None)
+        except Exception as exc:
+            self.LOG.warning(f"Unable to write cached fields {str(path)!r}: {exc}")
+
+    def _get_version(self):
+        """Get the version of the instance to key fields cached on disk with.
+
+        Notes:
+            The version is only fetched once, until :meth:`cache_clear` is called.
+        """
+        if not self.cache_path:
+            return None
+
+        if self._version is None:
+            path = API_VERSION.system.meta_about
+            self._version = self._parse_version(
+                about=self.request(method="get", path=path)
+            )
+        return self._version
+
+    async def _get_version_async(self):
+        """Get the version of the instance to key fields cached on disk with."""
+        if not self.cache_path:
+            return None
+
+        if self._version is None:
+            path = API_VERSION.system.meta_about
+            self._version = self._parse_version(
+                about=await self.request_async(method="get", path=path)
+            )
+        return self._version
+
+    @staticmethod
+    def _parse_version(about):
+        version = about.get("Version", "") or about.get("Installed Version", "")
+        return version.replace("_", ".") or "unknown"
+
     def _get(self):
         """Direct API method to get the schema of all fields.
 
@@ -230,8 +434,121 @@ class Fields(ChildMixins):
         """
         return self.request(method="get", path=self.router.fields)
 
+    async def _get_async(self):
+        """Direct API method to get the schema of all fields with asyncio.
+
+        Returns:
+            :obj:`dict`: schema of all fields
+        """
+        return await self.request_async(method="get", path=self.router.fields)
+
     def _prettify_schemas(self, schemas):
         """Pass."""
         stmpl = "{adapter_name}:{name_base:{name_base_len}} -> {column_title}".format
         name_base_len = max([len(x["name_base"]) for x in schemas])
         return [stmpl(name_base_len=name_base_len, **x) for x in schemas]
+
+
+class SchemasIndex:
+    """Lookup index for the schemas of the fields of one adapter.
+
+    Notes:
+        Only selectable schemas are indexed. Maps of lowercased values to schemas
+        are built the first time a set of keys is used, and compiled patterns and
+        the results of regex searches are cached, so each lookup after the first
+        is a dict lookup.
+    """
+
+    def __init__(self, schemas):
+        """Lookup index for the schemas of the fields of one adapter.
+
+        Args:
+            schemas (:obj:`list` of :obj:`dict`): schemas of the fields of an
+                adapter from :meth:`Fields.get`
+        """
+        self.schemas = [x for x in schemas if x.get("selectable")]
+        self._maps = {}
+        self._searches = {}
+
+    def __str__(self):
+        """Show object info."""
+        return f"{self.__class__.__name__}(schemas={len(self.schemas)})"
+
+    def __repr__(self):
+        """Show object info."""
+        return self.__str__()
+
+    def get(self, value, keys=GET_SCHEMA_KEYS):
+        """Get the first schema where any of keys equals value.
+
+        Args:
+            value (:obj:`str`): value to find, case insensitive
+            keys (:obj:`list` of :obj:`str`, optional): default
+                :data:`axonius_api_client.constants.GET_SCHEMA_KEYS` -
+                keys of each schema to compare against **value**
+
+        Returns:
+            :obj:`dict` or :obj:`None`: schema that matches **value**
+        """
+        keys = tuple(keys)
+
+        if keys not in self._maps:
+            lookup = self._maps[keys] = {}
+            for schema in self.schemas:
+                for key in keys:
+                    lookup.setdefault(schema[key].lower(), schema)
+
+        return self._maps[keys].get(value.lower().strip())
+
+    def search(self, value, keys=GET_SCHEMAS_KEYS):
+        """Get the schemas where any of keys matches a regex.
+
+        Args:
+            value (:obj:`str`): regex to search for, case insensitive
+            keys (:obj:`list` of :obj:`str`, optional): default
+                :data:`axonius_api_client.constants.GET_SCHEMAS_KEYS` -
+                keys of each schema to search with **value**
+
+        Returns:
+            :obj:`list` of :obj:`dict`: schemas that match **value**
+        """
+        cache_key = (value.lower().strip(), tuple(keys))
+
+        if cache_key not in self._searches:
+            search = _compile(value=cache_key[0])
+            self._searches[cache_key] = [
+                schema
+                for schema in self.schemas
+                if any(search.search(schema[key]) for key in keys)
+            ]
+
+        return list(self._searches[cache_key])
+
+
+class FieldsIndex(dict):
+    """Lookup index for each adapter in a fields map.
+
+    Notes:
+        Maps adapter names to a :obj:`SchemasIndex` that is built the first time
+        the adapter is looked up.
+    """
+
+    def __init__(self, fields_map):
+        """Lookup index for each adapter in a fields map.
+
+        Args:
+            fields_map (:obj:`dict`): output from :meth:`Fields.get`
+        """
+        super().__init__()
+        self.fields_map = fields_map
+
+    def __missing__(self, adapter):
+        """Build the index for an adapter."""
+        index = self[adapter] = SchemasIndex(schemas=self.fields_map[adapter])
+        return index
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(value):
+    """Compile a case insensitive regex for searching schemas."""
+    return re.compile(value, re.I)
@@ -1,34 +1,65 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
-from ...tools import grouper
+import time
+
+from ...constants import (
+    LABELS_BATCH_SIZE,
+    LABELS_RETRIES,
+    LABELS_RETRY_SECONDS,
+    LABELS_WORKERS,
+)
+from ...exceptions import ApiError, ResponseNotOk
 from ..mixins import ChildMixins
+from ..paging import fetch_concurrent
 
 
 class Labels(ChildMixins):
     """ChildMixins API model for working with labels/tags for the parent asset type."""
 
-    def add(self, rows, labels):
+    def add(
+        self,
+        rows,
+        labels,
+        batch_size=LABELS_BATCH_SIZE,
+        workers=LABELS_WORKERS,
+        retries=LABELS_RETRIES,
+        summary=False,
+    ):
         """Add labels/tags to assets.
 
         Args:
             rows (:obj:`list` of :obj:`dict`): assets returned from :meth:`get`
                 to process
             labels (:obj:`list` of `str`): labels to process
+            batch_size (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_BATCH_SIZE` -
+                number of assets to process in each request
+            workers (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_WORKERS` -
+                number of requests to run at the same time
+            retries (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_RETRIES` -
+                number of times to retry a batch that failed
+            summary (:obj:`bool`, optional): default ``False`` -
 
-        Returns:
-            :obj:`int`: number of labels processed
-        """
-        ids = [row["internal_axon_id"] for row in rows]
+                * if ``True`` return the output of :meth:`process`
+                * if ``False`` return the number of labels processed
 
-        processed = 0
+        Raises:
+            :exc:`ApiError`: if summary is False and any batch failed
 
-        # only do 100 labels at a time, more seems to break API
-        for group in grouper(ids, 100):
-            group = [x for x in group if x is not None]
-            response = self._add(labels=labels, ids=group)
-            processed += response
-
-        return processed
+        Returns:
+            :obj:`int` or :obj:`dict`: number of labels processed or summary
+        """
+        result = self.process(
+            method=self._add,
+            rows=rows,
+            labels=labels,
+            batch_size=batch_size,
+            workers=workers,
+            retries=retries,
+        )
+        return result if summary else self._check_summary(result=result)
 
     def get(self):
         """Get all known labels/tags.
@@ -38,28 +69,201 @@ class Labels(ChildMixins):
         """
         return self._get()
 
-    def remove(self, rows, labels):
+    def remove(
+        self,
+        rows,
+        labels,
+        batch_size=LABELS_BATCH_SIZE,
+        workers=LABELS_WORKERS,
+        retries=LABELS_RETRIES,
+        summary=False,
+    ):
         """Remove labels/tags from assets.
 
         Args:
             rows (:obj:`list` of :obj:`dict`): assets returned from :meth:`get`
                 to process
             labels (:obj:`list` of `str`): labels to process
+            batch_size (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_BATCH_SIZE` -
+                number of assets to process in each request
+            workers (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_WORKERS` -
+                number of requests to run at the same time
+            retries (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_RETRIES` -
+                number of times to retry a batch that failed
+            summary (:obj:`bool`, optional): default ``False`` -
+
+                * if ``True`` return the output of :meth:`process`
+                * if ``False`` return the number of labels processed
+
+        Raises:
+            :exc:`ApiError`: if summary is False and any batch failed
 
         Returns:
-            :obj:`int`: number of labels processed
+            :obj:`int` or :obj:`dict`: number of labels processed or summary
+        """
+        result = self.process(
+            method=self._remove,
+            rows=rows,
+            labels=labels,
+            batch_size=batch_size,
+            workers=workers,
+            retries=retries,
+        )
+        return result if summary else self._check_summary(result=result)
+
+    def process(
+        self,
+        method,
+        rows,
+        labels,
+        batch_size=LABELS_BATCH_SIZE,
+        workers=LABELS_WORKERS,
+        retries=LABELS_RETRIES,
+    ):
+        """Add or remove labels/tags for assets in batches.
+
+        Notes:
+            Batches are sent by up to **workers** threads. A batch that fails with
+            a transient error (see :meth:`_is_error_retry`) is retried up to
+            **retries** times, waiting
+            :data:`axonius_api_client.constants.LABELS_RETRY_SECONDS` before the
+            first retry and twice as long before each one after that. A batch
+            that still fails does not stop the other batches.
+
+            If the :obj:`axonius_api_client.http.RetryPolicy` of :attr:`http`
+            retries requests, batches are not retried, so that a request is only
+            retried by one of them.
+
+        Args:
+            method (:obj:`callable`): :meth:`_add` or :meth:`_remove`
+            rows (:obj:`list` of :obj:`dict`): assets returned from :meth:`get`
+                to process
+            labels (:obj:`list` of `str`): labels to process
+            batch_size (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_BATCH_SIZE` -
+                number of assets to process in each request
+            workers (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_WORKERS` -
+                number of requests to run at the same time
+            retries (:obj:`int`, optional): default
+                :data:`axonius_api_client.constants.LABELS_RETRIES` -
+                number of times to retry a batch that failed
+
+        Returns:
+            :obj:`dict`: summary with keys:
+
+                * processed: number of labels processed across all batches
+                * batches: for each batch, the number of assets, labels
+                  processed, tries, seconds taken and error (or None)
+                * failed_ids: internal_axon_id of assets in batches that failed
         """
+        batch_size = batch_size or LABELS_BATCH_SIZE
         ids = [row["internal_axon_id"] for row in rows]
+        groups = [ids[idx : idx + batch_size] for idx in range(0, len(ids), batch_size)]
+
+        def run(group):
+            return self._process_batch(
+                method=method, labels=labels, ids=group, retries=retries
+            )
+
+        if workers and workers > 1 and len(groups) > 1:
+            batches = list(fetch_concurrent(fetch=run, args=groups, workers=workers))
+        else:
+            batches = [run(group) for group in groups]
+
+        failed_ids = []
+        for group, batch in zip(groups, batches):
+            if batch["error"]:
+                failed_ids += group
+
+        result = {
+            "processed": sum(x["processed"] for x in batches),
+            "batches": batches,
+            "failed_ids": failed_ids,
+        }
 
+        msg = (
+            f"{method.__name__.strip('_').title()} labels {labels} for {len(ids)} "
+            f"assets in {len(batches)} batches: processed {result['processed']}, "
+            f"failed assets {len(failed_ids)}"
+        )
+        self.LOG.debug(msg)
+        return result
+
+    def _process_batch(self, method, labels, ids, retries):
+        """Add or remove labels for one batch of assets, retrying transient errors.
+
+        Returns:
+            :obj:`dict`: summary of this batch for :meth:`process`
+        """
+        start = time.time()
+        tries = 0
+        error = None
         processed = 0
 
-        # only do 100 labels at a time, more seems to break API
-        for group in grouper(ids, 100):
-            group = [x for x in group if x is not None]
-            response = self._remove(labels=labels, ids=group)
-            processed += response
+        if self.http.RETRY.retries:
+            retries = 0
+
+        while True:
+            tries += 1
+            try:
+                processed = method(labels=labels, ids=ids)
+                error = None
+                break
+            except Exception as exc:
+                error = exc
+                if tries > (retries or 0) or not self._is_error_retry(error=exc):
+                    break
+
+                wait = LABELS_RETRY_SECONDS * (2 ** (tries - 1))
+                self.LOG.warning(
+                    f"Retrying batch of {len(ids)} assets in {wait} seconds "
+                    f"after try {tries} failed: {exc}"
+                )
+                time.sleep(wait)
+
+        return {
+            "count": len(ids),
+            "processed": processed,
+            "tries": tries,
+            "seconds": round(time.time() - start, 2),
+            "error": error,
+        }
+
+    def _is_error_retry(self, error):
+        """Check if the error of a batch is transient and the batch can be retried.
+
+        Notes:
+            Network errors (see :meth:`RetryPolicy.is_error_retry` of the
+            :obj:`axonius_api_client.http.Http` object) and responses with a status
+            code of 429 or 5xx are transient.
+
+        Args:
+            error (:obj:`Exception`): error raised while processing a batch
+
+        Returns:
+            :obj:`bool`
+        """
+        response = getattr(error, "response", None)
+        if isinstance(error, ResponseNotOk) and response is not None:
+            return response.status_code == 429 or response.status_code >= 500
+        return self.http.RETRY.is_error_retry(error=error)
+
+    def _check_summary(self, result):
+        """Get the number of labels processed or raise the first batch error."""
+        errors = [x["error"] for x in result["batches"] if x["error"]]
+
+        if errors:
+            msg = (
+                f"Failed to process labels for {len(result['failed_ids'])} assets "
+                f"in {len(errors)} batches, first error: {errors[0]}"
+            )
+            raise ApiError(msg) from errors[0]
 
-        return processed
+        return result["processed"]
 
     def _add(self, labels, ids):
         """Direct API method to add labels/tags to assets.
@@ -77,7 +281,7 @@ class Labels(ChildMixins):
         data["labels"] = labels
 
         path = self.router.labels
-        return self.request(method="post", path=path, json=data)
+        return self.request(method="post", path=path, json=data, idempotent=True)
 
     def _get(self):
         """Direct API method to get all known labels/tags.
@@ -320,9 +320,24 @@ class SavedQuery(ChildMixins, PagingMixinsObject):
         Returns:
             :obj:`list` of :obj:`dict`: list of saved query metadata
         """
+        return self.request(**self._get_args(query, row_start, page_size))
+
+    async def _get_async(self, query=None, row_start=0, page_size=PAGE_SIZE):
+        """Direct API method to get saved queries with asyncio.
+
+        Args:
+            **kwargs: see :meth:`_get`
+
+        Returns:
+            :obj:`list` of :obj:`dict`: list of saved query metadata
+        """
+        return await self.request_async(**self._get_args(query, row_start, page_size))
+
+    def _get_args(self, query, row_start, page_size):
+        """Build the request arguments for :meth:`_get` and :meth:`_get_async`."""
         params = {}
         params["limit"] = page_size
         params["skip"] = row_start
         params["filter"] = query
         path = self.router.views
-        return self.request(method="get", path=path, params=params)
+        return {"method": "get", "path": path, "params": params}
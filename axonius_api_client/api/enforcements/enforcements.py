@@ -69,6 +69,14 @@ class Enforcements(ModelMixins, PagingMixinsObject):
 
     def _get(self, query=None, row_start=0, page_size=0):
         """Get a page for a given query."""
+        return self.request(**self._get_args(query, row_start, page_size))
+
+    async def _get_async(self, query=None, row_start=0, page_size=0):
+        """Get a page for a given query with asyncio."""
+        return await self.request_async(**self._get_args(query, row_start, page_size))
+
+    def _get_args(self, query, row_start, page_size):
+        """Build the request arguments for :meth:`_get` and :meth:`_get_async`."""
         params = {}
         params["skip"] = row_start
         params["limit"] = page_size
@@ -76,4 +84,4 @@ class Enforcements(ModelMixins, PagingMixinsObject):
 
         path = self.router.root
 
-        return self.request(method="get", path=path, params=params)
+        return {"method": "get", "path": path, "params": params}
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 """API model base classes and mixins."""
 import abc
+import asyncio
+import logging
 import time
 
-from ..constants import LOG_LEVEL_API, MAX_BODY_LEN, MAX_PAGE_SIZE
+from ..constants import (
+    LOG_LEVEL_API,
+    MAX_BODY_LEN,
+    MAX_PAGE_SIZE,
+    PAGE_STREAM_CHUNK_SIZE,
+)
 from ..exceptions import JsonError, JsonInvalid, NotFoundError, ResponseNotOk
-from ..logs import get_obj_log
+from ..logs import LazyFormat, get_obj_log
 from ..tools import dt_now, dt_sec_ago, json_dump, json_load, json_reload
+from .parsers.stream import JsonStreamParser
 
 
 class Model:
@@ -27,11 +35,11 @@ class PageSizeMixin:
 
     def _get_page_size(self, page_size=MAX_PAGE_SIZE, max_rows=None):
         if max_rows and max_rows < page_size:
-            self.LOG.debug(f"CHANGED PAGE SIZE {page_size} to max_rows {max_rows}")
+            self.LOG.debug("CHANGED PAGE SIZE %s to max_rows %s", page_size, max_rows)
             page_size = max_rows
 
         if page_size > MAX_PAGE_SIZE:
-            self.LOG.debug(f"CHANGED PAGE SIZE {page_size} to max {MAX_PAGE_SIZE}")
+            self.LOG.debug("CHANGED PAGE SIZE %s to max %s", page_size, MAX_PAGE_SIZE)
             page_size = MAX_PAGE_SIZE
 
         if not page_size:
@@ -39,6 +47,18 @@ class PageSizeMixin:
 
         return page_size
 
+    def _emit_page(self, values):
+        """Emit a page event to the metrics of :attr:`http` for a processed page.
+
+        Args:
+            values (:obj:`dict`): rows and fetch_seconds of the page, plus
+                callbacks_seconds for assets
+        """
+        if self.http.METRICS.enabled:
+            self.http.METRICS.emit(
+                event="page", values=values, labels={"group": self.router._group}
+            )
+
 
 class ModelMixins(Model, PageSizeMixin):
     """Mixins for :obj:`Model` objects."""
@@ -83,11 +103,11 @@ class ModelMixins(Model, PageSizeMixin):
 
     def _get_page_size(self, page_size=MAX_PAGE_SIZE, max_rows=None):
         if max_rows and max_rows < page_size:
-            self.LOG.debug(f"CHANGED PAGE SIZE {page_size} to max_rows {max_rows}")
+            self.LOG.debug("CHANGED PAGE SIZE %s to max_rows %s", page_size, max_rows)
             page_size = max_rows
 
         if page_size > MAX_PAGE_SIZE:
-            self.LOG.debug(f"CHANGED PAGE SIZE {page_size} to max {MAX_PAGE_SIZE}")
+            self.LOG.debug("CHANGED PAGE SIZE %s to max %s", page_size, MAX_PAGE_SIZE)
             page_size = MAX_PAGE_SIZE
 
         if not page_size:
@@ -97,8 +117,8 @@ class ModelMixins(Model, PageSizeMixin):
 
     def _build_err_msg(self, response, error=None, exc=None):
         """Pass."""
-        request_size = len(response.request.body or "")
-        response_size = len(response.text or "")
+        request_size = self.http.get_body_size(body=response.request.body)
+        response_size = self.http.get_body_size(body=response.content)
         msgs = []
         msgs += [f"Original exception: {exc}"] if exc else []
         msgs += [
@@ -168,7 +188,8 @@ class ModelMixins(Model, PageSizeMixin):
                   with :meth:`_check_response_code`
                 * if ``False`` do not check response status code
             **kwargs:
-                Passed to :meth:`.http.Http.__call__`
+                Passed to :meth:`.http.Http.__call__`, with limit_group defaulting
+                to the group of :attr:`router`
 
         Returns:
             :obj:`requests.Response` or :obj:`object` or :obj:`str`:
@@ -177,12 +198,153 @@ class ModelMixins(Model, PageSizeMixin):
                 * :obj:`object`: if raw is False and is_json is True
                 * :obj:`str`: if raw is False and is_json is False
         """
-        sargs = {}
+        sargs = {"limit_group": self.router._group}
         sargs.update(kwargs)
         sargs.update({"path": path, "method": method})
 
         response = self.http(**sargs)
 
+        return self._handle_response(
+            response=response,
+            raw=raw,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    async def request_async(
+        self,
+        path,
+        method="get",
+        raw=False,
+        is_json=True,
+        error_status=True,
+        error_json_bad_status=True,
+        error_json_invalid=True,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Send a REST API request using :attr:`.http.Http.async_http`.
+
+        Notes:
+            Requires the optional ``aiohttp`` package.
+
+        Args:
+            **kwargs: see :meth:`request`
+
+        Returns:
+            :obj:`requests.Response` or :obj:`object` or :obj:`str`: see :meth:`request`
+        """
+        sargs = {"limit_group": self.router._group}
+        sargs.update(kwargs)
+        sargs.update({"path": path, "method": method})
+
+        response = await self.http.async_http(**sargs)
+
+        return self._handle_response(
+            response=response,
+            raw=raw,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    def request_stream(
+        self,
+        path,
+        key,
+        method="get",
+        error_status=True,
+        error_json_bad_status=True,
+        chunk_size=PAGE_STREAM_CHUNK_SIZE,
+        callback=None,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Send a REST API request and decode the items of an array as they arrive.
+
+        Notes:
+            The request is not sent until iteration starts. The response body is
+            read in chunks and decoded by :obj:`.parsers.stream.JsonStreamParser`,
+            so the full body is never held in memory as text or as decoded JSON.
+            Once the response is closed, its body_size is the number of bytes
+            that were read.
+
+        Args:
+            path (:obj:`str`): path to use in request
+            key (:obj:`str`): key of the array in the JSON response to yield items of
+            method (:obj:`str`, optional): default ``get`` - method to use in request
+            error_status (:obj:`bool`, optional): default ``True`` - see :meth:`request`
+            error_json_bad_status (:obj:`bool`, optional): default ``True`` -
+                see :meth:`request`, checked once the response is fully decoded
+            chunk_size (:obj:`int`, optional): default :data:`PAGE_STREAM_CHUNK_SIZE`
+                - number of bytes to read from the response at a time
+            callback (:obj:`callable`, optional): default ``None`` - called with
+                data (the other keys of the JSON response) and count (the number
+                of items yielded) once the response is fully decoded
+            **kwargs:
+                Passed to :meth:`.http.Http.__call__`
+
+        Raises:
+            :exc:`.JsonInvalid`: if response has invalid json
+            :exc:`.JsonError`: if error_json_bad_status is True and
+                response is a json dict that has a non-empty error key or a
+                status key that == error
+
+        Yields:
+            :obj:`object`: each item of the array under **key**
+        """
+        kwargs.setdefault("limit_group", self.router._group)
+        response = self.http(path=path, method=method, stream=True, **kwargs)
+
+        parser = None
+
+        try:
+            self._check_response_code(response=response, error_status=error_status)
+            chunks = response.iter_content(chunk_size=chunk_size)
+            parser = JsonStreamParser(chunks=chunks, key=key)
+            yield from parser
+        finally:
+            response.close()
+            if parser is not None:
+                response.body_size = parser.bytes
+
+        data = parser.data
+        has_error = data.get("error")
+        has_error_status = data.get("status") == "error"
+
+        if (has_error or has_error_status) and error_json_bad_status:
+            respexc = JsonError(
+                f"Error in streamed response from {response.url!r}: {data}"
+            )
+            respexc.response = response
+            raise respexc
+
+        if callback:
+            callback(data=data, count=parser.count)
+
+    def _handle_response(
+        self,
+        response,
+        raw=False,
+        is_json=True,
+        error_status=True,
+        error_json_bad_status=True,
+        error_json_invalid=True,
+    ):
+        """Check a response and get the data from it.
+
+        Args:
+            response (:obj:`requests.Response`): response object to check
+            **kwargs: see :meth:`request`
+
+        Returns:
+            :obj:`requests.Response` or :obj:`object` or :obj:`str`: see :meth:`request`
+        """
         if raw:
             return response
 
@@ -259,6 +421,8 @@ class ModelMixins(Model, PageSizeMixin):
                 * :obj:`object` if response has json data
                 * :obj:`str` if response has invalid json data
         """
+        decode_start = time.perf_counter()
+
         try:
             data = response.json()
         except Exception as exc:
@@ -274,6 +438,16 @@ class ModelMixins(Model, PageSizeMixin):
 
             return response.text
 
+        if self.http.METRICS.enabled:
+            self.http.METRICS.emit(
+                event="http_decode",
+                values={
+                    "seconds": time.perf_counter() - decode_start,
+                    "response_bytes": self.http.get_body_size(body=response.content),
+                },
+                labels={"group": self.router._group},
+            )
+
         if isinstance(data, dict):
             has_error = data.get("error")
             has_error_status = data.get("status") == "error"
@@ -352,6 +526,17 @@ class PagingMixinsObject(PageSizeMixin):
 
         return list(gen)
 
+    async def get_async(self, **kwargs):
+        """Get objects for a given query using paging with asyncio.
+
+        Args:
+            **kwargs: passed to :meth:`get_generator_async`
+
+        Returns:
+            :obj:`list` of :obj:`dict`: rows
+        """
+        return [x async for x in self.get_generator_async(**kwargs)]
+
     def get_generator(
         self,
         query=None,
@@ -374,6 +559,89 @@ class PagingMixinsObject(PageSizeMixin):
         Returns:
             :obj:`list` of :obj:`dict`: list of saved query metadata
         """
+        store, state = self._start_generator(
+            query=query,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            page_start=page_start,
+            page_sleep=page_sleep,
+        )
+
+        while not state["stop_fetch"]:
+            page_start = dt_now()
+            page = self._get(
+                query=store["query"],
+                page_size=state["page_size"],
+                row_start=state["row_to_fetch_next"],
+            )
+
+            yield from self._process_page(page=page, page_start=page_start, state=state)
+
+            if state["stop_fetch"]:
+                break
+
+            state["page_number"] += 1
+            time.sleep(state["page_sleep"])
+
+        self.LOG.info("FINISHED FETCH store=%s", LazyFormat(json_dump, store))
+        self.LOG.debug("FINISHED FETCH state=%s", LazyFormat(json_dump, state))
+
+    async def get_generator_async(
+        self,
+        query=None,
+        max_rows=None,
+        max_pages=None,
+        page_size=MAX_PAGE_SIZE,
+        page_start=0,
+        page_sleep=0,
+        **kwargs,
+    ):
+        """Get objects using paging with asyncio.
+
+        Args:
+            **kwargs: see :meth:`get_generator`
+
+        Yields:
+            :obj:`dict`: row
+        """
+        store, state = self._start_generator(
+            query=query,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            page_start=page_start,
+            page_sleep=page_sleep,
+        )
+
+        while not state["stop_fetch"]:
+            page_start = dt_now()
+            page = await self._get_async(
+                query=store["query"],
+                page_size=state["page_size"],
+                row_start=state["row_to_fetch_next"],
+            )
+
+            for row in self._process_page(page=page, page_start=page_start, state=state):
+                yield row
+
+            if state["stop_fetch"]:
+                break
+
+            state["page_number"] += 1
+            await asyncio.sleep(state["page_sleep"])
+
+        self.LOG.info("FINISHED FETCH store=%s", LazyFormat(json_dump, store))
+        self.LOG.debug("FINISHED FETCH state=%s", LazyFormat(json_dump, state))
+
+    def _start_generator(
+        self, query, max_rows, max_pages, page_size, page_start, page_sleep
+    ):
+        """Build the store and state for :meth:`get_generator`.
+
+        Returns:
+            :obj:`tuple` of (:obj:`dict`, :obj:`dict`): store, state
+        """
         page_size = self._get_page_size(page_size=page_size, max_rows=max_rows)
 
         store = {"query": query}
@@ -394,67 +662,70 @@ class PagingMixinsObject(PageSizeMixin):
             "stop_msg": None,
         }
 
-        self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
-        self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
+        self.LOG.info("STARTING FETCH store=%s", LazyFormat(json_dump, store))
+        self.LOG.debug("STARTING FETCH state=%s", LazyFormat(json_dump, state))
+        return store, state
 
-        while not state["stop_fetch"]:
-            page_start = dt_now()
-            page = self._get(
-                query=store["query"],
-                page_size=state["page_size"],
-                row_start=state["row_to_fetch_next"],
-            )
-            page_took = dt_sec_ago(obj=page_start, exact=True)
-
-            state["fetch_seconds_this_page"] = page_took
-            state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
-
-            rows = page.pop("assets", [])
-            state["rows_fetched_this_page"] = len(rows)
-            state["rows_fetched_total"] += state["rows_fetched_this_page"]
-            state["row_to_fetch_next"] += state["rows_fetched_this_page"]
-
-            self.LOG.debug(f"FETCHED PAGE: {json_dump(page)}")
-            self.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+    def _process_page(self, page, page_start, state):
+        """Update the paging state for a fetched page and yield its rows.
 
-            if not rows:
-                stop_msg = "no more rows returned"
-                state["stop_fetch"] = True
-                state["stop_msg"] = stop_msg
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
-                break
-
-            for row in rows:
-                yield row
+        Args:
+            page (:obj:`dict`): page returned by :meth:`_get`
+            page_start (:obj:`datetime.datetime`): when the fetch of page started
+            state (:obj:`dict`): paging state from :meth:`get_generator`
 
-                state["rows_processed_total"] += 1
+        Yields:
+            :obj:`dict`: row
+        """
+        page_took = dt_sec_ago(obj=page_start, exact=True)
+
+        state["fetch_seconds_this_page"] = page_took
+        state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
+
+        rows = page.pop("assets", [])
+        state["rows_fetched_this_page"] = len(rows)
+        state["rows_fetched_total"] += state["rows_fetched_this_page"]
+        state["row_to_fetch_next"] += state["rows_fetched_this_page"]
+
+        if self.LOG.isEnabledFor(logging.DEBUG):
+            self.LOG.debug("FETCHED PAGE: %s", LazyFormat(json_dump, page))
+            self.LOG.debug("CURRENT PAGING STATE: %s", LazyFormat(json_dump, state))
+
+        self._emit_page(
+            values={
+                "rows": state["rows_fetched_this_page"],
+                "fetch_seconds": state["fetch_seconds_this_page"],
+            }
+        )
+
+        if not rows:
+            stop_msg = "no more rows returned"
+            state["stop_fetch"] = True
+            state["stop_msg"] = stop_msg
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+            return
 
-                if (
-                    state["max_rows"]
-                    and state["rows_processed_total"] >= state["max_rows"]
-                ):
-                    stop_msg = "'rows_processed_total' greater than 'max_rows'"
-                    state["stop_msg"] = stop_msg
-                    state["stop_fetch"] = True
-                    break
+        for row in rows:
+            yield row
 
-            if state["stop_fetch"]:
-                stop_msg = state["stop_msg"]
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
-                break
+            state["rows_processed_total"] += 1
 
-            if state["max_pages"] and state["page_number"] >= state["max_pages"]:
-                stop_msg = "'page_number' greater than 'max_pages'"
-                state["stop_fetch"] = True
+            if state["max_rows"] and state["rows_processed_total"] >= state["max_rows"]:
+                stop_msg = "'rows_processed_total' greater than 'max_rows'"
                 state["stop_msg"] = stop_msg
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
+                state["stop_fetch"] = True
                 break
 
-            state["page_number"] += 1
-            time.sleep(page_sleep)
+        if state["stop_fetch"]:
+            stop_msg = state["stop_msg"]
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
+            return
 
-        self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
-        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+        if state["max_pages"] and state["page_number"] >= state["max_pages"]:
+            stop_msg = "'page_number' greater than 'max_pages'"
+            state["stop_fetch"] = True
+            state["stop_msg"] = stop_msg
+            self.LOG.debug("STOPPED FETCH: %s", stop_msg)
 
 
 class ChildMixins:
@@ -471,6 +742,8 @@ class ChildMixins:
         self.auth = parent.auth
         self.router = parent.router
         self.request = parent.request
+        self.request_async = parent.request_async
+        self.request_stream = parent.request_stream
         self.LOG = parent.LOG.getChild(self.__class__.__name__)
         self._init(parent=parent)
 
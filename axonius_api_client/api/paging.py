@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""Helpers for fetching pages of objects from the REST API."""
+import concurrent.futures
+import itertools
+import queue
+import threading
+
+from ..logs import get_obj_log
+
+
+class PagePrefetcher:
+    """Fetch pages from a page iterator in a background thread.
+
+    Notes:
+        Pages are queued by a daemon thread so that network waits for the next
+        page(s) overlap with processing of the current page. Exceptions raised
+        while fetching are re-raised in the thread consuming the pages.
+    """
+
+    POLL_SECONDS = 0.1
+    """:obj:`float`: seconds to wait between checks for stop while queue is full"""
+
+    def __init__(self, pages, size, log_level="debug"):
+        """Fetch pages from a page iterator in a background thread.
+
+        Args:
+            pages (:obj:`typing.Iterator`): iterator that fetches pages
+            size (:obj:`int`): maximum number of fetched pages to keep queued
+            log_level (:obj:`str`, optional): default ``"debug"`` -
+                logging level for this object
+        """
+        self.LOG = get_obj_log(obj=self, level=log_level)
+        self.pages = pages
+        self.size = size
+        self.queue = queue.Queue(maxsize=size)
+        self.stopped = threading.Event()
+        self.finished = False
+        self.thread = threading.Thread(
+            target=self._run, name=f"{self.__class__.__name__}", daemon=True
+        )
+
+    def __str__(self):
+        """Show object info."""
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    def __repr__(self):
+        """Show object info."""
+        return self.__str__()
+
+    def __iter__(self):
+        """Start the fetch thread if not already started."""
+        if not self.thread.is_alive() and not self.finished:
+            self.thread.start()
+        return self
+
+    def __next__(self):
+        """Get the next page fetched by the fetch thread."""
+        if self.finished:
+            raise StopIteration
+
+        item = self.queue.get()
+
+        if isinstance(item, _Done):
+            self.finished = True
+            if item.exc is not None:
+                raise item.exc
+            raise StopIteration
+
+        return item
+
+    def close(self):
+        """Stop the fetch thread and discard any queued pages."""
+        self.stopped.set()
+        self.finished = True
+
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def _run(self):
+        exc = None
+        try:
+            for page in self.pages:
+                if not self._put(page):
+                    break
+        except Exception as err:
+            exc = err
+            self.LOG.debug(f"Exception while fetching pages: {err!r}")
+        finally:
+            close = getattr(self.pages, "close", None)
+            if callable(close):
+                close()
+            self._put(_Done(exc=exc))
+
+    def _put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=self.POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class PageSizer:
+    """Pick the size of the next page from how long the previous pages took.
+
+    Notes:
+        The seconds and bytes per row of each page are smoothed with an
+        exponential moving average, and the next page size is the number of
+        rows that should take **target_seconds** (and be under **target_bytes**
+        if supplied). A page size can change by at most :attr:`GROW` or
+        :attr:`SHRINK` times at once and always stays between **min_size**
+        and **max_size**. :meth:`backoff` shrinks the page size after a timeout
+        and lowers **max_size** to the new page size so the page size does not
+        grow back into timeouts.
+    """
+
+    GROW = 2.0
+    """:obj:`float`: most a page size can grow by after a page"""
+
+    SHRINK = 0.5
+    """:obj:`float`: most a page size can shrink by after a page or timeout"""
+
+    SMOOTHING = 0.5
+    """:obj:`float`: weight of the latest page in the moving averages"""
+
+    def __init__(
+        self,
+        page_size,
+        target_seconds,
+        min_size,
+        max_size,
+        target_bytes=None,
+        log_level="debug",
+    ):
+        """Pick the size of the next page from how long the previous pages took.
+
+        Args:
+            page_size (:obj:`int`): size of the first page
+            target_seconds (:obj:`float`): seconds each page should take to fetch
+            min_size (:obj:`int`): smallest page size to use
+            max_size (:obj:`int`): largest page size to use
+            target_bytes (:obj:`int`, optional): default ``None`` - if supplied,
+                keep the response of each page under this many bytes
+            log_level (:obj:`str`, optional): default ``"debug"`` -
+                logging level for this object
+        """
+        self.LOG = get_obj_log(obj=self, level=log_level)
+        self.min_size = max(1, min(min_size, max_size))
+        self.max_size = max_size
+        self.page_size = self._clamp(page_size)
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.row_seconds = None
+        self.row_bytes = None
+
+    def __str__(self):
+        """Show object info."""
+        return (
+            f"{self.__class__.__name__}(page_size={self.page_size}, "
+            f"target_seconds={self.target_seconds}, min_size={self.min_size}, "
+            f"max_size={self.max_size})"
+        )
+
+    def __repr__(self):
+        """Show object info."""
+        return self.__str__()
+
+    def update(self, seconds, rows, size=None):
+        """Measure a fetched page and get the size of the next page.
+
+        Args:
+            seconds (:obj:`float`): seconds it took to fetch the page
+            rows (:obj:`int`): number of rows in the page
+            size (:obj:`int`, optional): default ``None`` - bytes in the response
+
+        Returns:
+            :obj:`int`: size of the next page
+        """
+        if not rows:
+            return self.page_size
+
+        self.row_seconds = self._smooth(self.row_seconds, seconds / rows)
+        wanted = self.target_seconds / max(self.row_seconds, 1e-6)
+
+        if size and self.target_bytes:
+            self.row_bytes = self._smooth(self.row_bytes, size / rows)
+            wanted = min(wanted, self.target_bytes / max(self.row_bytes, 1))
+
+        wanted = min(wanted, self.page_size * self.GROW)
+        wanted = max(wanted, self.page_size * self.SHRINK)
+        return self._set(wanted, f"{rows} rows took {seconds:.2f} seconds")
+
+    def backoff(self):
+        """Shrink the page size after a page timed out.
+
+        Returns:
+            :obj:`int`: size of the next page, or ``None`` if already at min_size
+        """
+        if self.page_size <= self.min_size:
+            return None
+        page_size = self._set(self.page_size * self.SHRINK, "page timed out")
+        self.max_size = page_size
+        return page_size
+
+    def _set(self, page_size, reason):
+        page_size = self._clamp(page_size)
+        if page_size != self.page_size:
+            self.LOG.debug(
+                f"CHANGED PAGE SIZE {self.page_size} to {page_size} ({reason})"
+            )
+        self.page_size = page_size
+        return page_size
+
+    def _clamp(self, page_size):
+        return int(max(self.min_size, min(self.max_size, page_size)))
+
+    def _smooth(self, current, value):
+        if current is None:
+            return value
+        return (self.SMOOTHING * value) + ((1 - self.SMOOTHING) * current)
+
+
+def fetch_concurrent(fetch, args, workers, ordered=True, window=None):
+    """Call a fetch function for each item in args over a bounded thread pool.
+
+    Args:
+        fetch (:obj:`callable`): function to call with each item from **args**
+        args (:obj:`typing.Iterable`): items to call **fetch** with
+        workers (:obj:`int`): number of threads to run **fetch** in
+        ordered (:obj:`bool`, optional): default ``True`` -
+
+            * True: yield results in the same order as **args**
+            * False: yield results in the order they finish
+
+        window (:obj:`int`, optional): default ``None`` - maximum number of calls
+            to submit before their results are consumed, ``None`` will use twice
+            the number of **workers**
+
+    Notes:
+        Submissions are limited to **window** so that results pile up no further
+        than that when the consumer is slower than the fetches. Any calls not yet
+        started are cancelled when the consumer stops iterating.
+
+    Yields:
+        :obj:`object`: return of **fetch** for each item in **args**
+    """
+    window = window or workers * 2
+    args = iter(args)
+    pending = []
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="fetch_concurrent"
+    )
+
+    def submit(count):
+        for arg in itertools.islice(args, count):
+            pending.append(executor.submit(fetch, arg))
+
+    try:
+        submit(count=window)
+
+        while pending:
+            if ordered:
+                future = pending.pop(0)
+            else:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                future = [x for x in pending if x in done][0]
+                pending.remove(future)
+
+            result = future.result()
+            submit(count=1)
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+class _Done:
+    """Marker put on the queue once the page iterator is exhausted."""
+
+    def __init__(self, exc=None):
+        self.exc = exc
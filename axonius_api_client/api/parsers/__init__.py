@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """API models for working with adapters and connections."""
-from . import adapters, config, fields, roles, tables
+from . import adapters, config, fields, roles, stream, tables
 
 __all__ = (
     "tables",
@@ -8,4 +8,5 @@ __all__ = (
     "adapters",
     "config",
     "roles",
+    "stream",
 )
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Parsers for decoding JSON responses incrementally as they are received."""
+import codecs
+import json
+
+from ...exceptions import JsonInvalid
+
+WHITESPACE = " \t\n\r"
+NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonStreamParser:
+    """Decode a JSON object from chunks and yield the items of one array key.
+
+    Notes:
+        Items of the array under **key** are yielded as soon as each one has been
+        fully received, so only the current item and the undecoded part of the
+        current chunk are held in memory. All other keys of the object are decoded
+        normally and stored in :attr:`data`, which is complete once iteration is
+        finished.
+    """
+
+    COMPACT_LEN = 1024 * 1024
+    """:obj:`int`: drop the decoded part of the buffer once it is this long"""
+
+    def __init__(self, chunks, key, encoding="utf-8"):
+        """Decode a JSON object from chunks and yield the items of one array key.
+
+        Args:
+            chunks (:obj:`typing.Iterable` of :obj:`bytes` or :obj:`str`): chunks
+                of the body of a response, i.e. from
+                :meth:`requests.Response.iter_content`
+            key (:obj:`str`): key of the JSON object that holds the array to yield
+                the items of
+            encoding (:obj:`str`, optional): default ``"utf-8"`` - encoding to
+                decode bytes chunks with
+        """
+        self.key = key
+        self.data = {}
+        """:obj:`dict`: all keys of the JSON object other than :attr:`key`"""
+
+        self.count = 0
+        """:obj:`int`: number of items yielded from the array under :attr:`key`"""
+
+        self.bytes = 0
+        """:obj:`int`: length of the chunks read so far, in bytes for bytes chunks"""
+
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._buf = ""
+        self._pos = 0
+        self._exhausted = False
+
+    def __iter__(self):
+        """Yield the items of the array under :attr:`key`."""
+        self._expect("{")
+
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+
+            if key == self.key:
+                yield from self._iter_array()
+            else:
+                self.data[key] = self._decode_value()
+
+            if self._expect(",}") == "}":
+                break
+
+    def _iter_array(self):
+        self._expect("[")
+
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode_value()
+            self.count += 1
+
+            if self._expect(",]") == "]":
+                break
+
+    def _fill(self):
+        if self._exhausted:
+            return False
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._buf += self._text_decoder.decode(b"", final=True)
+            self._exhausted = True
+            return False
+
+        self.bytes += len(chunk)
+
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+
+        if self._pos >= self.COMPACT_LEN:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        self._buf += chunk
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill():
+                return None
+
+    def _expect(self, chars):
+        char = self._peek()
+
+        if char is None or char not in chars:
+            found = "end of data" if char is None else repr(char)
+            raise JsonInvalid(
+                f"Expected one of {chars!r} at position {self._pos}, found {found}"
+            )
+
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill():
+                    raise JsonInvalid(f"Invalid JSON in response: {exc}")
+                continue
+
+            if self._is_complete(value=value, end=end) or not self._fill():
+                self._pos = end
+                return value
+
+    def _is_complete(self, value, end):
+        # a number that ends the buffer or is followed by a character that could
+        # continue it (i.e. "1." of "1.5") may be cut off at the end of a chunk
+        if end >= len(self._buf):
+            return False
+
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        return not (is_number and self._buf[end] in NUMBER_CHARS)
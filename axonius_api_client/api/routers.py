@@ -6,18 +6,22 @@ from ..tools import join_url
 class Router:
     """Simple object store for REST API routes."""
 
-    def __init__(self, object_type, base, version, **routes):
+    def __init__(self, object_type, base, version, group=None, **routes):
         """Object store for REST API routes.
 
         Args:
             object_type (:obj:`str`): object type for this set of routes
             base (:obj:`str`): base path for this set of routes
             version (:obj:`int`): api version for this set of routes
+            group (:obj:`str`, optional): default ``None`` - group of routes to
+                share rate limits with, see :obj:`axonius_api_client.http.RateLimits`,
+                ``None`` will use object_type
             **routes: routes for this object_type
         """
         self._version = version
         self._base = base
         self._object_type = object_type
+        self._group = group or object_type
         self.root = join_url(base, object_type)
         self._routes = ["root"]
         for k, v in routes.items():
@@ -32,7 +36,8 @@ class Router:
 
         """
         msg = "{obj.__class__.__module__}.{obj.__class__.__name__}"
-        msg += "(object_type={obj._object_type!r}, version={obj._version})"
+        msg += "(object_type={obj._object_type!r}, version={obj._version}"
+        msg += ", group={obj._group!r})"
         return msg.format(obj=self)
 
     def __repr__(self):
@@ -55,6 +60,7 @@ class ApiV1:
         object_type="users",
         base=base,
         version=version,
+        group="assets",
         by_id="{id}",
         cached="cached",
         count="count",
@@ -71,6 +77,7 @@ class ApiV1:
         base=base,
         cached="cached",
         version=version,
+        group="assets",
         by_id="{id}",
         count="count",
         views="views",
@@ -85,6 +92,7 @@ class ApiV1:
         object_type="actions",
         base=base,
         version=version,
+        group="enforcements",
         shell="shell",  # nosec
         deploy="deploy",
         upload_file="upload_file",
@@ -102,7 +110,9 @@ class ApiV1:
         config_get="{adapter_name_plugin}/config/{adapter_config_name}",
     )
 
-    alerts = Router(object_type="alerts", base=base, version=version)
+    alerts = Router(
+        object_type="alerts", base=base, version=version, group="enforcements"
+    )
 
     system = Router(
         object_type="system",
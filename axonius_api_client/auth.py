@@ -4,9 +4,8 @@ import abc
 
 from .api.routers import API_VERSION
 from .constants import LOG_LEVEL_AUTH
-from .exceptions import (AlreadyLoggedIn, AuthError, InvalidCredentials,
-                         NotLoggedIn)
-from .logs import get_obj_log
+from .exceptions import AlreadyLoggedIn, AuthError, InvalidCredentials, NotLoggedIn
+from .logs import LazyFormat, get_obj_log
 from .tools import json_reload
 
 
@@ -119,8 +118,8 @@ class Mixins:
         paths = [API_VERSION.system.meta_about, API_VERSION.devices.count]
         for path in paths:
             response = self.http(method="get", path=path)
-            body = json_reload(obj=response.text, error=False)
-            self.LOG.debug(f"Received auth path {path!r} body:\n{body}")
+            body = LazyFormat(json_reload, obj=response.text, error=False)
+            self.LOG.debug("Received auth path %r body:\n%s", path, body)
             if response.ok:
                 break
 
@@ -197,4 +196,4 @@ class ApiKey(Mixins, Model):
         self.http.session.headers["api-secret"] = self._creds["secret"]
         self._validate()
         self._logged_in = True
-        self.LOG.debug(f"Successfully logged in using {self._cred_fields}")
+        self.LOG.debug("Successfully logged in using %s", self._cred_fields)
@@ -5,12 +5,46 @@ import sys
 import click
 
 from .. import version
-from ..constants import (LOG_FILE_MAX_FILES, LOG_FILE_MAX_MB, LOG_FILE_NAME,
-                         LOG_FILE_PATH, LOG_LEVEL_API, LOG_LEVEL_AUTH,
-                         LOG_LEVEL_CONSOLE, LOG_LEVEL_FILE, LOG_LEVEL_HTTP,
-                         LOG_LEVEL_PACKAGE, LOG_LEVELS_STR, REQUEST_ATTR_MAP,
-                         RESPONSE_ATTR_MAP, TIMEOUT_CONNECT, TIMEOUT_RESPONSE)
+from ..constants import (
+    CIRCUIT_FAILURES,
+    CIRCUIT_SECONDS,
+    FIELDS_CACHE_DISK_TTL,
+    FIELDS_CACHE_TTL,
+    HISTORY_MAX_BYTES,
+    HISTORY_MAX_COUNT,
+    HISTORY_METADATA,
+    KEEPALIVE,
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
+    LOG_FILE_MAX_FILES,
+    LOG_FILE_MAX_MB,
+    LOG_FILE_NAME,
+    LOG_FILE_PATH,
+    LOG_LEVEL_API,
+    LOG_LEVEL_AUTH,
+    LOG_LEVEL_CONSOLE,
+    LOG_LEVEL_FILE,
+    LOG_LEVEL_HTTP,
+    LOG_LEVEL_PACKAGE,
+    LOG_LEVELS_STR,
+    MAX_IN_FLIGHT,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_BURST,
+    RATE_LIMIT,
+    REQUEST_ATTR_MAP,
+    RESPONSE_ATTR_MAP,
+    RETRIES,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from ..logs import LOG
+from ..metrics import Metrics, MetricsAggregator
 from . import context, grp_adapters, grp_assets, grp_system, grp_tools
 
 
@@ -284,6 +318,231 @@ All of the options listed above must be supplied BEFORE any commands or groups.
     type=click.INT,
     show_default=True,
 )
+@click.option(
+    "--retries",
+    "retries",
+    default=RETRIES,
+    help="Times to retry requests that fail with a network error or retry status",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-backoff",
+    "retry_backoff",
+    default=RETRY_BACKOFF,
+    help="Seconds to wait before the first retry, doubled for each retry",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-backoff-max",
+    "retry_backoff_max",
+    default=RETRY_BACKOFF_MAX,
+    help="Most seconds to wait before a retry",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-status",
+    "retry_statuses",
+    default=RETRY_STATUSES,
+    help="Response status codes to retry requests for (multiples)",
+    type=click.INT,
+    multiple=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--circuit-failures",
+    "circuit_failures",
+    default=CIRCUIT_FAILURES,
+    help="Stop sending requests after N failures in a row (0 = never)",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--circuit-seconds",
+    "circuit_seconds",
+    default=CIRCUIT_SECONDS,
+    help="Seconds to stop sending requests for after --circuit-failures",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--rate-limit",
+    "rate_limit",
+    default=RATE_LIMIT,
+    help="Requests per second to send for each group of routes (0 = no limit)",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--rate-burst",
+    "rate_burst",
+    default=RATE_BURST,
+    help="Requests that can be sent at once under --rate-limit",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--max-in-flight",
+    "max_in_flight",
+    default=MAX_IN_FLIGHT,
+    help="Requests in progress at once for each group of routes (0 = no limit)",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--group-rate-limit",
+    "group_rate_limits",
+    help="Requests per second for a group of routes, i.e. assets=5 (multiples)",
+    type=context.SplitEquals(),
+    multiple=True,
+    show_envvar=True,
+)
+@click.option(
+    "--group-max-in-flight",
+    "group_max_in_flight",
+    help="Requests in progress at once for a group of routes, i.e. assets=4 "
+    "(multiples)",
+    type=context.SplitEquals(),
+    multiple=True,
+    show_envvar=True,
+)
+@click.option(
+    "--pool-connections",
+    "pool_connections",
+    default=POOL_CONNECTIONS,
+    help="Connection pools (one per host) to keep",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--pool-maxsize",
+    "pool_maxsize",
+    default=POOL_MAXSIZE,
+    help="Connections to keep open to each host",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--pool-block/--no-pool-block",
+    "pool_block",
+    default=POOL_BLOCK,
+    help="Wait for a free connection instead of opening one past --pool-maxsize",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keepalive/--no-keepalive",
+    "keepalive",
+    default=KEEPALIVE,
+    help="Send TCP keep-alive probes on idle connections",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keepalive-idle",
+    "keepalive_idle",
+    default=KEEPALIVE_IDLE,
+    help="Seconds a connection is idle before sending keep-alive probes",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keepalive-interval",
+    "keepalive_interval",
+    default=KEEPALIVE_INTERVAL,
+    help="Seconds in between keep-alive probes",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keepalive-count",
+    "keepalive_count",
+    default=KEEPALIVE_COUNT,
+    help="Unanswered keep-alive probes before a connection is dropped",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--history-max-count",
+    "history_max_count",
+    default=HISTORY_MAX_COUNT,
+    help="Responses to keep in the request history of the shell (0 = no limit)",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--history-max-bytes",
+    "history_max_bytes",
+    default=HISTORY_MAX_BYTES,
+    help="Body bytes to keep in the request history of the shell (0 = no limit)",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--history-metadata/--no-history-metadata",
+    "history_metadata",
+    default=HISTORY_METADATA,
+    help="Keep only the metadata of responses in the request history of the shell",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--metrics-file",
+    "metrics_file",
+    default=None,
+    help="Write p50/p95/p99 of request, decode and page timings to this file in "
+    "Prometheus text format when the command finishes",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    show_envvar=True,
+)
+@click.option(
+    "--fields-cache-ttl",
+    "fields_cache_ttl",
+    default=FIELDS_CACHE_TTL,
+    help="Seconds to cache the fields of each asset type in memory",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--fields-cache-path",
+    "fields_cache_path",
+    default=None,
+    help="Path to cache the fields of each asset type on disk",
+    type=click.Path(file_okay=False, resolve_path=True),
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--fields-cache-disk-ttl",
+    "fields_cache_disk_ttl",
+    default=FIELDS_CACHE_DISK_TTL,
+    help="Seconds to use the fields of each asset type cached on disk",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
 @click.version_option(version.__version__)
 @context.pass_context
 @click.pass_context
@@ -316,6 +575,31 @@ def cli(
     wraperror,
     timeout_connect,
     timeout_response,
+    retries,
+    retry_backoff,
+    retry_backoff_max,
+    retry_statuses,
+    circuit_failures,
+    circuit_seconds,
+    rate_limit,
+    rate_burst,
+    max_in_flight,
+    group_rate_limits,
+    group_max_in_flight,
+    pool_connections,
+    pool_maxsize,
+    pool_block,
+    keepalive,
+    keepalive_idle,
+    keepalive_interval,
+    keepalive_count,
+    history_max_count,
+    history_max_bytes,
+    history_metadata,
+    metrics_file,
+    fields_cache_ttl,
+    fields_cache_path,
+    fields_cache_disk_ttl,
     quiet,
 ):
     """Command line interface for the Axonius API Client."""
@@ -348,6 +632,46 @@ def cli(
     ctx._connect_args["wraperror"] = wraperror
     ctx._connect_args["timeout_connect"] = timeout_connect
     ctx._connect_args["timeout_response"] = timeout_response
+    ctx._connect_args["retries"] = retries
+    ctx._connect_args["retry_backoff"] = retry_backoff
+    ctx._connect_args["retry_backoff_max"] = retry_backoff_max
+    ctx._connect_args["retry_statuses"] = list(retry_statuses)
+    ctx._connect_args["circuit_failures"] = circuit_failures
+    ctx._connect_args["circuit_seconds"] = circuit_seconds
+    ctx._connect_args["rate_limit"] = rate_limit
+    ctx._connect_args["rate_burst"] = rate_burst
+    ctx._connect_args["max_in_flight"] = max_in_flight
+    ctx._connect_args["rate_limits"] = rate_limits = {}
+
+    try:
+        for group, value in group_rate_limits:
+            rate_limits.setdefault(group, {})["rate"] = float(value)
+
+        for group, value in group_max_in_flight:
+            rate_limits.setdefault(group, {})["max_in_flight"] = int(value)
+    except ValueError as exc:
+        raise click.BadParameter(f"Invalid group limit: {exc}")
+    ctx._connect_args["pool_connections"] = pool_connections
+    ctx._connect_args["pool_maxsize"] = pool_maxsize
+    ctx._connect_args["pool_block"] = pool_block
+    ctx._connect_args["keepalive"] = keepalive
+    ctx._connect_args["keepalive_idle"] = keepalive_idle
+    ctx._connect_args["keepalive_interval"] = keepalive_interval
+    ctx._connect_args["keepalive_count"] = keepalive_count
+    ctx._connect_args["history_max_count"] = history_max_count
+    ctx._connect_args["history_max_bytes"] = history_max_bytes
+    ctx._connect_args["history_metadata"] = history_metadata
+
+    if metrics_file:
+        metrics = Metrics()
+        aggregator = MetricsAggregator(labels=["group"])
+        metrics.subscribe(aggregator)
+        click_ctx.call_on_close(lambda: aggregator.write_prometheus(path=metrics_file))
+        ctx._connect_args["metrics"] = metrics
+
+    ctx._connect_args["fields_cache_ttl"] = fields_cache_ttl
+    ctx._connect_args["fields_cache_path"] = fields_cache_path
+    ctx._connect_args["fields_cache_disk_ttl"] = fields_cache_disk_ttl
 
 
 cli.add_command(grp_adapters.adapters)
@@ -2,11 +2,26 @@
 """Command line interface for Axonius API Client."""
 import tabulate
 
-from ...constants import (FIELD_JOINER, FIELD_TRIM_LEN, TABLE_FORMAT,
-                          TABLE_MAX_ROWS)
+from ...constants import (
+    EXPORT_BUFFER_SIZE,
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    TABLE_FORMAT,
+    TABLE_MAX_ROWS,
+    TABLE_STREAM_SIZE,
+    TABLE_STREAM_WIDTH,
+    TAGS_STREAM_SIZE,
+)
 from ..context import CONTEXT_SETTINGS, click
-from ..options import (AUTH, EXPORT, FIELDS_SELECT, PAGING, add_options,
-                       get_option_fields_default, get_option_help)
+from ..options import (
+    AUTH,
+    EXPORT,
+    FIELDS_SELECT,
+    PAGING,
+    add_options,
+    get_option_fields_default,
+    get_option_help,
+)
 
 HISTORY_DATE = click.option(
     "--history-date",
@@ -54,7 +69,9 @@ GET_EXPORT = [
         "export",
         default="json",
         help="Formatter to use when exporting asset data",
-        type=click.Choice(["csv", "json", "table", "json_to_csv"]),
+        type=click.Choice(
+            ["csv", "json", "table", "json_to_csv", "columnar", "sqlite"]
+        ),
         show_envvar=True,
         show_default=True,
     ),
@@ -78,6 +95,36 @@ GET_EXPORT = [
         type=click.INT,
         hidden=False,
     ),
+    click.option(
+        "--table-stream/--no-table-stream",
+        "table_stream",
+        default=False,
+        help="Print --export-format=table in pages as rows are fetched",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--table-stream-size",
+        "table_stream_size",
+        default=TABLE_STREAM_SIZE,
+        help="Rows per page for --table-stream, column widths use the first page",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--table-stream-width",
+        "table_stream_width",
+        default=TABLE_STREAM_WIDTH,
+        help="Maximum column width for --table-stream, wider cells are truncated",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
     click.option(
         "--table-api-fields/--no-table-api-fields",
         "table_api_fields",
@@ -108,6 +155,115 @@ GET_EXPORT = [
         show_default=True,
         hidden=False,
     ),
+    click.option(
+        "--columnar-format",
+        "columnar_format",
+        default="auto",
+        help="File format for --export-format=columnar (parquet/arrow need pyarrow)",
+        type=click.Choice(["auto", "parquet", "arrow", "json"]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--columnar-row-group-size",
+        "columnar_row_group_size",
+        default=10000,
+        help="Rows per row group for --export-format=columnar",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--columnar-compression",
+        "columnar_compression",
+        default="snappy",
+        help="Parquet compression for --export-format=columnar",
+        type=click.Choice(["snappy", "gzip", "zstd", "lz4", "brotli", "none"]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-table",
+        "sqlite_table",
+        default=None,
+        help="Table name for --export-format=sqlite (default: asset type)",
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-batch-size",
+        "sqlite_batch_size",
+        default=1000,
+        help="Rows per transaction for --export-format=sqlite",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-index",
+        "sqlite_indexes",
+        default=["internal_axon_id"],
+        help="Column to index for --export-format=sqlite (multiples)",
+        multiple=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-compress",
+        "export_compress",
+        default=None,
+        help="Compress --export-file (default: based on file suffix .gz/.zst/.lz4)",
+        type=click.Choice(["none", "gzip", "zstd", "lz4"]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-compress-level",
+        "export_compress_level",
+        default=None,
+        help="Compression level to use for --export-compress",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-buffer-size",
+        "export_buffer_size",
+        default=EXPORT_BUFFER_SIZE,
+        help="Bytes to buffer before writing to --export-file",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--json-backend",
+        "json_backend",
+        default="json",
+        help="Serializer to use for --export-format=json (orjson must be installed)",
+        type=click.Choice(["json", "orjson", "auto"]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--json-to-csv-compress/--no-json-to-csv-compress",
+        "json_to_csv_compress",
+        default=False,
+        help="Compress the temporary file used by --export-format=json_to_csv",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--titles/--no-titles",
         "field_titles",
@@ -230,6 +386,26 @@ GET_EXPORT = [
         hidden=False,
         metavar="TAG",
     ),
+    click.option(
+        "--tag-stream/--no-tag-stream",
+        "tags_stream",
+        help="Add/remove tags in the background while assets are fetched",
+        is_flag=True,
+        default=False,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--tag-stream-size",
+        "tags_stream_size",
+        help="Add/remove tags in the background every N assets with --tag-stream",
+        default=TAGS_STREAM_SIZE,
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--include-details/--no-include-details",
         "-id/-nid",
@@ -2,7 +2,19 @@
 """Command line interface for Axonius API Client."""
 import click
 
-from ..constants import DEFAULT_NODE, DEFAULT_PATH, MAX_PAGE_SIZE
+from ..constants import (
+    CHECKPOINT_PAGES,
+    DEFAULT_NODE,
+    DEFAULT_PATH,
+    MAX_PAGE_SIZE,
+    PAGE_ADAPTIVE,
+    PAGE_PREFETCH,
+    PAGE_SIZE_MIN,
+    PAGE_TARGET_SECONDS,
+    PAGE_WORKERS,
+    ROW_CHUNK_SIZE,
+    ROW_WORKERS,
+)
 from ..tools import coerce_int
 from . import context
 from .helps import HELPSTRS
@@ -242,6 +254,118 @@ PAGING = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--prefetch-pages",
+        "prefetch_pages",
+        default=PAGE_PREFETCH,
+        type=click.INT,
+        help="Fetch up to N pages in the background while processing rows",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-workers",
+        "page_workers",
+        default=PAGE_WORKERS,
+        type=click.INT,
+        help="Fetch pages concurrently using N threads (req: --no-use-cursor)",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-ordered/--no-page-ordered",
+        "page_ordered",
+        default=True,
+        help="Process pages fetched concurrently in page order",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-stream/--no-page-stream",
+        "page_stream",
+        default=False,
+        help="Decode rows as they are received instead of a page at a time",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-adaptive/--no-page-adaptive",
+        "page_adaptive",
+        default=PAGE_ADAPTIVE,
+        help="Change the page size based on how long each page takes to fetch",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-target-seconds",
+        "page_target_seconds",
+        default=PAGE_TARGET_SECONDS,
+        type=click.FLOAT,
+        help="Seconds each page should take to fetch for --page-adaptive",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-size-min",
+        "page_size_min",
+        default=PAGE_SIZE_MIN,
+        type=click.INT,
+        help="Smallest page size to use for --page-adaptive",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-target-bytes",
+        "page_target_bytes",
+        default=None,
+        type=click.INT,
+        help="Keep the response of each page under N bytes for --page-adaptive",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--row-workers",
+        "row_workers",
+        default=ROW_WORKERS,
+        type=click.INT,
+        help="Transform rows (flatten, explode, etc) using N processes",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--row-chunk-size",
+        "row_chunk_size",
+        default=ROW_CHUNK_SIZE,
+        type=click.INT,
+        help="Rows to send to a process at a time for --row-workers",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--checkpoint-file",
+        "checkpoint_file",
+        default=None,
+        help="Save progress to this file so the export can be resumed",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--checkpoint-pages",
+        "checkpoint_pages",
+        default=CHECKPOINT_PAGES,
+        type=click.INT,
+        help="Save progress to --checkpoint-file every N pages",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--resume/--no-resume",
+        "resume",
+        default=False,
+        help="Resume from --checkpoint-file if it exists",
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 SPLIT_CONFIG_OPT = click.option(
@@ -9,10 +9,42 @@ from .api.assets import Devices, Users
 from .api.enforcements import Enforcements
 from .api.system import System
 from .auth import ApiKey
-from .constants import (LOG_FILE_MAX_FILES, LOG_FILE_MAX_MB, LOG_FILE_NAME,
-                        LOG_FILE_PATH, LOG_LEVEL_API, LOG_LEVEL_AUTH,
-                        LOG_LEVEL_CONSOLE, LOG_LEVEL_FILE, LOG_LEVEL_HTTP,
-                        LOG_LEVEL_PACKAGE, TIMEOUT_CONNECT, TIMEOUT_RESPONSE)
+from .constants import (
+    CIRCUIT_FAILURES,
+    CIRCUIT_SECONDS,
+    FIELDS_CACHE_DISK_TTL,
+    FIELDS_CACHE_PATH,
+    FIELDS_CACHE_TTL,
+    HISTORY_MAX_BYTES,
+    HISTORY_MAX_COUNT,
+    HISTORY_METADATA,
+    KEEPALIVE,
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
+    LOG_FILE_MAX_FILES,
+    LOG_FILE_MAX_MB,
+    LOG_FILE_NAME,
+    LOG_FILE_PATH,
+    LOG_LEVEL_API,
+    LOG_LEVEL_AUTH,
+    LOG_LEVEL_CONSOLE,
+    LOG_LEVEL_FILE,
+    LOG_LEVEL_HTTP,
+    LOG_LEVEL_PACKAGE,
+    MAX_IN_FLIGHT,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_BURST,
+    RATE_LIMIT,
+    RETRIES,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from .exceptions import ConnectError, InvalidCredentials
 from .http import Http
 from .logs import LOG, add_file, add_stderr, get_obj_log, set_log_level
@@ -38,6 +70,23 @@ class Connect:
         wraperror=True,
         timeout_connect=TIMEOUT_CONNECT,
         timeout_response=TIMEOUT_RESPONSE,
+        retries=RETRIES,
+        retry_backoff=RETRY_BACKOFF,
+        retry_backoff_max=RETRY_BACKOFF_MAX,
+        retry_statuses=RETRY_STATUSES,
+        circuit_failures=CIRCUIT_FAILURES,
+        circuit_seconds=CIRCUIT_SECONDS,
+        rate_limit=RATE_LIMIT,
+        rate_burst=RATE_BURST,
+        max_in_flight=MAX_IN_FLIGHT,
+        rate_limits=None,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=POOL_BLOCK,
+        keepalive=KEEPALIVE,
+        keepalive_idle=KEEPALIVE_IDLE,
+        keepalive_interval=KEEPALIVE_INTERVAL,
+        keepalive_count=KEEPALIVE_COUNT,
         certpath=None,
         certverify=False,
         certwarn=True,
@@ -46,6 +95,10 @@ class Connect:
         cert_client_both=None,
         proxy=None,
         save_history=False,
+        history_max_count=HISTORY_MAX_COUNT,
+        history_max_bytes=HISTORY_MAX_BYTES,
+        history_metadata=HISTORY_METADATA,
+        metrics=None,
         log_level="debug",
         log_request_attrs=None,
         log_response_attrs=None,
@@ -64,6 +117,9 @@ class Connect:
         log_file_path=LOG_FILE_PATH,
         log_file_max_mb=LOG_FILE_MAX_MB,
         log_file_max_files=LOG_FILE_MAX_FILES,
+        fields_cache_ttl=FIELDS_CACHE_TTL,
+        fields_cache_path=FIELDS_CACHE_PATH,
+        fields_cache_disk_ttl=FIELDS_CACHE_DISK_TTL,
     ):
         """Easy all-in-one connection handler.
 
@@ -77,6 +133,50 @@ class Connect:
             timeout_response (:obj:`int`, optional):
                 default :data:`TIMEOUT_RESPONSE` - seconds to
                 wait for responses from :attr:`url`
+            retries (:obj:`int`, optional): default :data:`RETRIES` -
+                times to retry requests that fail with a network error or a status
+                code in retry_statuses, see :obj:`axonius_api_client.http.RetryPolicy`
+            retry_backoff (:obj:`float`, optional): default :data:`RETRY_BACKOFF` -
+                seconds to wait before the first retry, doubled for each retry
+            retry_backoff_max (:obj:`float`, optional):
+                default :data:`RETRY_BACKOFF_MAX` - most seconds to wait before a
+                retry
+            retry_statuses (:obj:`list` of :obj:`int`, optional):
+                default :data:`RETRY_STATUSES` - response status codes to retry
+            circuit_failures (:obj:`int`, optional):
+                default :data:`CIRCUIT_FAILURES` - failed requests in a row that
+                stop requests from being sent for circuit_seconds
+            circuit_seconds (:obj:`float`, optional):
+                default :data:`CIRCUIT_SECONDS` - seconds to stop sending
+                requests for once circuit_failures requests failed in a row
+            rate_limit (:obj:`float`, optional): default :data:`RATE_LIMIT` -
+                requests per second to send for each group of routes, shared by
+                all threads using this object
+            rate_burst (:obj:`int`, optional): default :data:`RATE_BURST` -
+                requests that can be sent at once under rate_limit
+            max_in_flight (:obj:`int`, optional): default :data:`MAX_IN_FLIGHT` -
+                requests in progress at once for each group of routes
+            rate_limits (:obj:`dict`, optional): default ``None`` - rate, burst and
+                max_in_flight for specific groups of routes (i.e. ``"assets"``,
+                ``"adapters"``, ``"system"``), see
+                :obj:`axonius_api_client.http.RateLimits`
+            pool_connections (:obj:`int`, optional):
+                default :data:`POOL_CONNECTIONS` - number of connection pools
+                (one per host) to keep
+            pool_maxsize (:obj:`int`, optional): default :data:`POOL_MAXSIZE` -
+                number of connections to keep open to each host
+            pool_block (:obj:`bool`, optional): default :data:`POOL_BLOCK` -
+                wait for a free connection instead of opening one past
+                pool_maxsize
+            keepalive (:obj:`bool`, optional): default :data:`KEEPALIVE` -
+                send TCP keep-alive probes on idle connections
+            keepalive_idle (:obj:`int`, optional): default :data:`KEEPALIVE_IDLE` -
+                seconds a connection is idle before sending keep-alive probes
+            keepalive_interval (:obj:`int`, optional):
+                default :data:`KEEPALIVE_INTERVAL` - seconds in between probes
+            keepalive_count (:obj:`int`, optional):
+                default :data:`KEEPALIVE_COUNT` - unanswered probes before a
+                connection is dropped
             wraperror (:obj:`bool`, optional): default ``True``
 
                 * if ``True`` wrap exceptions so that they are more user friendly
@@ -112,6 +212,20 @@ class Connect:
                   :attr:`axonius_api_client.http.Http.HISTORY`
                 * if ``False`` do not append responses to
                   :attr:`axonius_api_client.http.Http.HISTORY`
+            history_max_count (:obj:`int`, optional):
+                default :data:`HISTORY_MAX_COUNT` - responses to keep in
+                :attr:`axonius_api_client.http.Http.HISTORY`, 0 for no limit
+            history_max_bytes (:obj:`int`, optional):
+                default :data:`HISTORY_MAX_BYTES` - request and response body
+                bytes to keep in :attr:`axonius_api_client.http.Http.HISTORY`,
+                0 for no limit
+            history_metadata (:obj:`bool`, optional):
+                default :data:`HISTORY_METADATA` - keep only the metadata of
+                responses in :attr:`axonius_api_client.http.Http.HISTORY`
+            metrics (:obj:`axonius_api_client.metrics.Metrics`, optional):
+                default ``None`` - event bus to emit instrumentation events to,
+                ``None`` will create one in
+                :attr:`axonius_api_client.http.Http.METRICS`
             log_request_attrs (:obj:`bool`): default ``None`` - control logging
               of request attributes:
 
@@ -182,6 +296,15 @@ class Connect:
             log_file_max_files (:obj:`str`, optional):
                 default :data:`axonius_api_client.LOG_FILE_MAX_FILES`
                 number of rollover file logs to keep
+            fields_cache_ttl (:obj:`int`, optional):
+                default :data:`axonius_api_client.constants.FIELDS_CACHE_TTL`
+                seconds to cache the fields of each asset type in memory
+            fields_cache_path (:obj:`str`, optional):
+                default :data:`axonius_api_client.constants.FIELDS_CACHE_PATH`
+                path to cache the fields of each asset type on disk
+            fields_cache_disk_ttl (:obj:`int`, optional):
+                default :data:`axonius_api_client.constants.FIELDS_CACHE_DISK_TTL`
+                seconds to use the fields cached on disk
         """
         self.LOG = get_obj_log(obj=self, level=log_level)
         self._started = False
@@ -222,8 +345,29 @@ class Connect:
             "log_request_body": log_request_body,
             "log_response_body": log_response_body,
             "save_history": save_history,
+            "history_max_count": history_max_count,
+            "history_max_bytes": history_max_bytes,
+            "history_metadata": history_metadata,
+            "metrics": metrics,
             "connect_timeout": timeout_connect,
             "response_timeout": timeout_response,
+            "retries": retries,
+            "retry_backoff": retry_backoff,
+            "retry_backoff_max": retry_backoff_max,
+            "retry_statuses": retry_statuses,
+            "circuit_failures": circuit_failures,
+            "circuit_seconds": circuit_seconds,
+            "rate_limit": rate_limit,
+            "rate_burst": rate_burst,
+            "max_in_flight": max_in_flight,
+            "rate_limits": rate_limits,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keepalive": keepalive,
+            "keepalive_idle": keepalive_idle,
+            "keepalive_interval": keepalive_interval,
+            "keepalive_count": keepalive_count,
         }
 
         self._auth_args = {"key": key, "secret": secret, "log_level": log_level_auth}
@@ -232,7 +376,13 @@ class Connect:
 
         self._auth = ApiKey(http=self._http, **self._auth_args)
 
-        self._api_args = {"auth": self._auth, "log_level": log_level_api}
+        self._api_args = {
+            "auth": self._auth,
+            "log_level": log_level_api,
+            "fields_cache_ttl": fields_cache_ttl,
+            "fields_cache_path": fields_cache_path,
+            "fields_cache_disk_ttl": fields_cache_disk_ttl,
+        }
 
     def start(self):
         """Connect to and authenticate with Axonius."""
@@ -59,6 +59,50 @@ MAX_PAGE_SIZE = 2000
 PAGE_SIZE = MAX_PAGE_SIZE
 PAGE_SLEEP = 0
 PAGE_CACHE = False
+PAGE_PREFETCH = 0
+""":obj:`int`: number of pages to fetch in the background while processing rows"""
+
+PAGE_WORKERS = 1
+""":obj:`int`: number of threads to fetch pages with when not using cursor paging"""
+
+PAGE_STREAM_CHUNK_SIZE = 64 * 1024
+""":obj:`int`: number of bytes to read at a time when decoding streamed pages"""
+
+PAGE_ADAPTIVE = False
+""":obj:`bool`: change the page size based on how long each page takes to fetch"""
+
+PAGE_TARGET_SECONDS = 10.0
+""":obj:`float`: seconds each page should take to fetch when using page_adaptive"""
+
+PAGE_SIZE_MIN = 100
+""":obj:`int`: smallest page size to use when using page_adaptive"""
+
+PAGE_TIMEOUT_RETRIES = 3
+""":obj:`int`: times to retry a page that timed out with a smaller page size"""
+
+ROW_WORKERS = 1
+""":obj:`int`: number of processes to transform rows with in the callbacks"""
+
+ROW_CHUNK_SIZE = 250
+""":obj:`int`: number of rows to send to a process at a time when using row_workers"""
+
+CHECKPOINT_PAGES = 1
+""":obj:`int`: number of pages to process in between saving checkpoints"""
+
+CHECKPOINT_VERSION = 1
+""":obj:`int`: version of the checkpoint files written by get_generator"""
+
+LABELS_BATCH_SIZE = 100
+""":obj:`int`: number of assets to add or remove labels for in each request"""
+
+LABELS_WORKERS = 1
+""":obj:`int`: number of threads to add or remove batches of labels with"""
+
+LABELS_RETRIES = 2
+""":obj:`int`: number of times to retry a batch of labels that failed"""
+
+LABELS_RETRY_SECONDS = 1
+""":obj:`int`: seconds to wait before retrying a batch, doubled for each retry"""
 
 GUI_PAGE_SIZES = [25, 50, 100]
 """:obj:`list` of :obj:`int`: valid page sizes for GUI paging"""
@@ -77,6 +121,7 @@ RESPONSE_ATTR_MAP = {
     "status": "{response.status_code!r}",
     "reason": "{response.reason!r}",
     "elapsed": "{response.elapsed}",
+    "retries": "{response.retries}",
     "headers": "{response.headers}",
 }
 
@@ -93,6 +138,85 @@ TIMEOUT_CONNECT = 5
 TIMEOUT_RESPONSE = 900
 """:obj:`int`: seconds to wait for response from API."""
 
+RETRIES = 0
+""":obj:`int`: times to retry a request that failed, 0 to never retry"""
+
+RETRY_BACKOFF = 0.5
+""":obj:`float`: seconds to wait before the first retry, doubled for each retry"""
+
+RETRY_BACKOFF_MAX = 30
+""":obj:`float`: most seconds to wait before a retry"""
+
+RETRY_STATUSES = [429, 502, 503, 504]
+""":obj:`list` of :obj:`int`: response status codes to retry requests for"""
+
+RETRY_METHODS = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+""":obj:`list` of :obj:`str`: idempotent methods that are safe to retry"""
+
+CIRCUIT_FAILURES = 0
+""":obj:`int`: failed requests in a row that open the circuit, 0 to never open it"""
+
+CIRCUIT_SECONDS = 30
+""":obj:`float`: seconds to refuse to send requests once the circuit opens"""
+
+RATE_LIMIT = 0
+""":obj:`float`: requests per second to send for each group of routes, 0 for no limit"""
+
+RATE_BURST = 0
+""":obj:`int`: requests that can be sent at once under RATE_LIMIT, 0 for RATE_LIMIT"""
+
+MAX_IN_FLIGHT = 0
+""":obj:`int`: requests in progress at once for each group of routes, 0 for no limit"""
+
+POOL_CONNECTIONS = 10
+""":obj:`int`: number of connection pools (one per host) to keep"""
+
+POOL_MAXSIZE = 10
+""":obj:`int`: number of connections to keep open to each host"""
+
+POOL_BLOCK = False
+""":obj:`bool`: wait for a free connection instead of opening one past POOL_MAXSIZE"""
+
+KEEPALIVE = False
+""":obj:`bool`: send TCP keep-alive probes on idle connections"""
+
+KEEPALIVE_IDLE = 60
+""":obj:`int`: seconds a connection is idle before sending keep-alive probes"""
+
+KEEPALIVE_INTERVAL = 10
+""":obj:`int`: seconds in between keep-alive probes"""
+
+KEEPALIVE_COUNT = 6
+""":obj:`int`: unanswered keep-alive probes before a connection is dropped"""
+
+HISTORY_MAX_COUNT = 1000
+""":obj:`int`: responses to keep in the history of Http, 0 for no limit"""
+
+HISTORY_MAX_BYTES = 50 * 1024 * 1024
+""":obj:`int`: request and response body bytes to keep in the history of Http,
+0 for no limit"""
+
+HISTORY_METADATA = False
+""":obj:`bool`: keep only the metadata of responses in the history of Http"""
+
+METRICS_QUANTILES = [0.5, 0.95, 0.99]
+""":obj:`list` of :obj:`float`: quantiles to summarize metrics with"""
+
+METRICS_MAX_SAMPLES = 10000
+""":obj:`int`: most recent values of each metric to keep for quantiles"""
+
+METRICS_PREFIX = "axonius_api_client"
+""":obj:`str`: prefix for the names of metrics exported in Prometheus format"""
+
+FIELDS_CACHE_TTL = 0
+""":obj:`int`: seconds to cache the fields of an asset type in memory, disabled if 0"""
+
+FIELDS_CACHE_PATH = None
+""":obj:`str`: path to cache the fields of an asset type on disk, disabled if None"""
+
+FIELDS_CACHE_DISK_TTL = 3600
+""":obj:`int`: seconds to use the fields of an asset type cached on disk"""
+
 LOG_FMT_VERBOSE = (
     "%(asctime)s %(levelname)-8s [%(name)s:%(funcName)s:%(lineno)d] %(message)s"
 )
@@ -199,6 +323,19 @@ FIELD_TRIM_STR = "...TRIMMED - {field_len} characters over {trim_len}"
 FIELD_JOINER = "\n"
 TABLE_FORMAT = "fancy_grid"
 TABLE_MAX_ROWS = 5
+TABLE_STREAM_SIZE = 50
+TABLE_STREAM_WIDTH = 40
+TABLE_STREAM_TRIM = "..."
+TAGS_STREAM_SIZE = 1000
+EXPORT_BUFFER_SIZE = 1024 * 1024
+EXPORT_COMPRESS_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".lz4": "lz4",
+}
+EXPORT_COMPRESS_LEVELS = {"gzip": 6, "zstd": 3, "lz4": 0}
 
 OK_ARGS = {"fg": "green", "bold": True, "err": True}
 
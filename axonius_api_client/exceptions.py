@@ -50,6 +50,10 @@ class HttpError(AxonError):
     """Errors for :mod:`.http`."""
 
 
+class HttpCircuitOpen(HttpError):
+    """Error when requests are refused because too many requests failed in a row."""
+
+
 class ConfigError(ApiError):
     """Pass."""
 
@@ -1,22 +1,53 @@
 # -*- coding: utf-8 -*-
 """HTTP client."""
+import asyncio
+import collections
+import datetime
+import email.utils
 import logging
+import os
+import random
+import socket
+import ssl
+import threading
+import time
 import warnings
 from urllib.parse import urlparse, urlunparse
 
 import requests
 
 from .constants import (
+    CIRCUIT_FAILURES,
+    CIRCUIT_SECONDS,
+    HISTORY_MAX_BYTES,
+    HISTORY_MAX_COUNT,
+    HISTORY_METADATA,
+    KEEPALIVE,
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
     LOG_LEVEL_HTTP,
     MAX_BODY_LEN,
+    MAX_IN_FLIGHT,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_BURST,
+    RATE_LIMIT,
     REQUEST_ATTR_MAP,
     RESPONSE_ATTR_MAP,
+    RETRIES,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    RETRY_METHODS,
+    RETRY_STATUSES,
     TIMEOUT_CONNECT,
     TIMEOUT_RESPONSE,
 )
-from .exceptions import HttpError
-from .logs import get_obj_log, set_log_level
-from .tools import join_url, json_reload, listify, path_read
+from .exceptions import HttpCircuitOpen, HttpError
+from .logs import LazyFormat, get_obj_log, set_log_level
+from .metrics import Metrics
+from .tools import dt_now, join_url, json_reload, listify, path_read
 from .version import __version__
 
 InsecureRequestWarning = requests.urllib3.exceptions.InsecureRequestWarning
@@ -46,6 +77,27 @@ class Http:
         log_response_attrs=None,
         log_request_body=False,
         log_response_body=False,
+        retries=RETRIES,
+        retry_backoff=RETRY_BACKOFF,
+        retry_backoff_max=RETRY_BACKOFF_MAX,
+        retry_statuses=RETRY_STATUSES,
+        circuit_failures=CIRCUIT_FAILURES,
+        circuit_seconds=CIRCUIT_SECONDS,
+        rate_limit=RATE_LIMIT,
+        rate_burst=RATE_BURST,
+        max_in_flight=MAX_IN_FLIGHT,
+        rate_limits=None,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=POOL_BLOCK,
+        keepalive=KEEPALIVE,
+        keepalive_idle=KEEPALIVE_IDLE,
+        keepalive_interval=KEEPALIVE_INTERVAL,
+        keepalive_count=KEEPALIVE_COUNT,
+        history_max_count=HISTORY_MAX_COUNT,
+        history_max_bytes=HISTORY_MAX_BYTES,
+        history_metadata=HISTORY_METADATA,
+        metrics=None,
     ):
         """HTTP client wrapper around :obj:`requests.Session`.
 
@@ -99,6 +151,18 @@ class Http:
 
                 * if ``True`` append responses to :attr:`HISTORY`
                 * if ``False`` do not append responses to :attr:`HISTORY`
+            history_max_count (:obj:`int`, optional):
+                default :data:`HISTORY_MAX_COUNT` - responses to keep in
+                :attr:`HISTORY`, 0 for no limit
+            history_max_bytes (:obj:`int`, optional):
+                default :data:`HISTORY_MAX_BYTES` - request and response body
+                bytes to keep in :attr:`HISTORY`, 0 for no limit
+            history_metadata (:obj:`bool`, optional):
+                default :data:`HISTORY_METADATA` - keep only the metadata of
+                responses in :attr:`HISTORY` instead of the responses
+            metrics (:obj:`axonius_api_client.metrics.Metrics`, optional):
+                default ``None`` - event bus to emit instrumentation events to,
+                ``None`` will create one
             log_level (:obj:`str`):
               default :data:`axonius_api_client.LOG_LEVEL_HTTP` -
               logging level to use for this objects logger
@@ -130,6 +194,47 @@ class Http:
 
               * if ``True``, log response bodies
               * if ``False``, do not log response bodies
+            retries (:obj:`int`, optional): default :data:`RETRIES` -
+                times to retry a request that failed, see :obj:`RetryPolicy`
+            retry_backoff (:obj:`float`, optional): default :data:`RETRY_BACKOFF` -
+                seconds to wait before the first retry, doubled for each retry
+            retry_backoff_max (:obj:`float`, optional):
+                default :data:`RETRY_BACKOFF_MAX` - most seconds to wait before a
+                retry
+            retry_statuses (:obj:`list` of :obj:`int`, optional):
+                default :data:`RETRY_STATUSES` - response status codes to retry
+            circuit_failures (:obj:`int`, optional):
+                default :data:`CIRCUIT_FAILURES` - failed requests in a row that
+                open the circuit and stop requests from being sent
+            circuit_seconds (:obj:`float`, optional):
+                default :data:`CIRCUIT_SECONDS` - seconds the circuit stays open
+            rate_limit (:obj:`float`, optional): default :data:`RATE_LIMIT` -
+                requests per second to send for each group of routes
+            rate_burst (:obj:`int`, optional): default :data:`RATE_BURST` -
+                requests that can be sent at once under rate_limit
+            max_in_flight (:obj:`int`, optional): default :data:`MAX_IN_FLIGHT` -
+                requests in progress at once for each group of routes
+            rate_limits (:obj:`dict`, optional): default ``None`` - rate, burst
+                and max_in_flight to use for specific groups of routes instead,
+                see :obj:`RateLimits`
+            pool_connections (:obj:`int`, optional):
+                default :data:`POOL_CONNECTIONS` - number of connection pools
+                (one per host) to keep
+            pool_maxsize (:obj:`int`, optional): default :data:`POOL_MAXSIZE` -
+                number of connections to keep open to each host, should be at
+                least the number of threads sending requests at once
+            pool_block (:obj:`bool`, optional): default :data:`POOL_BLOCK` -
+                if all pool_maxsize connections are in use, wait for one to be
+                free instead of opening a connection that is closed after use
+            keepalive (:obj:`bool`, optional): default :data:`KEEPALIVE` -
+                send TCP keep-alive probes on idle connections
+            keepalive_idle (:obj:`int`, optional): default :data:`KEEPALIVE_IDLE` -
+                seconds a connection is idle before sending keep-alive probes
+            keepalive_interval (:obj:`int`, optional):
+                default :data:`KEEPALIVE_INTERVAL` - seconds in between probes
+            keepalive_count (:obj:`int`, optional):
+                default :data:`KEEPALIVE_COUNT` - unanswered probes before a
+                connection is dropped
 
         Raises:
             :exc:`HttpError`: if either cert_client_cert or cert_client_key
@@ -156,8 +261,12 @@ class Http:
         self.LAST_RESPONSE = None
         """:obj:`requests.Response`: last response received"""
 
-        self.HISTORY = []
-        """:obj:`list` of :obj:`requests.Response`: all responses received."""
+        self.HISTORY = HttpHistory(
+            max_count=history_max_count,
+            max_bytes=history_max_bytes,
+            metadata=history_metadata,
+        )
+        """:obj:`HttpHistory`: the most recent responses received."""
 
         self.SAVE_LAST = save_last
         """:obj:`bool`: save requests to :attr:`LAST_REQUEST` and responses
@@ -175,6 +284,41 @@ class Http:
         self.session = requests.Session()
         """:obj:`requests.Session`: session object to use"""
 
+        self.adapter = PoolAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive=keepalive,
+            keepalive_idle=keepalive_idle,
+            keepalive_interval=keepalive_interval,
+            keepalive_count=keepalive_count,
+        )
+        """:obj:`PoolAdapter`: adapter that pools connections for :attr:`session`"""
+
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self.RETRY = RetryPolicy(
+            retries=retries,
+            backoff=retry_backoff,
+            backoff_max=retry_backoff_max,
+            statuses=retry_statuses,
+            circuit_failures=circuit_failures,
+            circuit_seconds=circuit_seconds,
+        )
+        """:obj:`RetryPolicy`: policy to retry failed requests with"""
+
+        self.LIMITS = RateLimits(
+            rate=rate_limit,
+            burst=rate_burst,
+            max_in_flight=max_in_flight,
+            groups=rate_limits,
+        )
+        """:obj:`RateLimits`: rate limits for each group of routes"""
+
+        self.METRICS = metrics if metrics is not None else Metrics()
+        """:obj:`axonius_api_client.metrics.Metrics`: event bus for instrumentation"""
+
         self.LOG_REQUEST_BODY = log_request_body
         """:obj:`bool`: Log the full request body."""
 
@@ -259,11 +403,153 @@ class Http:
                   defined in :attr:`session`
                 * cert (:obj:`str`): default ``None`` - use custom
                   client cert to offer to :attr:`url` cert defined in :attr:`session`
+                * stream (:obj:`bool`): default ``None`` - do not read the body of
+                  the response, the caller must read it and close the response,
+                  which also frees its slot in the limiter of **limit_group**
+                * idempotent (:obj:`bool`): default ``None`` - sending the request
+                  more than once has the same effect as sending it once, so it can
+                  be retried on any failure (i.e. a POST that only fetches data),
+                  ``None`` will check the method against
+                  :attr:`RetryPolicy.methods`
+                * limit_group (:obj:`str`): default ``None`` - group of routes
+                  in :attr:`LIMITS` to limit the request with
+
+        Raises:
+            :exc:`HttpCircuitOpen`: if the circuit of :attr:`RETRY` is open
 
         Returns:
             :obj:`requests.Response`: raw response object
 
         """
+        prepped_request = self._prepare_request(
+            path=path,
+            route=route,
+            method=method,
+            data=data,
+            params=params,
+            headers=headers,
+            json=json,
+            files=files,
+        )
+        send_args = self._get_send_args(prepped_request=prepped_request, **kwargs)
+        idempotent = self.RETRY.is_idempotent(
+            method=method, idempotent=kwargs.get("idempotent", None)
+        )
+        limiter = self.LIMITS.get(group=kwargs.get("limit_group", None))
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.RETRY.check(url=prepped_request.url)
+
+            try:
+                wait_start = time.perf_counter()
+                limiter.acquire()
+                try:
+                    send_start = time.perf_counter()
+                    response = self.session.send(**send_args)
+                    send_seconds = time.perf_counter() - send_start
+                except BaseException:
+                    limiter.release()
+                    raise
+
+                if send_args["stream"]:
+                    self._release_on_close(response=response, limiter=limiter)
+                else:
+                    limiter.release()
+            except requests.exceptions.RequestException as exc:
+                delay = self.RETRY.get_delay(
+                    attempt=attempt,
+                    idempotent=idempotent,
+                    error=exc,
+                    error_retry=self.RETRY.is_error_retry(error=exc),
+                    error_safe=self.RETRY.is_error_safe(error=exc),
+                )
+                if delay is None:
+                    self._emit_error(
+                        request=prepped_request,
+                        error=exc,
+                        attempt=attempt,
+                        limit_group=limiter.group,
+                    )
+                    raise
+
+                self.RETRY.log_retry(
+                    log=self.LOG,
+                    request=prepped_request,
+                    attempt=attempt,
+                    delay=delay,
+                    reason=repr(exc),
+                )
+                time.sleep(delay)
+                continue
+
+            delay = self.RETRY.get_delay(
+                attempt=attempt, idempotent=idempotent, response=response
+            )
+            if delay is None:
+                response.retries = attempt - 1
+                response.timings = self._get_timings(
+                    response=response,
+                    wait_seconds=send_start - wait_start,
+                    send_seconds=send_seconds,
+                    stream=send_args["stream"],
+                )
+                return self._process_response(
+                    response=response,
+                    stream=send_args["stream"],
+                    limit_group=limiter.group,
+                )
+
+            response.close()
+            self.RETRY.log_retry(
+                log=self.LOG,
+                request=prepped_request,
+                attempt=attempt,
+                delay=delay,
+                reason=f"{response.status_code} {response.reason}",
+            )
+            time.sleep(delay)
+
+    @staticmethod
+    def _release_on_close(response, limiter):
+        """Keep the slot of a streamed response in a limiter until it is closed.
+
+        Args:
+            response (:obj:`requests.Response`): streamed response
+            limiter (:obj:`RateLimiter`): limiter the request was sent with
+        """
+        close = response.close
+        lock = threading.Lock()
+        released = []
+
+        def close_release():
+            try:
+                close()
+            finally:
+                with lock:
+                    if not released:
+                        released.append(True)
+                        limiter.release()
+
+        response.close = close_release
+
+    def _prepare_request(
+        self,
+        path=None,
+        route=None,
+        method="get",
+        data=None,
+        params=None,
+        headers=None,
+        json=None,
+        files=None,
+    ):
+        """Create and prepare a request using :attr:`session`.
+
+        Returns:
+            :obj:`requests.PreparedRequest`: prepared request object
+        """
         url = join_url(self.url, path, route)
 
         headers = headers or {}
@@ -279,15 +565,32 @@ class Http:
             files=files or [],
         )
         prepped_request = self.session.prepare_request(request=request)
-        prepped_request.body_size = len(prepped_request.body or "")
+        prepped_request.body_size = self.get_body_size(body=prepped_request.body)
 
         if self.SAVE_LAST:
             self.LAST_REQUEST = prepped_request
 
         if self.log_request_attrs:
-            lattrs = ", ".join(self.log_request_attrs).format(request=prepped_request)
-            self.LOG.debug(f"REQUEST ATTRS: {lattrs}")
+            lattrs = LazyFormat(
+                ", ".join(self.log_request_attrs).format, request=prepped_request
+            )
+            self.LOG.debug("REQUEST ATTRS: %s", lattrs)
+
+        if self.LOG_REQUEST_BODY:
+            self.log_body(body=prepped_request.body, body_type="REQUEST")
+
+        return prepped_request
+
+    def _get_send_args(self, prepped_request, **kwargs):
+        """Get the arguments to send a prepared request with.
 
+        Args:
+            prepped_request (:obj:`requests.PreparedRequest`): request to send
+            **kwargs: overrides for object attributes, see :meth:`__call__`
+
+        Returns:
+            :obj:`dict`: arguments for :meth:`requests.Session.send`
+        """
         send_args = self.session.merge_environment_settings(
             url=prepped_request.url,
             proxies=kwargs.get("proxies", {}),
@@ -301,12 +604,94 @@ class Http:
             kwargs.get("connect_timeout", self.CONNECT_TIMEOUT),
             kwargs.get("response_timeout", self.RESPONSE_TIMEOUT),
         )
+        return send_args
 
-        if self.LOG_REQUEST_BODY:
-            self.log_body(body=prepped_request.body, body_type="REQUEST")
+    def _get_timings(self, response, wait_seconds, send_seconds, stream=False):
+        """Get the timings of a response that was received.
 
-        response = self.session.send(**send_args)
-        response.body_size = len(response.text or "")
+        Args:
+            response (:obj:`requests.Response`): response that was received
+            wait_seconds (:obj:`float`): seconds waited for the rate limiter
+            send_seconds (:obj:`float`): seconds it took for :attr:`session` to send
+                the request and receive the response
+            stream (:obj:`bool`, optional): default ``False`` - response body has
+                not been read yet
+
+        Returns:
+            :obj:`dict`: :attr:`PoolAdapter.timings` plus:
+
+                * wait_seconds: seconds waited for the rate limiter
+                * ttfb_seconds: seconds until the headers of the response were
+                  received, including connect_seconds and tls_seconds
+                * download_seconds: seconds to read the body of the response, not
+                  included if stream is True
+                * seconds: seconds to send the request and receive the response
+        """
+        timings = self.adapter.timings
+        ttfb = response.elapsed.total_seconds()
+        timings["wait_seconds"] = wait_seconds
+        timings["ttfb_seconds"] = ttfb
+        if not stream:
+            timings["download_seconds"] = max(0.0, send_seconds - ttfb)
+        timings["seconds"] = send_seconds
+        return timings
+
+    def _emit_error(self, request, error, attempt, limit_group=None):
+        """Emit an http_error event to :attr:`METRICS` for a request that failed."""
+        if not self.METRICS.enabled:
+            return
+
+        self.METRICS.emit(
+            event="http_error",
+            values={"retries": attempt - 1, "request_bytes": request.body_size},
+            labels={
+                "method": request.method,
+                "group": limit_group,
+                "error": error.__class__.__name__,
+            },
+        )
+
+    def _emit_response(self, response, limit_group=None):
+        """Emit an http_request event to :attr:`METRICS` for a response."""
+        if not self.METRICS.enabled:
+            return
+
+        values = dict(getattr(response, "timings", None) or {})
+        values["retries"] = getattr(response, "retries", 0)
+        values["request_bytes"] = HttpHistory._get_size(response.request, "body_size")
+        values["response_bytes"] = HttpHistory._get_size(response, "body_size")
+
+        self.METRICS.emit(
+            event="http_request",
+            values=values,
+            labels={
+                "method": response.request.method,
+                "group": limit_group,
+                "status_code": str(response.status_code),
+            },
+        )
+
+    def _process_response(self, response, stream=False, limit_group=None):
+        """Save, log and emit a response that was received.
+
+        Args:
+            response (:obj:`requests.Response`): response that was received
+            stream (:obj:`bool`, optional): default ``False`` - response body has
+                not been read yet, so do not read it to log it and use the
+                Content-Length header (or 0) as its size
+            limit_group (:obj:`str`, optional): default ``None`` - group of routes
+                the request was limited with
+
+        Returns:
+            :obj:`requests.Response`: raw response object
+        """
+        if stream:
+            try:
+                response.body_size = int(response.headers.get("Content-Length") or 0)
+            except ValueError:
+                response.body_size = 0
+        else:
+            response.body_size = self.get_body_size(body=response.content)
 
         if self.SAVE_LAST:
             self.LAST_RESPONSE = response
@@ -315,14 +700,37 @@ class Http:
             self.HISTORY.append(response)
 
         if self.log_response_attrs:
-            lattrs = ", ".join(self.log_response_attrs).format(response=response)
-            self.LOG.debug(f"RESPONSE ATTRS: {lattrs}")
+            lattrs = LazyFormat(
+                ", ".join(self.log_response_attrs).format, response=response
+            )
+            self.LOG.debug("RESPONSE ATTRS: %s", lattrs)
 
-        if self.LOG_RESPONSE_BODY:
+        if self.LOG_RESPONSE_BODY and not stream:
             self.log_body(body=response.text, body_type="RESPONSE")
 
+        self._emit_response(response=response, limit_group=limit_group)
         return response
 
+    @property
+    def async_http(self):
+        """Get the asyncio HTTP client that shares the settings of this object.
+
+        Returns:
+            :obj:`AsyncHttp`
+        """
+        if not hasattr(self, "_async_http"):
+            self._async_http = AsyncHttp(http=self)
+        return self._async_http
+
+    @property
+    def pool_stats(self):
+        """Get the number of connections opened and reused by :attr:`session`.
+
+        Returns:
+            :obj:`dict`: see :attr:`PoolAdapter.stats`
+        """
+        return self.adapter.stats
+
     def __str__(self):
         """Show object info.
 
@@ -405,9 +813,1265 @@ class Http:
 
     def log_body(self, body, body_type):
         """Pass."""
-        body = body or ""
-        body = json_reload(obj=body, error=False, trim=MAX_BODY_LEN)
-        self.LOG.debug(f"{body_type} BODY:\n{body}")
+        body = LazyFormat(json_reload, obj=body or "", error=False, trim=MAX_BODY_LEN)
+        self.LOG.debug("%s BODY:\n%s", body_type, body)
+
+    @staticmethod
+    def get_body_size(body):
+        """Get the size in bytes of a request or response body.
+
+        Notes:
+            Bytes are measured as is instead of decoding them to text, str are
+            measured as UTF-8 and files from their current position to the end.
+
+        Args:
+            body (:obj:`bytes` or :obj:`str` or :obj:`io.IOBase`): body to measure
+
+        Returns:
+            :obj:`int`
+        """
+        if not body:
+            return 0
+        if isinstance(body, (bytes, bytearray)):
+            return len(body)
+        return requests.utils.super_len(body)
+
+
+class AsyncHttp:
+    """HTTP client for asyncio that sends requests prepared by :obj:`Http`.
+
+    Notes:
+        Requires the optional ``aiohttp`` package. Requests are prepared by
+        :meth:`Http._prepare_request` and responses are converted into
+        :obj:`requests.Response` objects, so the headers, cert and proxy settings,
+        timeouts, logging and history of :obj:`Http` all apply and the same
+        response parsers can be used.
+    """
+
+    def __init__(self, http, connection_limit=100):
+        """HTTP client for asyncio that sends requests prepared by :obj:`Http`.
+
+        Args:
+            http (:obj:`Http`): HTTP client to prepare requests and process
+                responses with
+            connection_limit (:obj:`int`, optional): default ``100`` - maximum
+                number of simultaneous connections to open to :attr:`Http.url`
+
+        Raises:
+            :exc:`HttpError`: if aiohttp is not installed
+        """
+        self.aiohttp, self.yarl = self._import_aiohttp()
+        self.http = http
+        self.LOG = http.LOG.getChild(self.__class__.__name__)
+        self.connection_limit = connection_limit
+        self.session = None
+        self._loop = None
+        self._ssl_contexts = {}
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return "{c.__module__}.{c.__name__}(url={url!r})".format(
+            c=self.__class__, url=self.http.url
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    async def __aenter__(self):
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit async context manager and close :attr:`session`."""
+        await self.close()
+
+    async def __call__(
+        self,
+        path=None,
+        route=None,
+        method="get",
+        data=None,
+        params=None,
+        headers=None,
+        json=None,
+        files=None,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Create, prepare, and then send a request using :attr:`session`.
+
+        Args:
+            **kwargs: see :meth:`Http.__call__`
+
+        Returns:
+            :obj:`requests.Response`: raw response object
+        """
+        http = self.http
+        prepped_request = http._prepare_request(
+            path=path,
+            route=route,
+            method=method,
+            data=data,
+            params=params,
+            headers=headers,
+            json=json,
+            files=files,
+        )
+        send_args = http._get_send_args(prepped_request=prepped_request, **kwargs)
+        connect_timeout, response_timeout = send_args["timeout"]
+
+        timeout = self.aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=response_timeout
+        )
+        proxy = requests.utils.select_proxy(
+            prepped_request.url, send_args["proxies"] or http.session.proxies
+        )
+        ssl_context = self._get_ssl_context(
+            verify=send_args["verify"], cert=send_args["cert"]
+        )
+
+        idempotent = http.RETRY.is_idempotent(
+            method=method, idempotent=kwargs.get("idempotent", None)
+        )
+        limiter = http.LIMITS.get(group=kwargs.get("limit_group", None))
+        attempt = 0
+
+        while True:
+            attempt += 1
+            http.RETRY.check(url=prepped_request.url)
+            start_dt = dt_now()
+
+            try:
+                aio_response, content = await self._send(
+                    prepped_request=prepped_request,
+                    proxy=proxy,
+                    ssl_context=ssl_context,
+                    timeout=timeout,
+                    limiter=limiter,
+                )
+            except (self.aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                delay = http.RETRY.get_delay(
+                    attempt=attempt,
+                    idempotent=idempotent,
+                    error=exc,
+                    error_retry=self._is_error_retry(error=exc),
+                    error_safe=self._is_error_safe(error=exc),
+                )
+                if delay is None:
+                    http._emit_error(
+                        request=prepped_request,
+                        error=exc,
+                        attempt=attempt,
+                        limit_group=limiter.group,
+                    )
+                    raise
+
+                reason = repr(exc)
+            else:
+                delay = http.RETRY.get_delay(
+                    attempt=attempt,
+                    idempotent=idempotent,
+                    status_code=aio_response.status,
+                    headers=aio_response.headers,
+                )
+                if delay is None:
+                    break
+
+                reason = f"{aio_response.status} {aio_response.reason}"
+
+            http.RETRY.log_retry(
+                log=self.LOG,
+                request=prepped_request,
+                attempt=attempt,
+                delay=delay,
+                reason=reason,
+            )
+            await asyncio.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = aio_response.status
+        response.reason = aio_response.reason
+        response.headers = requests.structures.CaseInsensitiveDict(
+            aio_response.headers
+        )
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = str(aio_response.url)
+        response.request = prepped_request
+        response.elapsed = dt_now() - start_dt
+        response.retries = attempt - 1
+        response.timings = {"seconds": response.elapsed.total_seconds()}
+        response._content = content
+        return http._process_response(response=response, limit_group=limiter.group)
+
+    async def _send(self, prepped_request, proxy, ssl_context, timeout, limiter):
+        """Send a prepared request and read the body of the response.
+
+        Notes:
+            The request is sent once **limiter** allows it, and counts as in
+            flight until the body of the response is read.
+
+        Returns:
+            :obj:`tuple` of (:obj:`aiohttp.ClientResponse`, :obj:`bytes`):
+                response and body
+        """
+        session = self._get_session()
+        await limiter.acquire_async()
+
+        try:
+            async with session.request(
+                method=prepped_request.method,
+                url=self.yarl.URL(prepped_request.url, encoded=True),
+                data=prepped_request.body,
+                headers=dict(prepped_request.headers),
+                proxy=proxy,
+                ssl=ssl_context,
+                timeout=timeout,
+            ) as aio_response:
+                content = await aio_response.read()
+        finally:
+            limiter.release()
+
+        return aio_response, content
+
+    def _is_error_retry(self, error):
+        """Check if an error from aiohttp is a network error that can be retried."""
+        aiohttp = self.aiohttp
+        return isinstance(
+            error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        ) and not isinstance(error, aiohttp.ClientSSLError)
+
+    def _is_error_safe(self, error):
+        """Check if an error from aiohttp happened before the request was sent."""
+        aiohttp = self.aiohttp
+        return isinstance(error, aiohttp.ClientConnectorError) and not isinstance(
+            error, aiohttp.ClientSSLError
+        )
+
+    async def close(self):
+        """Close :attr:`session` if it is open."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._loop = None
+
+    def _get_session(self):
+        """Get the aiohttp session for the current event loop.
+
+        Returns:
+            :obj:`aiohttp.ClientSession`
+        """
+        loop = asyncio.get_event_loop()
+        if self.session is None or self.session.closed or self._loop is not loop:
+            connector = self.aiohttp.TCPConnector(limit=self.connection_limit)
+            self.session = self.aiohttp.ClientSession(
+                connector=connector, cookie_jar=self.aiohttp.DummyCookieJar()
+            )
+            self._loop = loop
+        return self.session
+
+    def _get_ssl_context(self, verify, cert):
+        """Get an SSL context that mirrors the verify and cert args of requests.
+
+        Args:
+            verify (:obj:`bool` or :obj:`str`): verify arg from :obj:`Http`
+            cert (:obj:`str` or :obj:`tuple` of :obj:`str`): client cert arg from
+                :obj:`Http`
+
+        Returns:
+            :obj:`ssl.SSLContext`
+        """
+        key = (verify, tuple(listify(cert)))
+
+        if key not in self._ssl_contexts:
+            if verify is False:
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            elif verify is True or verify is None:
+                context = ssl.create_default_context(cafile=requests.certs.where())
+            elif os.path.isdir(str(verify)):
+                context = ssl.create_default_context(capath=str(verify))
+            else:
+                context = ssl.create_default_context(cafile=str(verify))
+
+            if isinstance(cert, (list, tuple)):
+                context.load_cert_chain(*cert)
+            elif cert:
+                context.load_cert_chain(cert)
+
+            self._ssl_contexts[key] = context
+        return self._ssl_contexts[key]
+
+    @staticmethod
+    def _import_aiohttp():
+        try:
+            import aiohttp
+            import yarl
+        except ImportError as exc:  # pragma: no cover
+            msg = "aiohttp must be installed to send async requests"
+            raise HttpError(f"{msg} (pip install axonius_api_client[async]): {exc}")
+        return aiohttp, yarl
+
+
+class HttpHistory:
+    """Bounded history of the responses received by :obj:`Http`.
+
+    Notes:
+        Once more than **max_count** responses are kept, or the request and
+        response bodies of the responses kept add up to more than **max_bytes**,
+        the oldest responses are dropped. With **metadata**, only the metadata
+        of each response (see :meth:`get_metadata`) is kept instead of the
+        response and its body, and does not count towards **max_bytes**.
+
+        :attr:`stats` are aggregated from every response added since this
+        object was created, including the ones that have been dropped.
+    """
+
+    def __init__(
+        self,
+        max_count=HISTORY_MAX_COUNT,
+        max_bytes=HISTORY_MAX_BYTES,
+        metadata=HISTORY_METADATA,
+    ):
+        """Bounded history of the responses received by :obj:`Http`.
+
+        Args:
+            max_count (:obj:`int`, optional): default :data:`HISTORY_MAX_COUNT` -
+                responses to keep, 0 for no limit
+            max_bytes (:obj:`int`, optional): default :data:`HISTORY_MAX_BYTES` -
+                request and response body bytes to keep, 0 for no limit
+            metadata (:obj:`bool`, optional): default :data:`HISTORY_METADATA` -
+                keep only the metadata of responses
+        """
+        self.max_count = max_count or 0
+        self.max_bytes = max_bytes or 0
+        self.metadata = metadata
+        self._entries = collections.deque()
+        self._sizes = collections.deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "count": 0,
+            "dropped": 0,
+            "request_bytes": 0,
+            "response_bytes": 0,
+            "retries": 0,
+            "elapsed_total": 0.0,
+            "elapsed_min": None,
+            "elapsed_max": None,
+            "status_codes": {},
+            "methods": {},
+        }
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(count={len(self)}, bytes={self._bytes}, "
+            f"max_count={self.max_count}, max_bytes={self.max_bytes}, "
+            f"metadata={self.metadata})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Get the number of responses kept."""
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the responses kept, oldest first."""
+        with self._lock:
+            entries = list(self._entries)
+        return iter(entries)
+
+    def __getitem__(self, index):
+        """Get a response kept by index or slice, oldest first."""
+        with self._lock:
+            entries = list(self._entries)
+        return entries[index]
+
+    def __contains__(self, item):
+        """Check if a response is kept."""
+        return any(x is item or x == item for x in self)
+
+    def append(self, response):
+        """Add a response, dropping the oldest responses if over the limits.
+
+        Args:
+            response (:obj:`requests.Response`): response to add
+        """
+        meta = self.get_metadata(response=response)
+
+        if self.metadata:
+            entry, size = meta, 0
+        else:
+            entry, size = response, meta["request_size"] + meta["response_size"]
+
+        with self._lock:
+            self._entries.append(entry)
+            self._sizes.append(size)
+            self._bytes += size
+            self._add_stats(meta=meta)
+
+            while self._entries and self._is_over():
+                self._entries.popleft()
+                self._bytes -= self._sizes.popleft()
+                self._stats["dropped"] += 1
+
+    def clear(self):
+        """Drop all responses kept, but not the stats."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    @property
+    def bytes(self):
+        """Get the request and response body bytes of the responses kept.
+
+        Returns:
+            :obj:`int`
+        """
+        return self._bytes
+
+    @property
+    def stats(self):
+        """Get stats for all responses added.
+
+        Returns:
+            :obj:`dict`: with keys:
+
+                * count: responses added
+                * kept: responses kept
+                * dropped: responses dropped because of max_count or max_bytes
+                * bytes_kept: request and response body bytes of responses kept
+                * request_bytes / response_bytes: body bytes of all responses
+                * retries: retries for all responses
+                * elapsed_total / elapsed_min / elapsed_max / elapsed_avg: seconds
+                  it took to get responses
+                * status_codes: count of responses for each status code
+                * methods: count of responses for each method
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["status_codes"] = dict(stats["status_codes"])
+            stats["methods"] = dict(stats["methods"])
+            stats["kept"] = len(self._entries)
+            stats["bytes_kept"] = self._bytes
+
+        count = stats["count"]
+        stats["elapsed_avg"] = stats["elapsed_total"] / count if count else None
+        return stats
+
+    @staticmethod
+    def get_metadata(response):
+        """Get the metadata of a response.
+
+        Args:
+            response (:obj:`requests.Response`): response to get metadata of
+
+        Returns:
+            :obj:`dict`: method, url, status_code, reason, elapsed seconds, retries,
+                request_size and response_size in bytes, and when it was received
+        """
+        request = response.request
+        elapsed = response.elapsed
+        return {
+            "method": getattr(request, "method", None),
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "elapsed": elapsed.total_seconds() if elapsed is not None else None,
+            "retries": getattr(response, "retries", 0) or 0,
+            "request_size": HttpHistory._get_size(request, "body_size"),
+            "response_size": HttpHistory._get_size(response, "body_size"),
+            "received": dt_now().isoformat(),
+        }
+
+    @staticmethod
+    def _get_size(obj, attr):
+        """Get a size from an attribute that may be missing or a header value."""
+        try:
+            return int(getattr(obj, attr, None) or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _is_over(self):
+        over_count = self.max_count and len(self._entries) > self.max_count
+        over_bytes = self.max_bytes and self._bytes > self.max_bytes
+        return bool(over_count or over_bytes)
+
+    def _add_stats(self, meta):
+        stats = self._stats
+        stats["count"] += 1
+        stats["request_bytes"] += meta["request_size"]
+        stats["response_bytes"] += meta["response_size"]
+        stats["retries"] += meta["retries"]
+
+        codes = stats["status_codes"]
+        codes[meta["status_code"]] = codes.get(meta["status_code"], 0) + 1
+        methods = stats["methods"]
+        methods[meta["method"]] = methods.get(meta["method"], 0) + 1
+
+        elapsed = meta["elapsed"]
+        if elapsed is not None:
+            stats["elapsed_total"] += elapsed
+            if stats["elapsed_min"] is None or elapsed < stats["elapsed_min"]:
+                stats["elapsed_min"] = elapsed
+            if stats["elapsed_max"] is None or elapsed > stats["elapsed_max"]:
+                stats["elapsed_max"] = elapsed
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter with tunable connection pools and TCP keep-alive.
+
+    Notes:
+        Connections are kept open and reused for later requests to the same
+        host, so only the first request on each connection pays for the TCP
+        and TLS handshakes. Every time a connection is opened (including when
+        a pooled connection that the host closed is opened again) and every
+        request sent is counted for :attr:`stats`.
+    """
+
+    def __init__(
+        self,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=POOL_BLOCK,
+        keepalive=KEEPALIVE,
+        keepalive_idle=KEEPALIVE_IDLE,
+        keepalive_interval=KEEPALIVE_INTERVAL,
+        keepalive_count=KEEPALIVE_COUNT,
+    ):
+        """Transport adapter with tunable connection pools and TCP keep-alive.
+
+        Args:
+            **kwargs: see :obj:`Http`
+        """
+        self.keepalive = keepalive
+        self.keepalive_idle = keepalive_idle
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_count = keepalive_count
+        self._counts = {"connections_opened": 0, "requests": 0}
+        self._lock = threading.Lock()
+        self._timings = threading.local()
+        super(PoolAdapter, self).__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(pool_connections={self._pool_connections}, "
+            f"pool_maxsize={self._pool_maxsize}, pool_block={self._pool_block}, "
+            f"keepalive={self.keepalive})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    @property
+    def socket_options(self):
+        """Get the socket options to open connections with.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: default socket options of urllib3, plus
+                TCP keep-alive options if keepalive is enabled and supported
+        """
+        options = list(requests.urllib3.connection.HTTPConnection.default_socket_options)
+
+        if self.keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # macOS names the idle option TCP_KEEPALIVE
+            idle = getattr(socket, "TCP_KEEPALIVE", None)
+            idle = getattr(socket, "TCP_KEEPIDLE", idle)
+            tcp_options = [
+                (idle, self.keepalive_idle),
+                (getattr(socket, "TCP_KEEPINTVL", None), self.keepalive_interval),
+                (getattr(socket, "TCP_KEEPCNT", None), self.keepalive_count),
+            ]
+            for name, value in tcp_options:
+                if name is not None and value:
+                    options.append((socket.IPPROTO_TCP, name, value))
+
+        return options
+
+    def init_poolmanager(self, connections, maxsize, block=POOL_BLOCK, **pool_kwargs):
+        """Create the pool manager with the socket options and pool counting."""
+        pool_kwargs["socket_options"] = self.socket_options
+        super(PoolAdapter, self).init_poolmanager(
+            connections, maxsize, block=block, **pool_kwargs
+        )
+        self._watch_pools(manager=self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Create a proxy manager with the socket options and pool counting."""
+        if proxy not in self.proxy_manager:
+            proxy_kwargs["socket_options"] = self.socket_options
+            manager = super(PoolAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+            self._watch_pools(manager=manager)
+            return manager
+        return super(PoolAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+
+    def send(self, request, **kwargs):
+        """Count and send a request."""
+        self._count(key="requests")
+        self._timings.values = {}
+        return super(PoolAdapter, self).send(request, **kwargs)
+
+    @property
+    def timings(self):
+        """Get the connection timings of the last request sent by this thread.
+
+        Notes:
+            DNS resolution happens while the socket is opened by urllib3, so it is
+            part of connect_seconds.
+
+        Returns:
+            :obj:`dict`: with keys:
+
+                * connect_seconds: seconds to resolve and connect to the host
+                * tls_seconds: seconds for the TLS handshake
+                * reused: request was sent on a connection that was already open
+        """
+        values = getattr(self._timings, "values", None) or {}
+        connect = values.get("connect_seconds", 0.0)
+        return {
+            "connect_seconds": connect,
+            "tls_seconds": max(0.0, values.get("open_seconds", 0.0) - connect),
+            "reused": "open_seconds" not in values,
+        }
+
+    @property
+    def stats(self):
+        """Get the number of connections opened and reused.
+
+        Returns:
+            :obj:`dict`: with keys:
+
+                * pools: number of connection pools open
+                * connections_opened: connections opened, each one paid for a
+                  TCP (and TLS) handshake
+                * requests: requests sent
+                * connections_reused: requests sent on a connection that was
+                  already open
+        """
+        with self._lock:
+            stats = dict(self._counts)
+
+        managers = [self.poolmanager, *self.proxy_manager.values()]
+        stats["pools"] = sum(len(x.pools) for x in managers)
+        stats["connections_reused"] = max(
+            0, stats["requests"] - stats["connections_opened"]
+        )
+        return stats
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def _add_timing(self, key, seconds):
+        values = getattr(self._timings, "values", None)
+        if values is not None:
+            values[key] = values.get(key, 0.0) + seconds
+
+    def _watch_pools(self, manager):
+        """Make the pools of a pool manager count the connections they open."""
+        manager.pool_classes_by_scheme = {
+            k: self._get_pool_cls(pool_cls=v)
+            for k, v in manager.pool_classes_by_scheme.items()
+        }
+
+    def _get_pool_cls(self, pool_cls):
+        """Get a subclass of a pool class with connections that count connects."""
+        count = self._count
+        add_timing = self._add_timing
+
+        class CountedConnection(pool_cls.ConnectionCls):
+            def _new_conn(self):
+                start = time.perf_counter()
+                try:
+                    return super(CountedConnection, self)._new_conn()
+                finally:
+                    seconds = time.perf_counter() - start
+                    add_timing(key="connect_seconds", seconds=seconds)
+
+            def connect(self):
+                start = time.perf_counter()
+                super(CountedConnection, self).connect()
+                add_timing(key="open_seconds", seconds=time.perf_counter() - start)
+                count(key="connections_opened")
+
+        return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": CountedConnection})
+
+
+class RateLimiter:
+    """Limit the rate and concurrency of requests with a token bucket and a semaphore.
+
+    Notes:
+        The bucket holds up to **burst** tokens and is refilled with **rate**
+        tokens per second. Each request takes a token, waiting for one if the
+        bucket is empty, and then waits for one of **max_in_flight** slots until
+        the request is done. Tokens are taken in the order requests ask for them,
+        so waiting requests are sent in order.
+    """
+
+    POLL_SECONDS = 0.01
+    """:obj:`float`: seconds to wait between checks for a free slot in asyncio"""
+
+    def __init__(
+        self, group, rate=RATE_LIMIT, burst=RATE_BURST, max_in_flight=MAX_IN_FLIGHT
+    ):
+        """Limit the rate and concurrency of requests.
+
+        Args:
+            group (:obj:`str`): name of the group of routes this limits
+            rate (:obj:`float`, optional): default :data:`RATE_LIMIT` -
+                requests per second, ``0`` for no limit
+            burst (:obj:`int`, optional): default :data:`RATE_BURST` -
+                requests that can be sent at once, ``0`` for the larger of
+                **rate** and 1
+            max_in_flight (:obj:`int`, optional): default :data:`MAX_IN_FLIGHT` -
+                requests in progress at once, ``0`` for no limit
+        """
+        self.group = group
+        self.rate = float(rate or 0)
+        self.burst = float(burst or max(1, self.rate))
+        self.max_in_flight = int(max_in_flight or 0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.semaphore = None
+        if self.max_in_flight:
+            self.semaphore = threading.BoundedSemaphore(self.max_in_flight)
+        self.stats = {
+            "requests": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "in_flight": 0,
+            "in_flight_max": 0,
+        }
+        """:obj:`dict`: counts of requests, waits and requests in flight"""
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(group={self.group!r}, rate={self.rate}, "
+            f"burst={self.burst}, max_in_flight={self.max_in_flight})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    def __enter__(self):
+        """Wait until a request can be sent."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Mark a request as done."""
+        self.release()
+
+    def acquire(self):
+        """Wait for a token and a slot to send a request."""
+        delay = self._take()
+        if delay:
+            time.sleep(delay)
+
+        waited = time.monotonic()
+        if self.semaphore is not None:
+            if not self.semaphore.acquire(blocking=False):
+                self.semaphore.acquire()
+                self._count_wait(seconds=time.monotonic() - waited)
+        self._count_flight(change=1)
+
+    async def acquire_async(self):
+        """Wait for a token and a slot to send a request without blocking the loop."""
+        delay = self._take()
+        if delay:
+            await asyncio.sleep(delay)
+
+        waited = time.monotonic()
+        if self.semaphore is not None:
+            if not self.semaphore.acquire(blocking=False):
+                while not self.semaphore.acquire(blocking=False):
+                    await asyncio.sleep(self.POLL_SECONDS)
+                self._count_wait(seconds=time.monotonic() - waited)
+        self._count_flight(change=1)
+
+    def release(self):
+        """Mark a request as done and free its slot."""
+        self._count_flight(change=-1)
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def _take(self):
+        """Take a token from the bucket.
+
+        Returns:
+            :obj:`float`: seconds to wait for the token, tokens are taken even if
+                the bucket is empty so that the next request waits longer
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+
+            if not self.rate:
+                return 0
+
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + ((now - self.updated) * self.rate)
+            )
+            self.updated = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0
+
+            delay = -self.tokens / self.rate
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += delay
+            return delay
+
+    def _count_wait(self, seconds):
+        with self._lock:
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += seconds
+
+    def _count_flight(self, change):
+        with self._lock:
+            self.stats["in_flight"] += change
+            self.stats["in_flight_max"] = max(
+                self.stats["in_flight_max"], self.stats["in_flight"]
+            )
+
+
+class RateLimits:
+    """Rate limiters for each group of routes.
+
+    Notes:
+        Requests are put in a group by the ``limit_group`` argument of
+        :meth:`Http.__call__`, which API models set to the group of their
+        :obj:`axonius_api_client.api.routers.Router`. Requests without a group
+        are put in the ``"default"`` group. Each group gets its own
+        :obj:`RateLimiter`, using the settings in **groups** for that group if
+        any, otherwise **rate**, **burst** and **max_in_flight**.
+    """
+
+    DEFAULT_GROUP = "default"
+    """:obj:`str`: group to use for requests without a group"""
+
+    def __init__(
+        self, rate=RATE_LIMIT, burst=RATE_BURST, max_in_flight=MAX_IN_FLIGHT, groups=None
+    ):
+        """Rate limiters for each group of routes.
+
+        Args:
+            rate (:obj:`float`, optional): default :data:`RATE_LIMIT` -
+                requests per second for each group
+            burst (:obj:`int`, optional): default :data:`RATE_BURST` -
+                requests that can be sent at once for each group
+            max_in_flight (:obj:`int`, optional): default :data:`MAX_IN_FLIGHT` -
+                requests in progress at once for each group
+            groups (:obj:`dict`, optional): default ``None`` - map of group name
+                to a dict with any of rate, burst and max_in_flight for that group,
+                i.e. ``{"assets": {"rate": 5, "max_in_flight": 4}}``
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.groups = groups or {}
+        self.limiters = {}
+        """:obj:`dict`: map of group name to :obj:`RateLimiter`"""
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(rate={self.rate}, burst={self.burst}, "
+            f"max_in_flight={self.max_in_flight}, groups={self.groups})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    def get(self, group=None):
+        """Get the rate limiter for a group of routes.
+
+        Args:
+            group (:obj:`str`, optional): default ``None`` - name of the group,
+                ``None`` will use :attr:`DEFAULT_GROUP`
+
+        Returns:
+            :obj:`RateLimiter`
+        """
+        group = group or self.DEFAULT_GROUP
+
+        with self._lock:
+            if group not in self.limiters:
+                settings = self.groups.get(group, {})
+                self.limiters[group] = RateLimiter(
+                    group=group,
+                    rate=settings.get("rate", self.rate),
+                    burst=settings.get("burst", self.burst),
+                    max_in_flight=settings.get("max_in_flight", self.max_in_flight),
+                )
+            return self.limiters[group]
+
+    @property
+    def stats(self):
+        """Get the stats of the rate limiter of each group.
+
+        Returns:
+            :obj:`dict`: map of group name to :attr:`RateLimiter.stats`
+        """
+        return {k: dict(v.stats) for k, v in self.limiters.items()}
+
+
+class RetryPolicy:
+    """Decide when to retry failed requests and when to stop sending requests.
+
+    Notes:
+        A request is retried up to **retries** times if the response has a status
+        code in **statuses**, or if sending it raised a network error (i.e. a
+        connection reset or a timeout). Requests that are not idempotent are only
+        retried if they could not connect, since the host may have already acted
+        on them.
+
+        The delay before each retry is **backoff** doubled for each retry, up to
+        **backoff_max**, minus up to half of it at random so that clients that
+        failed at the same time do not retry at the same time. If the response
+        has a ``Retry-After`` header, the delay is at least that long (up to
+        **backoff_max**).
+
+        After **circuit_failures** failed attempts in a row, the circuit opens and
+        requests raise :exc:`HttpCircuitOpen` without being sent for
+        **circuit_seconds**. After that, the next request is sent and closes the
+        circuit if it works or opens it again if it fails.
+    """
+
+    def __init__(
+        self,
+        retries=RETRIES,
+        backoff=RETRY_BACKOFF,
+        backoff_max=RETRY_BACKOFF_MAX,
+        statuses=RETRY_STATUSES,
+        methods=RETRY_METHODS,
+        circuit_failures=CIRCUIT_FAILURES,
+        circuit_seconds=CIRCUIT_SECONDS,
+    ):
+        """Decide when to retry failed requests and when to stop sending requests.
+
+        Args:
+            retries (:obj:`int`, optional): default :data:`RETRIES` -
+                times to retry a request that failed
+            backoff (:obj:`float`, optional): default :data:`RETRY_BACKOFF` -
+                seconds to wait before the first retry
+            backoff_max (:obj:`float`, optional): default :data:`RETRY_BACKOFF_MAX` -
+                most seconds to wait before a retry
+            statuses (:obj:`list` of :obj:`int`, optional):
+                default :data:`RETRY_STATUSES` - response status codes to retry
+            methods (:obj:`list` of :obj:`str`, optional):
+                default :data:`RETRY_METHODS` - idempotent methods
+            circuit_failures (:obj:`int`, optional):
+                default :data:`CIRCUIT_FAILURES` - failed attempts in a row that
+                open the circuit, ``0`` to never open it
+            circuit_seconds (:obj:`float`, optional):
+                default :data:`CIRCUIT_SECONDS` - seconds the circuit stays open
+        """
+        self.retries = retries or 0
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.statuses = [int(x) for x in listify(statuses)]
+        self.methods = [x.upper() for x in listify(methods)]
+        self.circuit_failures = circuit_failures or 0
+        self.circuit_seconds = circuit_seconds
+        self.failures = 0
+        self.opened = None
+        self.stats = {
+            "attempts": 0,
+            "retries": 0,
+            "failures": 0,
+            "circuit_opens": 0,
+            "circuit_rejects": 0,
+        }
+        """:obj:`dict`: counts of attempts, retries, failures and circuit events"""
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(retries={self.retries}, "
+            f"backoff={self.backoff}, backoff_max={self.backoff_max}, "
+            f"statuses={self.statuses}, circuit_failures={self.circuit_failures}, "
+            f"circuit_seconds={self.circuit_seconds})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    @property
+    def is_open(self):
+        """Check if the circuit is open and requests should not be sent.
+
+        Returns:
+            :obj:`bool`
+        """
+        if self.opened is None:
+            return False
+        return (time.monotonic() - self.opened) < self.circuit_seconds
+
+    def check(self, url):
+        """Count an attempt to send a request, unless the circuit is open.
+
+        Args:
+            url (:obj:`str`): URL of the request
+
+        Raises:
+            :exc:`HttpCircuitOpen`: if the circuit is open
+        """
+        with self._lock:
+            if self.is_open:
+                self.stats["circuit_rejects"] += 1
+                left = self.circuit_seconds - (time.monotonic() - self.opened)
+                raise HttpCircuitOpen(
+                    f"Not sending request to {url!r}, {self.failures} requests "
+                    f"failed in a row (circuit open for {left:.1f} more seconds)"
+                )
+            self.stats["attempts"] += 1
+
+    def is_idempotent(self, method, idempotent=None):
+        """Check if a request can be sent more than once.
+
+        Args:
+            method (:obj:`str`): method of the request
+            idempotent (:obj:`bool`, optional): default ``None`` - if not ``None``,
+                return this instead of checking **method** against :attr:`methods`
+
+        Returns:
+            :obj:`bool`
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.methods
+
+    def is_error_retry(self, error):
+        """Check if an error from requests is a network error that can be retried.
+
+        Args:
+            error (:obj:`Exception`): error raised while sending a request
+
+        Returns:
+            :obj:`bool`
+        """
+        errors = (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        )
+        return isinstance(error, errors) and not isinstance(
+            error, requests.exceptions.SSLError
+        )
+
+    def is_error_safe(self, error):
+        """Check if an error from requests happened before the request was sent.
+
+        Args:
+            error (:obj:`Exception`): error raised while sending a request
+
+        Returns:
+            :obj:`bool`
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+
+        if isinstance(error, requests.exceptions.SSLError):
+            return False
+
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and isinstance(
+            reason, requests.urllib3.exceptions.NewConnectionError
+        )
+
+    def get_delay(
+        self,
+        attempt,
+        idempotent,
+        response=None,
+        status_code=None,
+        headers=None,
+        error=None,
+        error_retry=False,
+        error_safe=False,
+    ):
+        """Count the result of an attempt and get the seconds to wait to retry it.
+
+        Args:
+            attempt (:obj:`int`): number of the attempt, starting at 1
+            idempotent (:obj:`bool`): output of :meth:`is_idempotent`
+            response (:obj:`requests.Response`, optional): default ``None`` -
+                response received, if any
+            status_code (:obj:`int`, optional): default ``None`` - status code of
+                the response received, if not supplied as **response**
+            headers (:obj:`dict`, optional): default ``None`` - headers of the
+                response received, if not supplied as **response**
+            error (:obj:`Exception`, optional): default ``None`` - error raised
+                while sending the request, if any
+            error_retry (:obj:`bool`, optional): default ``False`` -
+                **error** is a network error that can be retried
+            error_safe (:obj:`bool`, optional): default ``False`` -
+                **error** happened before the request was sent
+
+        Returns:
+            :obj:`float`: seconds to wait, or ``None`` if it should not be retried
+        """
+        if response is not None:
+            status_code = response.status_code
+            headers = response.headers
+
+        if error is not None:
+            failed = error_retry
+            retry = error_retry and (idempotent or error_safe)
+        else:
+            failed = status_code in self.statuses
+            retry = failed and idempotent
+
+        self._count(failed=failed)
+
+        if not retry or attempt > self.retries:
+            return None
+
+        delay = min(self.backoff_max, self.backoff * (2 ** (attempt - 1)))
+        delay -= random.uniform(0, delay / 2)
+
+        retry_after = self.get_retry_after(headers=headers)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+
+        with self._lock:
+            self.stats["retries"] += 1
+        return delay
+
+    def get_retry_after(self, headers):
+        """Get the seconds to wait from the Retry-After header of a response.
+
+        Args:
+            headers (:obj:`dict`): headers of the response
+
+        Returns:
+            :obj:`float`: seconds to wait, or ``None`` if there is no valid header
+        """
+        value = (headers or {}).get("Retry-After", None)
+
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_dt = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_dt.tzinfo is None:
+            retry_dt = retry_dt.replace(tzinfo=datetime.timezone.utc)
+
+        return max(0.0, (retry_dt - dt_now()).total_seconds())
+
+    def log_retry(self, log, request, attempt, delay, reason):
+        """Log that a request is going to be retried.
+
+        Args:
+            log (:obj:`logging.Logger`): logger to use
+            request (:obj:`requests.PreparedRequest`): request to retry
+            attempt (:obj:`int`): number of the attempt that failed
+            delay (:obj:`float`): seconds to wait before retrying
+            reason (:obj:`str`): why the attempt failed
+        """
+        log.warning(
+            "RETRY %s/%s of %s %r in %.2f seconds: %s",
+            attempt,
+            self.retries,
+            request.method,
+            request.url,
+            delay,
+            reason,
+        )
+
+    def _count(self, failed):
+        with self._lock:
+            if not failed:
+                self.failures = 0
+                self.opened = None
+                return
+
+            self.failures += 1
+            self.stats["failures"] += 1
+
+            if self.circuit_failures and self.failures >= self.circuit_failures:
+                if not self.is_open:
+                    self.stats["circuit_opens"] += 1
+                self.opened = time.monotonic()
 
 
 class ParserUrl:
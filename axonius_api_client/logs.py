@@ -453,6 +453,41 @@ def find_handlers(obj, hname="", htype=None, traverse=True):
     return handlers
 
 
+class LazyFormat:
+    """Defer building the value of a log message argument until it is emitted.
+
+    Notes:
+        Pass as an argument of a %-style log message, i.e.
+        ``LOG.debug("STATE: %s", LazyFormat(json_dump, state))``, and **func**
+        is only called if a handler actually formats the record. Loggers in this
+        package default to debug, so records are created even when no handler
+        will emit them, and building an f-string up front would serialize
+        large objects for nothing.
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func, *args, **kwargs):
+        """Defer building the value of a log message argument until it is emitted.
+
+        Args:
+            func (:obj:`callable`): method to call to get the value
+            *args: positional arguments for **func**
+            **kwargs: keyword arguments for **func**
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        """Call func and get its value as a str."""
+        return str(self.func(*self.args, **self.kwargs))
+
+    def __repr__(self):
+        """Call func and get the repr of its value."""
+        return repr(self.func(*self.args, **self.kwargs))
+
+
 LOG = logging.getLogger(PACKAGE_ROOT)
 """:obj:`logging.Logger`: root logger used by entire package, named after package."""
 
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation events and metrics."""
+import collections
+import math
+import pathlib
+import re
+import threading
+import time
+
+from .constants import METRICS_MAX_SAMPLES, METRICS_PREFIX, METRICS_QUANTILES
+from .logs import get_obj_log
+
+
+class Metrics:
+    """Event bus for instrumentation events.
+
+    Notes:
+        Events are emitted by :obj:`axonius_api_client.http.Http` for every
+        response received (``"http_request"``) and request that failed
+        (``"http_error"``), by :obj:`axonius_api_client.api.mixins.ModelMixins`
+        for every JSON response decoded (``"http_decode"``), and by the paging
+        loops for every page processed (``"page"``).
+
+        Each event is a dict with keys:
+
+        * event: name of the event
+        * time: epoch seconds the event was emitted
+        * labels: dict of str values that describe the event, i.e. method
+        * values: dict of numbers measured for the event, i.e. seconds
+
+        Events are only built if there are subscribers, see :attr:`enabled`.
+    """
+
+    def __init__(self, log_level="debug"):
+        """Event bus for instrumentation events.
+
+        Args:
+            log_level (:obj:`str`, optional): default ``"debug"`` -
+                logging level for this object
+        """
+        self.LOG = get_obj_log(obj=self, level=log_level)
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return f"{self.__class__.__name__}(hooks={len(self._hooks)})"
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    @property
+    def enabled(self):
+        """Check if there are any subscribers to emit events to.
+
+        Returns:
+            :obj:`bool`
+        """
+        return bool(self._hooks)
+
+    def subscribe(self, hook, events=None):
+        """Call a hook with every event emitted.
+
+        Args:
+            hook (:obj:`callable`): method to call with each event, i.e. a
+                :obj:`MetricsAggregator`
+            events (:obj:`list` of :obj:`str`, optional): default ``None`` - only
+                call hook for these events, ``None`` for all events
+        """
+        events = set(events) if events else None
+        with self._lock:
+            self._hooks = self._hooks + [(hook, events)]
+
+    def unsubscribe(self, hook):
+        """Stop calling a hook with events.
+
+        Args:
+            hook (:obj:`callable`): method that was subscribed
+        """
+        with self._lock:
+            self._hooks = [x for x in self._hooks if x[0] != hook]
+
+    def emit(self, event, values, labels=None):
+        """Call the subscribed hooks with an event.
+
+        Notes:
+            Exceptions raised by hooks are logged and do not stop the caller.
+
+        Args:
+            event (:obj:`str`): name of the event
+            values (:obj:`dict`): numbers measured for the event
+            labels (:obj:`dict`, optional): default ``None`` - str values that
+                describe the event
+        """
+        hooks = self._hooks
+        if not hooks:
+            return
+
+        data = {
+            "event": event,
+            "time": time.time(),
+            "labels": labels or {},
+            "values": values,
+        }
+
+        for hook, events in hooks:
+            if events is not None and event not in events:
+                continue
+            try:
+                hook(data)
+            except Exception as exc:
+                self.LOG.warning("Metrics hook %r failed: %r", hook, exc)
+
+
+class MetricsAggregator:
+    """Aggregate the values of events in memory into quantile summaries.
+
+    Notes:
+        Values are grouped by event name and the event labels named in
+        **labels**. Count, sum, min and max are kept for every value seen, and
+        quantiles are calculated from the most recent **max_samples** values.
+    """
+
+    def __init__(
+        self, labels=None, quantiles=METRICS_QUANTILES, max_samples=METRICS_MAX_SAMPLES
+    ):
+        """Aggregate the values of events in memory into quantile summaries.
+
+        Args:
+            labels (:obj:`list` of :obj:`str`, optional): default ``None`` -
+                event labels to group values by, i.e. ``["group"]``
+            quantiles (:obj:`list` of :obj:`float`, optional):
+                default :data:`METRICS_QUANTILES` - quantiles to summarize with
+            max_samples (:obj:`int`, optional): default :data:`METRICS_MAX_SAMPLES`
+                - most recent values of each metric to keep for quantiles
+        """
+        self.labels = list(labels or [])
+        self.quantiles = list(quantiles)
+        self.max_samples = max_samples
+        self._metrics = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return (
+            f"{self.__class__.__name__}(labels={self.labels}, "
+            f"events={sum(self._counts.values())})"
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+        """
+        return self.__str__()
+
+    def __call__(self, event):
+        """Add the values of an event.
+
+        Args:
+            event (:obj:`dict`): event emitted by :obj:`Metrics`
+        """
+        labels = tuple((x, str(event["labels"].get(x, ""))) for x in self.labels)
+        key = (event["event"], labels)
+
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+            for name, value in event["values"].items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+
+                metric = self._metrics.get((key, name))
+                if metric is None:
+                    metric = self._metrics[(key, name)] = {
+                        "count": 0,
+                        "sum": 0,
+                        "min": value,
+                        "max": value,
+                        "samples": collections.deque(maxlen=self.max_samples),
+                    }
+
+                metric["count"] += 1
+                metric["sum"] += value
+                metric["min"] = min(metric["min"], value)
+                metric["max"] = max(metric["max"], value)
+                metric["samples"].append(value)
+
+    def clear(self):
+        """Drop all values aggregated so far."""
+        with self._lock:
+            self._metrics = {}
+            self._counts = {}
+
+    def summary(self):
+        """Get a summary of the values of each event.
+
+        Returns:
+            :obj:`list` of :obj:`dict`: for each event and labels:
+
+                * event: name of the event
+                * labels: dict of the labels the values were grouped by
+                * count: number of events
+                * values: dict of value name to count, sum, min, max, avg and
+                  p50/p95/p99 (one key for each of :attr:`quantiles`)
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            metrics = {
+                k: dict(v, samples=sorted(v["samples"]))
+                for k, v in self._metrics.items()
+            }
+
+        summary = {}
+        for key, count in counts.items():
+            event, labels = key
+            summary[key] = {
+                "event": event,
+                "labels": dict(labels),
+                "count": count,
+                "values": {},
+            }
+
+        for (key, name), metric in metrics.items():
+            samples = metric.pop("samples")
+            metric["avg"] = metric["sum"] / metric["count"]
+            for quantile in self.quantiles:
+                metric[get_quantile_name(quantile)] = get_quantile(
+                    samples=samples, quantile=quantile
+                )
+            summary[key]["values"][name] = metric
+
+        return list(summary.values())
+
+    def to_prometheus(self, prefix=METRICS_PREFIX):
+        """Get the summary in the Prometheus text exposition format.
+
+        Notes:
+            Each event is exported as a counter named
+            ``<prefix>_<event>_total``, and each of its values as a summary named
+            ``<prefix>_<event>_<value>`` with a sample for each quantile, plus
+            ``_sum`` and ``_count``.
+
+        Args:
+            prefix (:obj:`str`, optional): default :data:`METRICS_PREFIX` -
+                prefix for the names of metrics
+
+        Returns:
+            :obj:`str`
+        """
+        counters = {}
+        summaries = {}
+
+        for item in self.summary():
+            base = get_metric_name(prefix, item["event"])
+            counters.setdefault(f"{base}_total", []).append(
+                (item["labels"], item["count"])
+            )
+            for name, metric in item["values"].items():
+                summaries.setdefault(get_metric_name(base, name), []).append(
+                    (item["labels"], metric)
+                )
+
+        lines = []
+        for name, samples in counters.items():
+            lines.append(f"# TYPE {name} counter")
+            for labels, count in samples:
+                lines.append(f"{name}{get_labels(labels)} {count}")
+
+        for name, samples in summaries.items():
+            lines.append(f"# TYPE {name} summary")
+            for labels, metric in samples:
+                for quantile in self.quantiles:
+                    value = metric[get_quantile_name(quantile)]
+                    qlabels = dict(labels, quantile=str(quantile))
+                    lines.append(f"{name}{get_labels(qlabels)} {value}")
+                lines.append(f"{name}_sum{get_labels(labels)} {metric['sum']}")
+                lines.append(f"{name}_count{get_labels(labels)} {metric['count']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path, prefix=METRICS_PREFIX):
+        """Write the summary in the Prometheus text exposition format to a file.
+
+        Notes:
+            The file is written to a temporary file and renamed, so that a
+            collector (i.e. the textfile collector of node_exporter) never reads
+            a partial file.
+
+        Args:
+            path (:obj:`str` or :obj:`pathlib.Path`): file to write to
+            prefix (:obj:`str`, optional): default :data:`METRICS_PREFIX` -
+                prefix for the names of metrics
+
+        Returns:
+            :obj:`pathlib.Path`: file that was written
+        """
+        path = pathlib.Path(path).expanduser().resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path_tmp = path.with_name(f"{path.name}.tmp")
+        path_tmp.write_text(self.to_prometheus(prefix=prefix))
+        path_tmp.replace(path)
+        return path
+
+
+def timed_iter(iterable, timings, key):
+    """Yield from an iterable and add the time spent getting each item to timings.
+
+    Notes:
+        Only the time spent in the iterable is counted, not the time the caller
+        spends with each item before asking for the next one.
+
+    Args:
+        iterable (:obj:`typing.Iterable`): iterable to time
+        timings (:obj:`dict`): dict to add the seconds to
+        key (:obj:`str`): key in timings to add the seconds to
+
+    Yields:
+        :obj:`object`: each item of iterable
+    """
+    iterator = iter(iterable)
+    timings.setdefault(key, 0.0)
+
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            timings[key] += time.perf_counter() - start
+        yield item
+
+
+def get_quantile(samples, quantile):
+    """Get a quantile of sorted samples using the nearest rank method.
+
+    Args:
+        samples (:obj:`list` of :obj:`float`): sorted samples
+        quantile (:obj:`float`): quantile to get, between 0 and 1
+
+    Returns:
+        :obj:`float`: or ``None`` if there are no samples
+    """
+    if not samples:
+        return None
+    rank = max(1, math.ceil(quantile * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def get_quantile_name(quantile):
+    """Get the name of a quantile, i.e. ``p95`` for ``0.95``."""
+    return f"p{quantile * 100:g}".replace(".", "_")
+
+
+def get_metric_name(*parts):
+    """Join parts into a valid Prometheus metric name."""
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", "_".join(parts))
+
+
+def get_labels(labels):
+    """Format labels for a sample in the Prometheus text exposition format."""
+    if not labels:
+        return ""
+
+    items = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+        value = value.replace('"', '\\"')
+        items.append(f'{get_metric_name(key)}="{value}"')
+    return "{" + ",".join(items) + "}"
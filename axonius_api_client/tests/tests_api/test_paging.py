@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.api.paging."""
+import threading
+import time
+
+import pytest
+
+from axonius_api_client.api.assets.asset_mixin import AssetMixin
+from axonius_api_client.api.paging import PagePrefetcher, PageSizer, fetch_concurrent
+from axonius_api_client.exceptions import ApiError
+
+
+def pages_gen(count, fail_at=None, fetched=None):
+    """Pass."""
+    for idx in range(count):
+        if fail_at is not None and idx == fail_at:
+            raise ApiError(f"failed at page {idx}")
+        if fetched is not None:
+            fetched.append(idx)
+        yield {"page": idx, "thread": threading.current_thread().name}
+
+
+class TestPagePrefetcher:
+    """Test PagePrefetcher."""
+
+    def test_order(self):
+        """Pass."""
+        pages = PagePrefetcher(pages=pages_gen(count=10), size=2)
+        data = list(pages)
+        pages.close()
+        assert [x["page"] for x in data] == list(range(10))
+        assert all(x["thread"] != threading.current_thread().name for x in data)
+        assert not pages.thread.is_alive()
+        assert "size=2" in format(pages)
+        assert "size=2" in repr(pages)
+
+    def test_exc(self):
+        """Pass."""
+        pages = PagePrefetcher(pages=pages_gen(count=10, fail_at=3), size=1)
+        data = []
+        with pytest.raises(ApiError):
+            for page in pages:
+                data.append(page)
+        pages.close()
+        assert [x["page"] for x in data] == [0, 1, 2]
+        assert list(pages) == []
+
+    def test_close_early(self):
+        """Pass."""
+        fetched = []
+        pages = PagePrefetcher(pages=pages_gen(count=1000, fetched=fetched), size=2)
+        for page in pages:
+            break
+        pages.close()
+        assert not pages.thread.is_alive()
+        assert len(fetched) < 1000
+        assert list(pages) == []
+
+
+def fetch_sleep(arg):
+    """Pass."""
+    time.sleep(arg / 100)
+    return arg
+
+
+class TestFetchConcurrent:
+    """Test fetch_concurrent."""
+
+    def test_ordered(self):
+        """Pass."""
+        args = [5, 1, 3, 0, 2]
+        data = list(fetch_concurrent(fetch=fetch_sleep, args=args, workers=3))
+        assert data == args
+
+    def test_unordered(self):
+        """Pass."""
+        args = [5, 1, 3, 0, 2]
+        data = list(
+            fetch_concurrent(fetch=fetch_sleep, args=args, workers=5, ordered=False)
+        )
+        assert sorted(data) == sorted(args)
+        assert data[0] != 5
+
+    def test_exc(self):
+        """Pass."""
+
+        def fetch(arg):
+            if arg == 2:
+                raise ApiError("badwolf")
+            return arg
+
+        data = []
+        with pytest.raises(ApiError):
+            for item in fetch_concurrent(fetch=fetch, args=range(10), workers=2):
+                data.append(item)
+        assert data == [0, 1]
+
+    def test_window(self):
+        """Pass."""
+        fetched = []
+
+        def fetch(arg):
+            fetched.append(arg)
+            return arg
+
+        results = fetch_concurrent(fetch=fetch, args=range(100), workers=2, window=4)
+        assert next(results) == 0
+        results.close()
+        assert len(fetched) <= 5
+
+
+class TestPageSizer:
+    """Test PageSizer."""
+
+    def test_grow_shrink(self):
+        """Pass."""
+        sizer = PageSizer(page_size=100, target_seconds=1, min_size=10, max_size=2000)
+        assert sizer.update(seconds=0.1, rows=100) == 200
+        assert sizer.update(seconds=0.2, rows=200) == 400
+        assert sizer.update(seconds=10, rows=400) == 200
+        assert sizer.update(seconds=0, rows=0) == 200
+
+    def test_bounds(self):
+        """Pass."""
+        sizer = PageSizer(page_size=5000, target_seconds=1, min_size=50, max_size=1000)
+        assert sizer.page_size == 1000
+        assert sizer.update(seconds=0.01, rows=1000) == 1000
+        for _ in range(10):
+            sizer.update(seconds=100, rows=sizer.page_size)
+        assert sizer.page_size == 50
+
+    def test_target_bytes(self):
+        """Pass."""
+        sizer = PageSizer(
+            page_size=100,
+            target_seconds=1,
+            min_size=10,
+            max_size=2000,
+            target_bytes=5000,
+        )
+        assert sizer.update(seconds=0.01, rows=100, size=10000) == 50
+
+    def test_backoff(self):
+        """Pass."""
+        sizer = PageSizer(page_size=400, target_seconds=1, min_size=100, max_size=2000)
+        assert sizer.backoff() == 200
+        assert sizer.update(seconds=0.01, rows=200) == 200
+        assert sizer.backoff() == 100
+        assert sizer.backoff() is None
+
+    @pytest.mark.parametrize(
+        "max_rows, fetched, expected", [(None, 100, 200), (250, 100, 150), (100, 100, 1)]
+    )
+    def test_max_rows(self, max_rows, fetched, expected):
+        """Test the page size grows no more than the rows left under max_rows."""
+        sizer = PageSizer(page_size=100, target_seconds=1, min_size=10, max_size=2000)
+        state = {
+            "use_cursor": True,
+            "page_number": 1,
+            "max_rows": max_rows,
+            "fetch_seconds_this_page": 0.1,
+            "rows_fetched_this_page": 100,
+            "rows_fetched_total": fetched,
+            "rows_to_fetch_left": 900,
+        }
+        AssetMixin._set_page_adaptive_state(
+            self=None, state=state, sizer=sizer, page_number=1
+        )
+        assert state["page_size"] == expected
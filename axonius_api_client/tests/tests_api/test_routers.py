@@ -10,5 +10,6 @@ def test_api_v1_routers():
         assert isinstance(obj, axonapi.api.routers.Router)
         assert obj._object_type in format(obj)
         assert obj._object_type in repr(obj)
+        assert obj._group in format(obj)
         for route in obj._routes:
             assert hasattr(obj, route)
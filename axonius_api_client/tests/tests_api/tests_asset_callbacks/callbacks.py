@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import copy
+import gzip
 import io
 import logging
 import sys
@@ -857,6 +858,43 @@ class Callbacks:
         cbobj._fd.close()
         assert export_file.read_text() == "\n "
 
+    def test_fd_path_compress_suffix(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        export_file = tmp_path / "badwolf.txt.gz"
+        getargs = {"export_file": export_file}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+        cbobj.open_fd()
+        assert cbobj._fd_compress == "gzip"
+        cbobj._fd.write("badwolfé")
+        cbobj.close_fd()
+
+        assert gzip.decompress(export_file.read_bytes()).decode() == "badwolfé\n"
+
+    def test_fd_path_compress_arg(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        export_file = tmp_path / "badwolf.txt"
+        getargs = {
+            "export_file": export_file,
+            "export_compress": "gzip",
+            "export_compress_level": 1,
+            "export_buffer_size": 16,
+        }
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+        cbobj.open_fd()
+        cbobj.close_fd()
+        assert gzip.decompress(export_file.read_bytes()).decode() == "\n"
+
+    def test_fd_path_compress_invalid(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        export_file = tmp_path / "badwolf.txt"
+        getargs = {"export_file": export_file, "export_compress": "badwolf"}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+        with pytest.raises(ApiError):
+            cbobj.open_fd()
+
     def test_fd_path_overwrite_true(self, cbexport, apiobj, tmp_path):
         """Pass."""
         export_file = tmp_path / "badwolf.txt"
@@ -51,6 +51,35 @@ class CallbacksBase(Callbacks):
 
         cbobj.stop()
 
+    @pytest.mark.parametrize("field_explode", ["", "field_complex"])
+    def test_process_rows_workers(self, cbexport, apiobj, field_explode):
+        """Pass."""
+        getargs = {
+            "field_flatten": True,
+            "field_titles": True,
+            "field_join": True,
+            "field_null": True,
+            "field_explode": apiobj.TEST_DATA.get(field_explode, ""),
+        }
+        rows = apiobj.TEST_DATA["cb_assets"][:50]
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs=copy.deepcopy(getargs)
+        )
+        rows_serial = list(cbobj.process_rows(rows=copy.deepcopy(rows)))
+
+        state = {"row_workers": 2, "row_chunk_size": 7}
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs=getargs, state=state
+        )
+        cbobj.start()
+        rows_pool = list(cbobj.process_rows(rows=copy.deepcopy(rows)))
+        assert cbobj._row_pool is not None
+        cbobj.stop()
+        assert cbobj._row_pool is None
+
+        assert rows_pool == rows_serial
+
 
 class TestDevicesCallbacksBase(CallbacksBase):
     """Pass."""
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import copy
+import io
+import json
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_columnar import (
+    get_base_type,
+    get_coerce,
+)
+from axonius_api_client.exceptions import ApiError
+
+from .callbacks import Callbacks, load_test_data
+
+
+class CallbacksColumnar(Callbacks):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        """Pass."""
+        return "columnar"
+
+    def test_row_as_is(self, cbexport, apiobj):
+        """Pass."""
+        rows = copy.deepcopy(apiobj.TEST_DATA["cb_assets"][:200])
+
+        io_fd = io.StringIO()
+        getargs = {
+            "export_fd": io_fd,
+            "columnar_format": "json",
+            "columnar_row_group_size": 50,
+        }
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+
+        for row in rows:
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert rows_ret == [{"internal_axon_id": row_id}]
+
+        cbobj.stop()
+        lines = io_fd.getvalue().splitlines()
+        header = json.loads(lines[0])
+        names = [x["name"] for x in header["columns"]]
+        assert names == cbobj.final_columns
+
+        groups = [json.loads(x) for x in lines[1:]]
+        assert all(x["rows"] <= 50 for x in groups)
+        assert sum(x["rows"] for x in groups) == len(rows)
+        for group in groups:
+            assert list(group["columns"]) == names
+            for values in group["columns"].values():
+                assert len(values) == group["rows"]
+
+    def test_row_parquet(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        rows = copy.deepcopy(apiobj.TEST_DATA["cb_assets"][:200])
+
+        path = tmp_path / "export.parquet"
+        getargs = {"export_file": str(path), "columnar_format": "parquet"}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+        for row in rows:
+            cbobj.process_row(row=row)
+        cbobj.stop()
+
+        table = parquet.read_table(str(path))
+        assert table.num_rows == len(rows)
+        assert table.column_names == cbobj.final_columns
+
+    def test_invalid_format(self, cbexport, apiobj):
+        """Pass."""
+        getargs = {"export_fd": io.StringIO(), "columnar_format": "badwolf"}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        with pytest.raises(ApiError):
+            cbobj.start()
+
+
+class TestColumnarCoerce:
+    """Pass."""
+
+    @pytest.mark.parametrize(
+        "type_norm,exp",
+        [
+            ["string", "string"],
+            ["list_string", "string"],
+            ["integer", "integer"],
+            ["list_number", "number"],
+            ["bool", "bool"],
+            ["datetime", "string"],
+            ["complex", "string"],
+        ],
+    )
+    def test_get_base_type(self, type_norm, exp):
+        """Pass."""
+        assert get_base_type(type_norm=type_norm) == exp
+
+    def test_coerce_list(self):
+        """Pass."""
+        coerce = get_coerce(base="integer", is_list=True)
+        assert coerce(None) is None
+        assert coerce("1") == [1]
+        assert coerce(["1", 2, "x"]) == [1, 2, None]
+
+    def test_coerce_scalar(self):
+        """Pass."""
+        coerce = get_coerce(base="string", is_list=False, joiner="|")
+        assert coerce(None) is None
+        assert coerce([]) is None
+        assert coerce(["a", "b"]) == "a|b"
+        assert coerce({"a": 1}) == '{"a": 1}'
+
+        coerce = get_coerce(base="bool", is_list=False)
+        assert coerce([True, False]) is True
+        assert coerce("False") is False
+
+        coerce = get_coerce(base="number", is_list=False)
+        assert coerce("1.5") == 1.5
+        assert coerce("x") is None
+
+
+class TestDevicesCallbacksColumnar(CallbacksColumnar):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_devices):
+        """Pass."""
+        return load_test_data(apiobj=api_devices)
+
+
+class TestUsersCallbacksColumnar(CallbacksColumnar):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_users):
+        """Pass."""
+        return load_test_data(apiobj=api_users)
@@ -5,8 +5,11 @@ import io
 import json
 
 import pytest
+from axonius_api_client.api.asset_callbacks.base_json import JsonWriter
+from axonius_api_client.exceptions import ApiError
 
 from .callbacks import Callbacks, load_test_data
+from .test_callbacks_rows import FakeLabels, get_apiobj, get_cbobj, get_rows
 
 
 class CallbacksJson(Callbacks):
@@ -98,3 +101,78 @@ class TestUsersCallbacksJson(CallbacksJson):
     def apiobj(self, api_users):
         """Pass."""
         return load_test_data(apiobj=api_users)
+
+
+class TestJsonWriter:
+    """Pass."""
+
+    ROWS = [{"a": "x\ny", "b": [1, {"c": None}]}, {"a": "badwolfé", "b": []}]
+
+    @pytest.mark.parametrize("buffer_size", [1, None])
+    def test_list(self, buffer_size):
+        """Pass."""
+        io_fd = io.StringIO()
+        writer = JsonWriter(fd=io_fd, buffer_size=buffer_size)
+        writer.start()
+        for row in self.ROWS:
+            writer.write(row=row)
+        writer.stop()
+
+        output = io_fd.getvalue()
+        assert json.loads(output) == self.ROWS
+        assert output.splitlines()[1] == "  {"
+        assert writer.count == len(self.ROWS)
+
+    def test_flat(self):
+        """Pass."""
+        io_fd = io.StringIO()
+        writer = JsonWriter(fd=io_fd, flat=True)
+        writer.start()
+        for row in self.ROWS:
+            writer.write(row=row)
+        writer.stop()
+
+        lines = io_fd.getvalue().splitlines()
+        assert [json.loads(x) for x in lines] == self.ROWS
+
+    def test_empty(self):
+        """Pass."""
+        io_fd = io.StringIO()
+        writer = JsonWriter(fd=io_fd)
+        writer.start()
+        writer.stop()
+        assert json.loads(io_fd.getvalue()) == []
+
+    def test_auto(self):
+        """Pass."""
+        writer = JsonWriter(fd=io.StringIO(), backend="auto")
+        assert writer.backend in ["json", "orjson"]
+
+    def test_bad_backend(self):
+        """Pass."""
+        with pytest.raises(ApiError):
+            JsonWriter(fd=io.StringIO(), backend="badwolf")
+
+    def test_stop_error(self):
+        """Test buffered rows are written when a stop callback fails."""
+        class CloseIO(io.StringIO):
+            def close(self):
+                self.value = self.getvalue()
+                super().close()
+
+        io_fd = CloseIO()
+        apiobj = get_apiobj(labels=FakeLabels(error=ValueError("badwolf")))
+        getargs = {"export_fd": io_fd, "export_fd_close": True, "tags_add": ["a"]}
+        cbobj = get_cbobj(getargs=getargs, cbexport="json", apiobj=apiobj)
+        cbobj.start()
+
+        rows = get_rows(count=3)
+        for row in rows:
+            cbobj.process_row(row=copy.deepcopy(row))
+
+        with pytest.raises(ValueError, match="badwolf"):
+            cbobj.stop()
+
+        assert io_fd.closed
+        ids = [x["internal_axon_id"] for x in json.loads(io_fd.value + "]")]
+        assert ids == [x["internal_axon_id"] for x in rows]
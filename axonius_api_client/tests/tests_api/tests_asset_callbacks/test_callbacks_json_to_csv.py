@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import copy
+import io
+
+import pytest
+
+from .callbacks import Callbacks, load_test_data
+
+
+class CallbacksJsonToCsv(Callbacks):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        """Pass."""
+        return "json_to_csv"
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_row_as_is(self, cbexport, apiobj, compress):
+        """Pass."""
+        rows = copy.deepcopy(apiobj.TEST_DATA["cb_assets"][:200])
+
+        csv_fd = io.StringIO()
+        getargs = {"export_fd": csv_fd}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport="csv", getargs=getargs)
+        cbobj.start()
+        for row in copy.deepcopy(rows):
+            cbobj.process_row(row=row)
+        cbobj.stop()
+
+        io_fd = io.StringIO()
+        getargs = {"export_fd": io_fd, "json_to_csv_compress": compress}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+        assert not io_fd.getvalue()
+
+        for row in rows:
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert len(rows_ret) == 1
+            assert rows_ret[0] == {"internal_axon_id": row_id}
+
+        assert cbobj.STATE["rows_processed_total"] == len(rows)
+
+        cbobj.stop()
+        output = io_fd.getvalue()
+        assert output.endswith("\n\n")
+        assert output == csv_fd.getvalue()
+
+
+class TestDevicesCallbacksJsonToCsv(CallbacksJsonToCsv):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_devices):
+        """Pass."""
+        return load_test_data(apiobj=api_devices)
+
+
+class TestUsersCallbacksJsonToCsv(CallbacksJsonToCsv):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_users):
+        """Pass."""
+        return load_test_data(apiobj=api_users)
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""Test suite for asset callbacks that do not need an Axonius instance."""
+import copy
+import itertools
+import logging
+import time
+import types
+
+import pytest
+from axonius_api_client.api.asset_callbacks import get_callbacks_cls
+from axonius_api_client.api.asset_callbacks.base import Base
+from axonius_api_client.constants import (
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    FIELD_TRIM_STR,
+    TAGS_STREAM_SIZE,
+)
+from axonius_api_client.tools import listify
+
+
+def get_schema(name, title, sub_fields=None):
+    """Pass."""
+    return {
+        "name": name.split(".")[-1],
+        "name_base": name.split(".")[-1],
+        "name_qual": name,
+        "column_title": title,
+        "is_complex": sub_fields is not None,
+        "is_root": True,
+        "sub_fields": sub_fields or [],
+    }
+
+
+NICS = "specific_data.data.network_interfaces"
+SCHEMAS = [
+    get_schema("internal_axon_id", "Asset Unique ID"),
+    get_schema("specific_data.data.hostname", "Host Name"),
+    get_schema(
+        NICS,
+        "Network Interfaces",
+        sub_fields=[
+            get_schema(f"{NICS}.mac", "Network Interfaces: MAC"),
+            get_schema(f"{NICS}.ips", "Network Interfaces: IPs"),
+        ],
+    ),
+]
+FIELDS_MAP = {"agg": SCHEMAS}
+FIELDS = [x["name_qual"] for x in SCHEMAS[1:]]
+
+
+def get_rows(count=20):
+    """Pass."""
+    rows = []
+    for idx in range(count):
+        row = {
+            "internal_axon_id": f"id{idx}",
+            "specific_data.data.hostname": [f"host{idx}", f"host{idx}.badwolf"],
+            NICS: [
+                {"mac": f"00:00:{idx}", "ips": [f"10.0.0.{idx}", f"10.0.1.{idx}"]},
+                {"ips": [f"10.0.2.{idx}"]},
+            ],
+        }
+        if idx % 5 == 0:
+            row.pop(NICS)
+        if idx % 7 == 0:
+            row.pop("specific_data.data.hostname")
+        rows.append(row)
+    return rows
+
+
+class FakeLabels:
+    """Pass."""
+
+    def __init__(self, delay=0, error=None):
+        """Pass."""
+        self.calls = []
+        self.delay = delay
+        self.error = error
+
+    def add(self, rows, labels):
+        """Pass."""
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.calls.append(("add", [x["internal_axon_id"] for x in rows], labels))
+        return len(rows)
+
+    def remove(self, rows, labels):
+        """Pass."""
+        self.calls.append(("remove", [x["internal_axon_id"] for x in rows], labels))
+        return len(rows)
+
+
+def get_apiobj(labels=None):
+    """Pass."""
+    return types.SimpleNamespace(
+        LOG=logging.getLogger("axonius_api_client.tests.callbacks"),
+        FIELDS_API=["internal_axon_id"],
+        labels=labels or FakeLabels(),
+        adapters=types.SimpleNamespace(get=lambda: []),
+        fields=types.SimpleNamespace(_prettify_schemas=lambda schemas: []),
+    )
+
+
+def get_cbobj(getargs=None, state=None, cbexport="base", apiobj=None):
+    """Pass."""
+    return get_callbacks_cls(export=cbexport)(
+        apiobj=apiobj or get_apiobj(),
+        fields_map=FIELDS_MAP,
+        getargs=getargs or {},
+        state=state or {},
+        store={"fields": FIELDS},
+    )
+
+
+class BaselineBase(Base):
+    """Callbacks that run each step against each row like before row_plan."""
+
+    def do_row(self, row):
+        """Pass."""
+        self.process_tags_to_add(row=row)
+        self.process_tags_to_remove(row=row)
+        self.add_report_adapters_missing(row=row)
+
+        for schema in self.schemas_selected:
+            self.do_excludes(row=row, schema=schema)
+            self.do_add_null_values(row=row, schema=schema)
+            self.do_flatten_fields(row=row, schema=schema)
+
+        new_rows = self.do_explode_field(row=row)
+        for new_row in new_rows:
+            self.do_join_values(row=new_row)
+            self.do_change_field_titles(row=new_row)
+
+        return new_rows
+
+    def do_add_null_values(self, row, schema, key="name_qual"):
+        """Pass."""
+        if not self.GETARGS.get("field_null", False) or self.is_excluded(schema=schema):
+            return
+
+        null_value = self.GETARGS.get("field_null_value", None)
+        field = schema[key]
+
+        if schema["is_complex"]:
+            row[field] = listify(row.get(field, []))
+
+            for item in row[field]:
+                for sub_schema in self.get_sub_schemas(schema=schema):
+                    self.do_add_null_values(schema=sub_schema, row=item, key="name")
+        else:
+            row[field] = row.get(field, null_value)
+
+    def do_excludes(self, row, schema):
+        """Pass."""
+        if not self.GETARGS.get("field_excludes", []):
+            return
+
+        if self.is_excluded(schema=schema):
+            row.pop(schema["name_qual"], None)
+            return
+
+        if schema["is_complex"]:
+            items = listify(row.get(schema["name_qual"], []))
+            for sub_schema in schema["sub_fields"]:
+                if self.is_excluded(schema=sub_schema):
+                    for item in items:
+                        item.pop(sub_schema["name"], None)
+
+    def do_join_values(self, row):
+        """Pass."""
+        if not self.GETARGS.get("field_join", False):
+            return
+
+        joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
+        trim_len = self.GETARGS.get("field_join_trim", FIELD_TRIM_LEN)
+
+        for field in row:
+            if isinstance(row[field], list):
+                row[field] = joiner.join([str(x) for x in row[field]])
+
+            if trim_len and isinstance(row[field], str):
+                field_len = len(row[field])
+                if len(row[field]) >= trim_len:
+                    msg = FIELD_TRIM_STR.format(field_len=field_len, trim_len=trim_len)
+                    row[field] = joiner.join([row[field][:trim_len], msg])
+
+    def do_change_field_titles(self, row):
+        """Pass."""
+        if not self.GETARGS.get("field_titles", False):
+            return
+
+        for schema in self.final_schemas:
+            row[schema["column_title"]] = row.pop(schema["name_qual"], None)
+
+    def _do_flatten_fields(self, row, schema):
+        """Pass."""
+        if self.is_excluded(schema=schema):
+            return
+
+        if not schema["is_complex"]:
+            return
+
+        null_value = self.GETARGS.get("field_null_value", None)
+
+        items = listify(row.pop(schema["name_qual"], []))
+
+        for sub_schema in self.get_sub_schemas(schema=schema):
+            row[sub_schema["name_qual"]] = []
+
+            for item in items:
+                value = item.pop(sub_schema["name"], null_value)
+                value = value if isinstance(value, list) else [value]
+                row[sub_schema["name_qual"]] += value
+
+    def do_explode_field(self, row):
+        """Pass."""
+        explode = self.GETARGS.get("field_explode", "")
+        null_value = self.GETARGS.get("field_null_value", None)
+
+        if not explode:
+            return [row]
+
+        schema = self.schema_to_explode
+
+        if self.is_excluded(schema=schema):
+            return [row]
+
+        original_row = copy.deepcopy(row)
+
+        if schema["is_complex"]:
+            new_rows_map = {}
+            items = listify(row.pop(schema["name_qual"], []))
+
+            for sub_schema in self.get_sub_schemas(schema=schema):
+                for idx, item in enumerate(items):
+                    new_rows_map.setdefault(idx, copy.deepcopy(row))
+                    value = item.pop(sub_schema["name"], null_value)
+                    new_rows_map[idx][sub_schema["name_qual"]] = value
+        else:
+            new_rows_map = {}
+            items = listify(row.pop(schema["name_qual"], []))
+
+            for idx, item in enumerate(items):
+                new_rows_map.setdefault(idx, copy.deepcopy(row))
+                new_rows_map[idx][schema["name_qual"]] = item
+
+        new_rows = [new_rows_map[idx] for idx in new_rows_map]
+
+        if not new_rows:
+            self._do_flatten_fields(row=original_row, schema=schema)
+            return [original_row]
+
+        return new_rows
+
+
+def get_baseline(getargs):
+    """Pass."""
+    return BaselineBase(
+        apiobj=get_apiobj(),
+        fields_map=FIELDS_MAP,
+        getargs=getargs,
+        store={"fields": FIELDS},
+    )
+
+
+GETARGS_ROW = [
+    {
+        "field_null": null,
+        "field_flatten": flatten,
+        "field_join": join,
+        "field_titles": titles,
+        "field_explode": explode,
+        "field_excludes": excludes,
+        "field_join_trim": 12,
+        "field_null_value": "badwolf",
+    }
+    for null, flatten, join, titles, explode, excludes in itertools.product(
+        [False, True],
+        [False, True],
+        [False, True],
+        [False, True],
+        ["", "specific_data.data.hostname", NICS],
+        [[], ["Host Name", f"{NICS}.mac"]],
+    )
+]
+
+
+class TestRowPlan:
+    """Test rows transformed with row_plan match the rows from before it."""
+
+    @pytest.mark.parametrize("getargs", GETARGS_ROW)
+    def test_do_row(self, getargs):
+        """Test null, flatten, join, titles, explode and excludes in any combination."""
+        cbobj = get_cbobj(getargs=dict(getargs))
+        baseline = get_baseline(getargs=dict(getargs))
+
+        for row in get_rows():
+            expected = baseline.do_row(row=copy.deepcopy(row))
+            assert cbobj.do_row(row=copy.deepcopy(row)) == expected
+
+
+class TestExplode:
+    """Test exploding a field into rows."""
+
+    @pytest.mark.parametrize("explode", ["specific_data.data.hostname", NICS])
+    @pytest.mark.parametrize("null", [False, True])
+    def test_deepcopy(self, explode, null):
+        """Test the rows match the rows from deep copying the row for each item."""
+        getargs = {"field_explode": explode, "field_null": null}
+        cbobj = get_cbobj(getargs=dict(getargs))
+        baseline = get_baseline(getargs=dict(getargs))
+
+        for row in get_rows():
+            expected = baseline.do_explode_field(row=copy.deepcopy(row))
+            assert cbobj.do_explode_field(row=copy.deepcopy(row)) == expected
+
+    @pytest.mark.parametrize("join", [False, True])
+    def test_isolated(self, join):
+        """Test changing one exploded row does not change the rows next to it."""
+        getargs = {"field_explode": NICS, "field_join": join}
+        cbobj = get_cbobj(getargs=getargs)
+        row = get_rows()[1]
+
+        new_rows = cbobj.do_row(row=copy.deepcopy(row))
+        expected = copy.deepcopy(new_rows[1:])
+        assert len(new_rows) == 2
+
+        new_rows[0]["internal_axon_id"] = "badwolf"
+        new_rows[0]["specific_data.data.hostname"] = "badwolf"
+        new_rows[0][f"{NICS}.ips"] = "badwolf"
+        new_rows[0].pop(f"{NICS}.mac")
+        new_rows[0]["badwolf"] = "badwolf"
+        assert new_rows[1:] == expected
+
+
+class TestRowWorkers:
+    """Test transforming rows in a pool of processes."""
+
+    def test_process_rows_pool(self):
+        """Test rows from the pool match the rows transformed in this process."""
+        getargs = {"field_flatten": True, "field_join": True, "field_titles": True}
+        rows = get_rows()
+
+        cbobj = get_cbobj(getargs=getargs)
+        rows_serial = list(cbobj.process_rows(rows=copy.deepcopy(rows)))
+
+        cbobj = get_cbobj(getargs=getargs, state={"row_workers": 2, "row_chunk_size": 3})
+        rows_pool = list(cbobj.process_rows(rows=copy.deepcopy(rows)))
+        assert cbobj._row_pool is not None
+        cbobj.stop_row_pool()
+        assert cbobj._row_pool is None
+
+        assert rows_pool == rows_serial
+        assert rows_pool[1] == [
+            {
+                "Asset Unique ID": "id1",
+                "Host Name": "host1\nhost1.badwolf",
+                "Network Interfaces: MAC": "00:00:1\nNone",
+                "Network Interfaces: IPs": "10.0.0.1\n10.0.1.1\n10.0.2.1",
+            }
+        ]
+
+    def test_stop_row_pool_unfinished(self):
+        """Test the pool shuts down when rows are left in the pool."""
+        cbobj = get_cbobj(state={"row_workers": 2, "row_chunk_size": 1})
+        rows = cbobj.process_rows(rows=get_rows())
+        assert next(rows)[0]["internal_axon_id"] == "id0"
+        rows.close()
+        cbobj.stop_row_pool()
+        assert cbobj._row_pool is None
+
+
+class TestTags:
+    """Test adding and removing tags for the rows processed."""
+
+    def test_dedupe(self):
+        """Test rows seen more than once are tagged once."""
+        apiobj = get_apiobj()
+        cbobj = get_cbobj(getargs={"tags_add": ["a"]}, apiobj=apiobj)
+        rows = get_rows(count=3)
+
+        for row in rows + rows:
+            cbobj.process_row(row=copy.deepcopy(row))
+
+        assert cbobj.TAG_IDS_ADD == {"id0", "id1", "id2"}
+        assert len(cbobj.TAG_ROWS_ADD) == 3
+
+        cbobj.stop()
+        assert apiobj.labels.calls == [("add", ["id0", "id1", "id2"], ["a"])]
+
+    def test_stream_flush(self):
+        """Test queued rows are flushed each time TAGS_STREAM_SIZE rows are queued."""
+        apiobj = get_apiobj()
+        getargs = {"tags_add": ["a"], "tags_remove": ["b"], "tags_stream": True}
+        cbobj = get_cbobj(getargs=getargs, apiobj=apiobj)
+        rows = get_rows(count=TAGS_STREAM_SIZE + 1)
+
+        for row in rows[:TAGS_STREAM_SIZE - 1]:
+            cbobj.process_row(row=row)
+        assert not cbobj.TAG_FUTURES
+        assert len(cbobj.TAG_ROWS_ADD) == TAGS_STREAM_SIZE - 1
+
+        cbobj.process_row(row=rows[TAGS_STREAM_SIZE - 1])
+        assert len(cbobj.TAG_FUTURES) == 2
+        assert not cbobj.TAG_ROWS_ADD
+        assert not cbobj.TAG_ROWS_REMOVE
+
+        cbobj.process_row(row=rows[-1])
+        cbobj.stop()
+
+        ids = [x["internal_axon_id"] for x in rows]
+        assert sorted(apiobj.labels.calls) == [
+            ("add", ids[:TAGS_STREAM_SIZE], ["a"]),
+            ("add", ids[TAGS_STREAM_SIZE:], ["a"]),
+            ("remove", ids[:TAGS_STREAM_SIZE], ["b"]),
+            ("remove", ids[TAGS_STREAM_SIZE:], ["b"]),
+        ]
+
+    def test_stream_error(self):
+        """Test the error of a background batch that failed is raised by stop."""
+        apiobj = get_apiobj(labels=FakeLabels(error=ValueError("badwolf")))
+        getargs = {"tags_add": ["a"], "tags_stream": True, "tags_stream_size": 2}
+        cbobj = get_cbobj(getargs=getargs, apiobj=apiobj)
+
+        for row in get_rows(count=3):
+            cbobj.process_row(row=row)
+
+        with pytest.raises(ValueError, match="badwolf"):
+            cbobj.stop()
+        assert not cbobj.TAG_FUTURES
+        assert not hasattr(cbobj, "_tag_executor")
+
+    def test_wait(self):
+        """Test do_tag_wait waits for the background batches and removes them."""
+        apiobj = get_apiobj(labels=FakeLabels(delay=0.05))
+        getargs = {"tags_add": ["a"], "tags_stream": True, "tags_stream_size": 1}
+        cbobj = get_cbobj(getargs=getargs, apiobj=apiobj)
+
+        for row in get_rows(count=3):
+            cbobj.process_row(row=row)
+        assert len(cbobj.TAG_FUTURES) == 3
+
+        cbobj.do_tag_wait()
+        assert not cbobj.TAG_FUTURES
+        assert len(apiobj.labels.calls) == 3
+        cbobj.do_tag_wait()
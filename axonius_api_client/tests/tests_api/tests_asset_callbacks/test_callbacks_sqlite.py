@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import copy
+import sqlite3
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_sqlite import get_column, to_sql
+from axonius_api_client.exceptions import ApiError
+
+from ...utils import log_check
+from .callbacks import Callbacks, load_test_data
+
+
+class CallbacksSqlite(Callbacks):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        """Pass."""
+        return "sqlite"
+
+    def test_start_stop(self, cbexport, apiobj, caplog, tmp_path):
+        """Pass."""
+        getargs = {"export_file": "export.db", "export_path": tmp_path}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        assert not caplog.records
+
+        cbobj.start()
+        log_check(caplog=caplog, entries=["Starting"], exists=True)
+
+        cbobj.stop()
+        log_check(caplog=caplog, entries=["Stopping"], exists=True)
+
+    def test_start_no_file(self, cbexport, apiobj):
+        """Pass."""
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={})
+        with pytest.raises(ApiError):
+            cbobj.start()
+
+    def test_row_as_is(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        rows = copy.deepcopy(apiobj.TEST_DATA["cb_assets"][:200])
+
+        getargs = {
+            "export_file": "export.db",
+            "export_path": tmp_path,
+            "sqlite_batch_size": 50,
+        }
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+
+        for row in rows:
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert rows_ret == [{"internal_axon_id": row_id}]
+
+        cbobj.stop()
+
+        main, *children = cbobj._tables
+        conn = sqlite3.connect(str(tmp_path / "export.db"))
+        count = conn.execute(f'SELECT COUNT(*) FROM "{main["name"]}"').fetchone()[0]
+        assert count == len(rows)
+
+        query = "SELECT tbl_name FROM sqlite_master WHERE type='index'"
+        indexes = [x[0] for x in conn.execute(query)]
+        assert main["name"] in indexes
+        for child in children:
+            assert child["name"] in indexes
+            count = conn.execute(f'SELECT COUNT(*) FROM "{child["name"]}"').fetchone()[0]
+            assert count == child["rows"]
+        conn.close()
+
+    def test_index_invalid(self, cbexport, apiobj, tmp_path):
+        """Pass."""
+        getargs = {
+            "export_file": "export.db",
+            "export_path": tmp_path,
+            "sqlite_indexes": ["badwolf"],
+        }
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+        with pytest.raises(ApiError):
+            cbobj.stop()
+
+
+class TestSqliteValues:
+    """Pass."""
+
+    @pytest.mark.parametrize(
+        "schema,affinity,is_list",
+        [
+            [{"type_norm": "string"}, "TEXT", False],
+            [{"type_norm": "integer"}, "INTEGER", False],
+            [{"type_norm": "bool"}, "INTEGER", False],
+            [{"type_norm": "number"}, "REAL", False],
+            [{"type_norm": "list_integer"}, "TEXT", True],
+            [{"type_norm": "string", "is_list": True}, "TEXT", True],
+            [{"type_norm": "complex", "is_list": True, "is_complex": True}, "TEXT", 0],
+        ],
+    )
+    def test_get_column(self, schema, affinity, is_list):
+        """Pass."""
+        column = get_column(name="x", schema=schema)
+        assert column["affinity"] == affinity
+        assert column["is_list"] == is_list
+
+    def test_to_sql(self):
+        """Pass."""
+        assert to_sql(None) is None
+        assert to_sql([]) is None
+        assert to_sql(["a"]) == "a"
+        assert to_sql(["a", "b"]) == '["a", "b"]'
+        assert to_sql({"a": 1}) == '{"a": 1}'
+        assert to_sql(1) == 1
+        assert to_sql("a", is_list=True) == '["a"]'
+        assert to_sql(None, is_list=True) is None
+
+
+class TestDevicesCallbacksSqlite(CallbacksSqlite):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_devices):
+        """Pass."""
+        return load_test_data(apiobj=api_devices)
+
+
+class TestUsersCallbacksSqlite(CallbacksSqlite):
+    """Pass."""
+
+    @pytest.fixture(scope="class")
+    def apiobj(self, api_users):
+        """Pass."""
+        return load_test_data(apiobj=api_users)
@@ -6,6 +6,7 @@ import io
 
 import pytest
 
+from axonius_api_client.api.asset_callbacks.base_table import get_widths, trim_cell
 from axonius_api_client.constants import AGG_ADAPTER_NAME
 from axonius_api_client.exceptions import ApiError
 
@@ -55,6 +56,37 @@ class CallbacksTable(Callbacks):
         for i in sub_titles:
             assert i in checklines
 
+    def test_row_stream(self, cbexport, apiobj):
+        """Pass."""
+        io_fd = io.StringIO()
+
+        getargs = {
+            "export_fd": io_fd,
+            "table_stream": True,
+            "table_stream_size": 20,
+            "table_max_rows": 0,
+            "table_format": "simple",
+        }
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        cbobj.start()
+
+        rows = copy.deepcopy(apiobj.TEST_DATA["cb_assets"][:50])
+        for idx, row in enumerate(rows, start=1):
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert rows_ret == [{"internal_axon_id": row_id}]
+            assert len(cbobj._rows) == idx % 20
+
+        assert cbobj._pages == 2
+        cbobj.stop()
+        assert cbobj._pages == 3
+
+        lines = io_fd.getvalue().splitlines()
+        header, rule = lines[:2]
+        assert lines.count(header) == 3
+        assert all(len(x) <= len(rule) for x in lines)
+
     def test_check_table_format(self, cbexport, apiobj):
         """Pass."""
         getargs = {}
@@ -72,6 +104,25 @@ class CallbacksTable(Callbacks):
         assert cbobj.STATE["stop_msg"]
 
 
+class TestTableStream:
+    """Pass."""
+
+    def test_trim_cell(self):
+        """Pass."""
+        assert trim_cell(value=None, width=5) == ""
+        assert trim_cell(value="abc", width=5) == "abc"
+        assert trim_cell(value="abcdefgh", width=5) == "ab..."
+        assert trim_cell(value="abcdefgh\nxy", width=5) == "ab...\nxy"
+        assert trim_cell(value=["abcdefgh", 1], width=5) == "ab...\n1"
+        assert trim_cell(value="abcdefgh", width=2) == ".."
+
+    def test_get_widths(self):
+        """Pass."""
+        rows = [{"a": "x" * 50, "bb": None}, {"a": "y\nzz", "bb": 1}]
+        assert get_widths(columns=["a", "bb"], rows=rows, max_width=10) == [10, 2]
+        assert get_widths(columns=["a", "bb"], rows=rows, max_width=0) == [50, 2]
+
+
 class TestDevicesCallbacksTable(CallbacksTable):
     """Pass."""
 
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import json
+
 import pytest
 import requests
 
@@ -288,6 +290,48 @@ class AssetsPublic:
         check_assets(rows)
         assert len(rows) == 20
 
+    def test_get_page_adaptive(self, apiobj):
+        """Pass."""
+        rows = apiobj.get(
+            page_size=10,
+            max_pages=3,
+            page_adaptive=True,
+            page_target_seconds=60,
+            page_size_min=5,
+        )
+        check_assets(rows)
+        assert len(rows) == 70
+        assert apiobj._LAST_CALLBACKS.STATE["page_size"] == 80
+
+    def test_get_checkpoint_resume(self, apiobj, tmp_path):
+        """Pass."""
+        checkpoint_file = tmp_path / "checkpoint.json"
+        kwargs = {
+            "export": "json",
+            "export_file": "export.json",
+            "export_path": tmp_path,
+            "export_overwrite": True,
+            "use_cursor": False,
+            "page_size": 20,
+            "max_rows": 60,
+            "checkpoint_file": checkpoint_file,
+        }
+
+        for idx, row in enumerate(apiobj.get(generator=True, **kwargs)):
+            if idx == 30:
+                break
+
+        assert checkpoint_file.is_file()
+        checkpoint = json.loads(checkpoint_file.read_text())
+        assert checkpoint["state"]["rows_processed_total"] == 20
+
+        rows = apiobj.get(resume=True, **kwargs)
+        assert len(rows) == 40
+        assert not checkpoint_file.is_file()
+
+        exported = json.loads((tmp_path / "export.json").read_text())
+        assert len(exported) == 60
+
     def test_get_id(self, apiobj):
         """Pass."""
         asset = apiobj.TEST_DATA["assets"][0]
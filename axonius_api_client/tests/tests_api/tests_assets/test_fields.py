@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import json
+import logging
+
 import pytest
+from axonius_api_client.api.assets.fields import Fields
+from axonius_api_client.api.routers import API_VERSION
 from axonius_api_client.constants import AGG_ADAPTER_ALTS, AGG_ADAPTER_NAME
 from axonius_api_client.exceptions import ApiError, NotFoundError
+from axonius_api_client.http import Http
 
-from ...meta import (FIELD_FORMATS, NORM_TYPES, SCHEMA_FIELD_FORMATS,
-                     SCHEMA_TYPES)
+from ...meta import FIELD_FORMATS, NORM_TYPES, SCHEMA_FIELD_FORMATS, SCHEMA_TYPES
 
 
 def load_test_data(apiobj):
@@ -201,6 +206,41 @@ class FieldsPublic:
         assert isinstance(fields_map[AGG_ADAPTER_NAME], list)
         self.val_parsed_fields(fields_map=fields_map)
 
+    def test_get_cache(self, apiobj):
+        """Pass."""
+        cache_ttl = apiobj.fields.cache_ttl
+        apiobj.fields.cache_ttl = 60
+        try:
+            fields_map = apiobj.fields.get()
+            assert apiobj.fields.get() is fields_map
+
+            refreshed = apiobj.fields.get(cache=False)
+            assert refreshed is not fields_map
+            assert apiobj.fields.get() is refreshed
+
+            apiobj.fields._cache["created"] -= 60
+            assert apiobj.fields.get() is not refreshed
+        finally:
+            apiobj.fields.cache_ttl = cache_ttl
+            apiobj.fields.cache_clear(disk=False)
+
+    def test_get_cache_disk(self, apiobj, tmp_path):
+        """Pass."""
+        apiobj.fields.cache_path = tmp_path
+        try:
+            apiobj.fields.cache_clear()
+            fields_map = apiobj.fields.get()
+            files = list(tmp_path.glob("fields_*.json"))
+            assert len(files) == 1
+
+            apiobj.fields.cache_clear(disk=False)
+            assert apiobj.fields.get() == fields_map
+
+            apiobj.fields.cache_clear()
+            assert not list(tmp_path.glob("fields_*.json"))
+        finally:
+            apiobj.fields.cache_path = None
+
     def val_parsed_fields(self, fields_map):
         """Pass."""
         assert isinstance(fields_map, dict)
@@ -426,6 +466,27 @@ class FieldsPublic:
         )
         assert exp == result
 
+    def test_get_index(self, apiobj):
+        """Pass."""
+        fields_map = apiobj.TEST_DATA["fields_map"]
+        index = apiobj.fields.get_index(fields_map=fields_map)
+        assert index is apiobj.fields.get_index(fields_map=fields_map)
+        assert index.fields_map is fields_map
+
+        schemas = fields_map[AGG_ADAPTER_NAME]
+        for schema in schemas:
+            if not schema.get("selectable"):
+                continue
+            exp = apiobj.fields.get_field_schema(
+                value=schema["name_qual"], schemas=schemas
+            )
+            assert index[AGG_ADAPTER_NAME].get(value=schema["name_qual"]) is exp
+
+        assert index[AGG_ADAPTER_NAME].get(value="badwolf") is None
+        assert index[AGG_ADAPTER_NAME].search(
+            value="l"
+        ) == apiobj.fields.get_field_schemas(value="l", schemas=schemas)
+
     def test_get_field_schema_error(self, apiobj):
         """Pass."""
         search = "badwolf"
@@ -565,6 +626,110 @@ class TestFieldsUsers(FieldsPrivate, FieldsPublic):
         return load_test_data(api_users)
 
 
+class FakeParent:
+    """Pass."""
+
+    def __init__(self):
+        """Pass."""
+        self.LOG = logging.getLogger("axonius_api_client.tests.fields")
+        self.http = Http(url="https://badwolf:3443")
+        self.auth = None
+        self.router = API_VERSION.devices
+        self.request_async = self.request_stream = None
+        self.calls = []
+
+    def request(self, method, path):
+        """Pass."""
+        self.calls.append(path)
+        if path == API_VERSION.system.meta_about:
+            return {"Version": "3_3_0"}
+        return {
+            "generic": [{"name": "hostname", "title": "Host Name", "type": "string"}],
+            "specific": {"aws_adapter": []},
+        }
+
+
+class TestFieldsCache:
+    """Test caching fields in memory and on disk without an Axonius instance."""
+
+    @pytest.fixture
+    def fields(self):
+        """Pass."""
+        return Fields(parent=FakeParent())
+
+    def test_disabled(self, fields):
+        """Test fields are fetched each time by default."""
+        assert fields.cache_ttl == 0
+        assert fields.get() is not fields.get()
+        assert fields.parent.calls == [API_VERSION.devices.fields] * 2
+
+    def test_memory_ttl(self, fields):
+        """Test fields are cached in memory until cache_ttl expires."""
+        fields.cache_ttl = 60
+        fields_map = fields.get()
+        assert fields.get() is fields_map
+        assert len(fields.parent.calls) == 1
+
+        fields._cache["created"] -= 60
+        assert fields.get() is not fields_map
+        assert len(fields.parent.calls) == 2
+
+        assert fields.get(cache=False) is not fields_map
+        assert len(fields.parent.calls) == 3
+
+    def test_cache_clear(self, fields, tmp_path):
+        """Test cache_clear removes fields cached in memory and on disk."""
+        fields.cache_ttl = 60
+        fields.cache_path = tmp_path
+        fields.get()
+        assert len(list(tmp_path.iterdir())) == 1
+
+        fields.cache_clear(disk=False)
+        assert fields._cache is None
+        assert len(list(tmp_path.iterdir())) == 1
+
+        fields.get()
+        fields.cache_clear()
+        assert fields._cache is None
+        assert not list(tmp_path.iterdir())
+
+    def test_version(self, fields, tmp_path):
+        """Test the version to key fields cached on disk with is only fetched once."""
+        fields.cache_path = tmp_path
+        fields.get()
+        fields.get(cache=False)
+        fields.get()
+        calls = fields.parent.calls
+        assert calls.count(API_VERSION.system.meta_about) == 1
+        assert calls.count(API_VERSION.devices.fields) == 2
+
+        fields.cache_clear()
+        fields.get()
+        assert calls.count(API_VERSION.system.meta_about) == 2
+
+    def test_disk(self, fields, tmp_path):
+        """Test fields cached on disk are used by a new object until they expire."""
+        fields.cache_path = tmp_path
+        fields_map = fields.get()
+        path = tmp_path / "fields_badwolf_3443_devices_3.3.0.json"
+        assert path.is_file()
+
+        other = Fields(parent=FakeParent())
+        other.cache_path = tmp_path
+        assert other.get() == fields_map
+        assert other.parent.calls == [API_VERSION.system.meta_about]
+
+        data = json.loads(path.read_text())
+        data["created"] -= other.cache_disk_ttl
+        path.write_text(json.dumps(data))
+        assert other.get() == fields_map
+        assert other.parent.calls[-1] == API_VERSION.devices.fields
+
+        path.write_text("badwolf")
+        assert other.get() == fields_map
+        assert json.loads(path.read_text())["raw"]["generic"]
+
+
 def val_source(obj):
     """Pass."""
     source = obj.pop("source", {})
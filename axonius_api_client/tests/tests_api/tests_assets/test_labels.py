@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonapi.api.assets."""
+import logging
+import types
+
 import pytest
+import requests
+from axonius_api_client.api.assets.labels import Labels
+from axonius_api_client.api.routers import API_VERSION
+from axonius_api_client.exceptions import ResponseNotOk
+from axonius_api_client.http import Http, RetryPolicy
 
 
 def load_test_data(apiobj):
@@ -151,6 +159,25 @@ class LabelsPublic:
         for label in labels:
             assert label not in all_labels_post_remove
 
+    def test_add_remove_summary(self, apiobj):
+        """Pass."""
+        labels = ["badwolf3"]
+        rows = apiobj.TEST_DATA["assets"][:5]
+
+        result = apiobj.labels.add(
+            labels=labels, rows=rows, batch_size=2, workers=2, summary=True
+        )
+        assert result["processed"] == len(rows)
+        assert [x["count"] for x in result["batches"]] == [2, 2, 1]
+        assert not result["failed_ids"]
+        assert not any(x["error"] for x in result["batches"])
+
+        result = apiobj.labels.remove(
+            labels=labels, rows=rows, batch_size=2, workers=2, summary=True
+        )
+        assert result["processed"] >= 1
+        assert not result["failed_ids"]
+
 
 class TestLabelsDevices(LabelsPrivate, LabelsPublic):
     """Pass."""
@@ -168,3 +195,74 @@ class TestLabelsUsers(LabelsPrivate, LabelsPublic):
     def apiobj(self, api_users):
         """Pass."""
         return load_test_data(api_users)
+
+
+class TestLabelsRetries:
+    """Test retrying batches of labels without an Axonius instance."""
+
+    @pytest.fixture
+    def labels(self, monkeypatch):
+        """Pass."""
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        parent = types.SimpleNamespace(
+            LOG=logging.getLogger("axonius_api_client.tests.labels"),
+            http=Http(url="https://badwolf:3443"),
+            auth=None,
+            router=API_VERSION.devices,
+            request=None,
+            request_async=None,
+            request_stream=None,
+        )
+        return Labels(parent=parent)
+
+    @staticmethod
+    def get_method(calls, status_code):
+        """Pass."""
+
+        def method(labels, ids):
+            calls.append(ids)
+            response = requests.Response()
+            response.status_code = status_code
+            exc = ResponseNotOk(f"status {status_code}")
+            exc.response = response
+            raise exc
+
+        return method
+
+    def test_transient(self, labels):
+        """Test a batch that failed with a transient error is retried."""
+        calls = []
+        result = labels._process_batch(
+            method=self.get_method(calls=calls, status_code=503),
+            labels=["badwolf"],
+            ids=["id1"],
+            retries=2,
+        )
+        assert result["tries"] == 3
+        assert len(calls) == 3
+        assert isinstance(result["error"], ResponseNotOk)
+
+    def test_not_transient(self, labels):
+        """Test a batch that failed with a non-transient error is not retried."""
+        calls = []
+        result = labels._process_batch(
+            method=self.get_method(calls=calls, status_code=400),
+            labels=["badwolf"],
+            ids=["id1"],
+            retries=2,
+        )
+        assert result["tries"] == 1
+        assert len(calls) == 1
+
+    def test_http_retries(self, labels):
+        """Test a batch is not retried if requests are already retried by http."""
+        labels.http.RETRY = RetryPolicy(retries=3)
+        calls = []
+        result = labels._process_batch(
+            method=self.get_method(calls=calls, status_code=503),
+            labels=["badwolf"],
+            ids=["id1"],
+            retries=2,
+        )
+        assert result["tries"] == 1
+        assert len(calls) == 1
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test suite for streamed pages of assets that do not need an Axonius instance."""
+import io
+import json
+
+import pytest
+import requests
+from axonius_api_client.api.assets.devices import Devices
+from axonius_api_client.api.routers import API_VERSION
+from axonius_api_client.http import Http
+
+URL = "https://badwolf:3443"
+FIELDS = {
+    "generic": [{"name": "hostname", "title": "Host Name", "type": "string"}],
+    "specific": {},
+}
+
+
+class CannedAdapter(requests.adapters.BaseAdapter):
+    """Pass."""
+
+    def __init__(self, bodies):
+        """Pass."""
+        super().__init__()
+        self.bodies = bodies
+        self.requests = []
+        self.responses = []
+
+    def send(self, request, **kwargs):
+        """Pass."""
+        path = request.path_url.split("?")[0]
+        body = self.bodies[path].pop(0)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+
+        self.requests.append(request)
+        self.responses.append(response)
+        return response
+
+    def close(self):
+        """Pass."""
+        pass
+
+
+class FakeAuth:
+    """Pass."""
+
+    def __init__(self):
+        """Pass."""
+        self.http = Http(url=URL)
+
+    def check_login(self):
+        """Pass."""
+        pass
+
+
+def get_page(rows, number, total):
+    """Pass."""
+    assets = [
+        {"internal_axon_id": f"id{x}", "specific_data.data.hostname": [f"host{x}"]}
+        for x in rows
+    ]
+    page = {"number": number, "size": 2, "totalPages": 2, "totalResources": total}
+    # page metadata after assets, so it is only known once the rows are iterated
+    return json.dumps({"assets": assets, "page": page}).encode()
+
+
+class TestPageStream:
+    """Test paging through streamed responses."""
+
+    @pytest.fixture
+    def apiobj(self):
+        """Pass."""
+        apiobj = Devices(auth=FakeAuth())
+        pages = [get_page([0, 1], 1, 3), get_page([2], 2, 3), get_page([], 3, 3)]
+        adapter = CannedAdapter(
+            bodies={
+                f"/{API_VERSION.devices.fields}": [json.dumps(FIELDS).encode()],
+                f"/{API_VERSION.devices.root}": pages,
+            }
+        )
+        apiobj.http.session.mount(URL, adapter)
+        apiobj.TEST_ADAPTER = adapter
+        apiobj.TEST_PAGES = pages[:]
+        return apiobj
+
+    def test_get_generator(self, apiobj):
+        """Test rows, paging state and body_size of streamed pages."""
+        events = []
+        apiobj.http.METRICS.subscribe(events.append)
+
+        rows = list(
+            apiobj.get_generator(
+                fields="hostname",
+                fields_default=False,
+                page_size=2,
+                use_cursor=False,
+                prefetch_pages=0,
+                page_stream=True,
+            )
+        )
+
+        assert [x["internal_axon_id"] for x in rows] == ["id0", "id1", "id2"]
+        assert [x["specific_data.data.hostname"] for x in rows] == [
+            ["host0"],
+            ["host1"],
+            ["host2"],
+        ]
+
+        adapter = apiobj.TEST_ADAPTER
+        skips = [json.loads(x.body)["skip"] for x in adapter.requests[1:]]
+        assert skips == [0, 2, 3]
+        assert [x.body_size for x in adapter.responses[1:]] == [
+            len(x) for x in apiobj.TEST_PAGES
+        ]
+
+        state = apiobj._LAST_CALLBACKS.STATE
+        assert state["rows_fetched_total"] == 3
+        assert state["rows_processed_total"] == 3
+        assert state["rows_to_fetch_total"] == 3
+
+        pages = [x["values"] for x in events if x["event"] == "page"]
+        assert [x["rows"] for x in pages] == [2, 1, 0]
+        assert all("fetch_seconds" not in x for x in pages)
+        assert all(x["callbacks_seconds"] >= 0 for x in pages)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test suite."""
+import json
+
+import pytest
+
+from axonius_api_client.api.parsers.stream import JsonStreamParser
+from axonius_api_client.exceptions import JsonInvalid
+
+PAGE = {
+    "page": {"number": 1, "totalResources": 1000, "totalPages": 10},
+    "assets": [
+        {"internal_axon_id": str(idx), "name": "badwolfé" * idx, "x": [1.5, None]}
+        for idx in range(100)
+    ],
+    "cursor": "abc",
+    "count": 123456,
+}
+
+
+def chunked(value, size):
+    """Pass."""
+    return [value[idx:idx + size] for idx in range(0, len(value), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 1024, 1024 * 1024])
+def test_stream_page_bytes(size):
+    """Pass."""
+    raw = json.dumps(PAGE).encode("utf-8")
+    parser = JsonStreamParser(chunks=chunked(raw, size), key="assets")
+    rows = list(parser)
+    assert rows == PAGE["assets"]
+    assert parser.count == len(PAGE["assets"])
+    assert parser.bytes == len(raw)
+    assert parser.data == {k: v for k, v in PAGE.items() if k != "assets"}
+
+
+def test_stream_page_str():
+    """Pass."""
+    raw = json.dumps(PAGE, indent=2)
+    parser = JsonStreamParser(chunks=chunked(raw, 13), key="assets")
+    assert list(parser) == PAGE["assets"]
+    assert parser.data["count"] == PAGE["count"]
+
+
+def test_stream_empty():
+    """Pass."""
+    parser = JsonStreamParser(chunks=[b"{}"], key="assets")
+    assert list(parser) == []
+    assert parser.data == {}
+
+    parser = JsonStreamParser(chunks=[b'{"assets": [ ], "x": 1}'], key="assets")
+    assert list(parser) == []
+    assert parser.data == {"x": 1}
+
+
+def test_stream_truncated():
+    """Pass."""
+    parser = JsonStreamParser(chunks=[b'{"assets": [{"a": 1}, {"a"'], key="assets")
+    with pytest.raises(JsonInvalid):
+        list(parser)
+
+
+def test_stream_not_object():
+    """Pass."""
+    parser = JsonStreamParser(chunks=[b"[1, 2]"], key="assets")
+    with pytest.raises(JsonInvalid):
+        list(parser)
+
+
+def test_stream_split_values():
+    """Test values split across chunks at every offset are decoded whole."""
+    page = {
+        "assets": [1.25, -0.5, 1e-05, 2.5E+10, 123, "badwolf", True, None],
+        "count": 10.75,
+        "cursor": "a\\\"b",
+    }
+    raw = json.dumps(page).encode("utf-8")
+    for idx in range(1, len(raw)):
+        parser = JsonStreamParser(chunks=[raw[:idx], raw[idx:]], key="assets")
+        assert list(parser) == page["assets"], raw[:idx]
+        assert parser.data == {"count": 10.75, "cursor": 'a\\"b'}, raw[:idx]
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.http."""
+import asyncio
 import logging
+import socket
 import sys
+import threading
+import time
 
 import pytest
 import requests
 
-from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http, ParserUrl
+from axonius_api_client.exceptions import HttpCircuitOpen, HttpError
+from axonius_api_client.http import (
+    AsyncHttp,
+    Http,
+    HttpHistory,
+    ParserUrl,
+    PoolAdapter,
+    RateLimiter,
+    RateLimits,
+    RetryPolicy,
+)
 from axonius_api_client.version import __version__
 
 from ..meta import (
@@ -368,3 +381,398 @@ class TestHttp:
         http()
 
         assert not caplog.records
+
+
+class TestBodySize:
+    """Test Http.get_body_size."""
+
+    def test_bytes(self):
+        """Test bytes are measured without decoding them."""
+        assert Http.get_body_size(body=b"\xff\xfe\x00") == 3
+
+    def test_str(self):
+        """Test str are measured as UTF-8."""
+        assert Http.get_body_size(body="badwolf\u00e9") == 9
+
+    def test_empty(self):
+        """Test no body is 0."""
+        assert Http.get_body_size(body=None) == 0
+
+    def test_response(self, httpbin):
+        """Test the body size of a response is its length in bytes."""
+        http = Http(url=httpbin.url)
+        response = http(path="bytes/1000")
+        assert response.body_size == 1000
+
+    def test_response_stream(self, httpbin):
+        """Test the body size of a streamed response is the Content-Length or 0."""
+        http = Http(url=httpbin.url)
+
+        with http(path="bytes/1000", stream=True) as response:
+            assert response.body_size == 1000
+
+        with http(path="stream-bytes/1000", stream=True) as response:
+            assert "Content-Length" not in response.headers
+            assert response.body_size == 0
+
+
+class TestHttpHistory:
+    """Test HttpHistory."""
+
+    def test_max_count(self, httpbin):
+        """Test the oldest responses are dropped past max_count."""
+        http = Http(url=httpbin.url, save_history=True, history_max_count=2)
+
+        responses = [http(path="get") for _ in range(3)]
+
+        assert len(http.HISTORY) == 2
+        assert list(http.HISTORY) == responses[1:]
+        assert http.HISTORY[-1] is responses[-1]
+        assert responses[0] not in http.HISTORY
+        assert http.HISTORY.stats["count"] == 3
+        assert http.HISTORY.stats["dropped"] == 1
+        assert http.HISTORY.stats["status_codes"] == {200: 3}
+        assert http.HISTORY.stats["methods"] == {"GET": 3}
+
+    def test_max_bytes(self, httpbin):
+        """Test the oldest responses are dropped past max_bytes."""
+        http = Http(url=httpbin.url, save_history=True, history_max_bytes=1500)
+
+        for _ in range(3):
+            http(path="bytes/1000")
+
+        assert len(http.HISTORY) == 1
+        assert http.HISTORY.bytes <= 1500
+        assert http.HISTORY.stats["response_bytes"] == 3000
+
+    def test_metadata(self, httpbin):
+        """Test only the metadata of responses is kept with metadata."""
+        http = Http(url=httpbin.url, save_history=True, history_metadata=True)
+
+        http(path="status/404")
+        entry = http.HISTORY[0]
+
+        assert isinstance(entry, dict)
+        assert entry["method"] == "GET"
+        assert entry["status_code"] == 404
+        assert entry["url"].endswith("/status/404")
+        assert entry["elapsed"] >= 0
+        assert http.HISTORY.bytes == 0
+
+    def test_clear(self):
+        """Test clear drops responses but not stats."""
+        history = HttpHistory()
+        response = requests.Response()
+        response.status_code = 200
+        response.body_size = 10
+
+        history.append(response)
+        history.clear()
+
+        assert not len(history)
+        assert history.bytes == 0
+        assert history.stats["count"] == 1
+        assert history.stats["response_bytes"] == 10
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy."""
+
+    def test_status_retries(self, httpbin):
+        """Test retry statuses are retried until retries run out."""
+        http = Http(url=httpbin.url, save_history=True, retries=2, retry_backoff=0)
+
+        response = http(path="status/503")
+
+        assert response.status_code == 503
+        assert response.retries == 2
+        assert len(http.HISTORY) == 1
+        assert http.RETRY.stats["attempts"] == 3
+        assert http.RETRY.stats["retries"] == 2
+        assert http.RETRY.stats["failures"] == 3
+
+    def test_not_idempotent(self, httpbin):
+        """Test requests that are not idempotent are not retried on statuses."""
+        http = Http(url=httpbin.url, retries=2, retry_backoff=0)
+
+        response = http(path="status/503", method="post")
+        assert response.retries == 0
+
+        response = http(path="status/503", method="post", idempotent=True)
+        assert response.retries == 2
+
+    def test_success_no_retry(self, httpbin):
+        """Test responses without a retry status are not retried."""
+        http = Http(url=httpbin.url, retries=2, retry_backoff=0)
+
+        response = http(path="status/404")
+        assert response.status_code == 404
+        assert response.retries == 0
+        assert http.RETRY.stats["failures"] == 0
+
+    def test_connection_error(self):
+        """Test connection errors are retried then raised."""
+        http = Http(url="https://127.0.0.1:1", retries=1, retry_backoff=0)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http(method="post")
+
+        assert http.RETRY.stats["attempts"] == 2
+
+    def test_circuit(self, httpbin):
+        """Test circuit opens after failures in a row and closes after a success."""
+        http = Http(url=httpbin.url, retries=5, retry_backoff=0, circuit_failures=2)
+
+        with pytest.raises(HttpCircuitOpen):
+            http(path="status/503")
+
+        assert http.RETRY.stats["attempts"] == 2
+        assert http.RETRY.stats["circuit_opens"] == 1
+        assert http.RETRY.stats["circuit_rejects"] == 1
+
+        with pytest.raises(HttpCircuitOpen):
+            http(path="get")
+
+        http.RETRY.circuit_seconds = 0
+        response = http(path="get")
+        assert response.status_code == 200
+        assert not http.RETRY.is_open
+        assert http.RETRY.failures == 0
+
+    def test_delay(self):
+        """Test delay doubles with jitter and is capped by backoff_max."""
+        policy = RetryPolicy(retries=10, backoff=1, backoff_max=5)
+
+        for attempt, low, high in [(1, 0.5, 1), (2, 1, 2), (3, 2, 4), (5, 2.5, 5)]:
+            delay = policy.get_delay(
+                attempt=attempt, idempotent=True, status_code=503, headers={}
+            )
+            assert low <= delay <= high
+
+        delay = policy.get_delay(
+            attempt=11, idempotent=True, status_code=503, headers={}
+        )
+        assert delay is None
+
+    def test_retry_after(self):
+        """Test Retry-After in seconds or as a date is used as the smallest delay."""
+        policy = RetryPolicy(retries=1, backoff=0, backoff_max=30)
+
+        delay = policy.get_delay(
+            attempt=1, idempotent=True, status_code=429, headers={"Retry-After": "3"}
+        )
+        assert delay == 3
+
+        delay = policy.get_delay(
+            attempt=1, idempotent=True, status_code=429, headers={"Retry-After": "90"}
+        )
+        assert delay == 30
+
+        value = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert policy.get_retry_after(headers={"Retry-After": value}) == 0
+        assert policy.get_retry_after(headers={"Retry-After": "badwolf"}) is None
+
+
+class TestRateLimits:
+    """Test RateLimits and RateLimiter."""
+
+    def test_rate(self):
+        """Test requests past the burst wait for tokens."""
+        limiter = RateLimiter(group="x", rate=50, burst=2)
+        start = time.monotonic()
+
+        for _ in range(6):
+            with limiter:
+                pass
+
+        assert time.monotonic() - start >= 0.07
+        assert limiter.stats["requests"] == 6
+        assert limiter.stats["waits"] == 4
+
+    def test_no_limit(self):
+        """Test no waiting without a rate or max_in_flight."""
+        limiter = RateLimiter(group="x")
+
+        for _ in range(100):
+            with limiter:
+                pass
+
+        assert limiter.stats["waits"] == 0
+        assert limiter.stats["in_flight"] == 0
+
+    def test_max_in_flight(self):
+        """Test no more than max_in_flight requests are in progress at once."""
+        limiter = RateLimiter(group="x", max_in_flight=2)
+
+        def send():
+            with limiter:
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=send) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.stats["in_flight_max"] == 2
+        assert limiter.stats["in_flight"] == 0
+        assert limiter.stats["waits"] >= 1
+
+    def test_groups(self):
+        """Test each group gets a limiter with its own settings or the defaults."""
+        limits = RateLimits(rate=10, groups={"assets": {"max_in_flight": 4}})
+
+        assets = limits.get(group="assets")
+        assert assets is limits.get(group="assets")
+        assert assets.rate == 10
+        assert assets.max_in_flight == 4
+
+        default = limits.get()
+        assert default.group == RateLimits.DEFAULT_GROUP
+        assert default.max_in_flight == 0
+        assert set(limits.stats) == {"assets", RateLimits.DEFAULT_GROUP}
+
+    def test_http_group(self, httpbin):
+        """Test Http sends requests through the limiter of limit_group."""
+        http = Http(url=httpbin.url, rate_limits={"badwolf": {"max_in_flight": 1}})
+
+        http(path="get", limit_group="badwolf")
+        http(path="get")
+
+        assert http.LIMITS.stats["badwolf"]["requests"] == 1
+        assert http.LIMITS.stats["badwolf"]["in_flight"] == 0
+        assert http.LIMITS.stats[RateLimits.DEFAULT_GROUP]["requests"] == 1
+
+    def test_http_stream(self, httpbin):
+        """Test a streamed response keeps its slot in the limiter until closed."""
+        http = Http(url=httpbin.url, rate_limits={"badwolf": {"max_in_flight": 1}})
+        limiter = http.LIMITS.get(group="badwolf")
+
+        response = http(path="stream-bytes/1000", stream=True, limit_group="badwolf")
+        assert limiter.stats["in_flight"] == 1
+
+        assert len(response.content) == 1000
+        assert limiter.stats["in_flight"] == 1
+        response.close()
+        response.close()
+        assert limiter.stats["in_flight"] == 0
+
+        with http(path="get", stream=True, limit_group="badwolf"):
+            assert limiter.stats["in_flight"] == 1
+        assert limiter.stats["in_flight"] == 0
+        assert limiter.semaphore.acquire(blocking=False)
+
+
+class TestPoolAdapter:
+    """Test PoolAdapter."""
+
+    def test_socket_options(self):
+        """Test keep-alive options are added to the default socket options."""
+        adapter = PoolAdapter(keepalive=True, keepalive_idle=30)
+        options = adapter.socket_options
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+        adapter = PoolAdapter(keepalive=False)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in adapter.socket_options
+
+    def test_http_pool(self, httpbin):
+        """Test Http mounts a PoolAdapter with the pool settings."""
+        http = Http(url=httpbin.url, pool_maxsize=4, pool_block=True)
+
+        assert http.session.get_adapter(httpbin.url) is http.adapter
+        assert http.adapter._pool_maxsize == 4
+        assert http.adapter._pool_block is True
+
+    def test_stats(self, httpbin):
+        """Test requests and connections are counted, even after pools are cleared."""
+        http = Http(url=httpbin.url)
+
+        for _ in range(3):
+            http(path="get")
+
+        stats = http.pool_stats
+        assert stats["pools"] == 1
+        assert stats["requests"] == 3
+        assert 1 <= stats["connections_opened"] <= 3
+        assert stats["connections_reused"] == 3 - stats["connections_opened"]
+
+        http.adapter.poolmanager.clear()
+        http(path="get")
+
+        stats = http.pool_stats
+        assert stats["requests"] == 4
+        assert stats["connections_opened"] >= 2
+
+
+class TestAsyncHttp:
+    """Test AsyncHttp."""
+
+    @pytest.fixture(autouse=True)
+    def check_aiohttp(self):
+        """Pass."""
+        pytest.importorskip("aiohttp")
+
+    def test_str_repr(self, request):
+        """Test str/repr has URL."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url)
+
+        assert isinstance(http.async_http, AsyncHttp)
+        assert http.async_http is http.async_http
+        assert ax_url in format(http.async_http)
+        assert ax_url in repr(http.async_http)
+
+    def test_call(self, httpbin):
+        """Test request is prepared by Http and response is a requests.Response."""
+        http = Http(url=httpbin.url, save_history=True, certwarn=False)
+        http.session.headers["api-key"] = "badwolf"
+
+        async def run():
+            async with http.async_http as async_http:
+                return await async_http(
+                    path="anything", method="post", json={"x": 1}, params={"y": "a b"}
+                )
+
+        response = asyncio.run(run())
+
+        assert isinstance(response, requests.Response)
+        assert response.status_code == 200
+        assert response in http.HISTORY
+        assert response == http.LAST_RESPONSE
+        assert response.request == http.LAST_REQUEST
+        assert response.body_size
+
+        data = response.json()
+        assert data["json"] == {"x": 1}
+        assert data["args"] == {"y": "a b"}
+        assert data["headers"]["Api-Key"] == "badwolf"
+        assert __version__ in data["headers"]["User-Agent"]
+
+    def test_ssl_context_cert_list(self, request, tmp_path):
+        """Test an SSL context is cached for a client cert and key in a list."""
+        cert_path = tmp_path / TEST_CLIENT_CERT_NAME
+        cert_path.write_text(TEST_CLIENT_CERT)
+        key_path = tmp_path / TEST_CLIENT_KEY_NAME
+        key_path.write_text(TEST_CLIENT_KEY)
+        cert = [str(cert_path), str(key_path)]
+
+        async_http = Http(url=get_url(request), certwarn=False).async_http
+        context = async_http._get_ssl_context(verify=False, cert=cert)
+        assert async_http._get_ssl_context(verify=False, cert=list(cert)) is context
+        assert async_http._get_ssl_context(verify=False, cert=tuple(cert)) is context
+
+    def test_verify_ca_bundle(self, httpbin_secure, httpbin_ca_bundle):
+        """Test verification uses the CA bundle from requests settings."""
+        http = Http(url=httpbin_secure.url, certwarn=False)
+
+        async def run():
+            async with http.async_http as async_http:
+                return await async_http(path="get")
+
+        response = asyncio.run(run())
+        assert response.status_code == 200
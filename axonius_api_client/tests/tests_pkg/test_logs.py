@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.tools."""
+import io
 import logging
 import pathlib
 import time
@@ -16,6 +17,7 @@ from axonius_api_client.constants import (
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.logs import (
     LOG,
+    LazyFormat,
     add_file,
     add_null,
     add_stderr,
@@ -136,3 +138,30 @@ class TestLogs:
         assert isinstance(dh[LOG.name], list)
         assert h in dh[LOG.name]
         assert h not in LOG.handlers
+
+    def test_lazy_format(self):
+        """Test the value is only built when a handler emits the record."""
+        calls = []
+
+        def build(value):
+            calls.append(value)
+            return value.upper()
+
+        log = logging.getLogger(f"{LOG.name}.test_lazy_format")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setLevel(logging.WARNING)
+        log.addHandler(handler)
+
+        try:
+            log.debug("value: %s", LazyFormat(build, "badwolf"))
+            assert not calls
+
+            handler.setLevel(logging.DEBUG)
+            log.debug("value: %s", LazyFormat(build, "badwolf"))
+            assert calls == ["badwolf"]
+            assert "value: BADWOLF" in stream.getvalue()
+        finally:
+            log.removeHandler(handler)
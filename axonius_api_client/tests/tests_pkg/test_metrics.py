@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.metrics."""
+import time
+
+import pytest
+import requests
+
+from axonius_api_client.http import Http
+from axonius_api_client.metrics import (
+    Metrics,
+    MetricsAggregator,
+    get_quantile,
+    timed_iter,
+)
+
+
+def emit_values(metrics, values, **labels):
+    """Pass."""
+    for value in values:
+        metrics.emit(event="badwolf", values={"seconds": value}, labels=labels)
+
+
+class TestMetrics:
+    """Test Metrics."""
+
+    def test_subscribe(self):
+        """Test hooks get events they subscribed to until they unsubscribe."""
+        metrics = Metrics()
+        events = []
+        assert not metrics.enabled
+
+        metrics.subscribe(events.append, events=["badwolf"])
+        assert metrics.enabled
+
+        metrics.emit(event="badwolf", values={"seconds": 1}, labels={"x": "y"})
+        metrics.emit(event="other", values={"seconds": 2})
+        metrics.unsubscribe(events.append)
+        metrics.emit(event="badwolf", values={"seconds": 3})
+
+        assert len(events) == 1
+        assert events[0]["event"] == "badwolf"
+        assert events[0]["values"] == {"seconds": 1}
+        assert events[0]["labels"] == {"x": "y"}
+        assert not metrics.enabled
+
+    def test_hook_error(self):
+        """Test a hook that fails does not stop other hooks."""
+        metrics = Metrics()
+        events = []
+
+        def fail(event):
+            raise ValueError("badwolf")
+
+        metrics.subscribe(fail)
+        metrics.subscribe(events.append)
+        metrics.emit(event="badwolf", values={})
+
+        assert len(events) == 1
+
+
+class TestMetricsAggregator:
+    """Test MetricsAggregator."""
+
+    def test_summary(self):
+        """Test quantiles, count, sum, min and max of values."""
+        metrics = Metrics()
+        aggregator = MetricsAggregator()
+        metrics.subscribe(aggregator)
+
+        emit_values(metrics, range(100, 0, -1))
+        summary = aggregator.summary()
+
+        assert len(summary) == 1
+        assert summary[0]["count"] == 100
+        seconds = summary[0]["values"]["seconds"]
+        assert seconds["p50"] == 50
+        assert seconds["p95"] == 95
+        assert seconds["p99"] == 99
+        assert seconds["min"] == 1
+        assert seconds["max"] == 100
+        assert seconds["sum"] == 5050
+
+    def test_labels_max_samples(self):
+        """Test values are grouped by labels and quantiles use recent values."""
+        metrics = Metrics()
+        aggregator = MetricsAggregator(labels=["group"], max_samples=2)
+        metrics.subscribe(aggregator)
+
+        emit_values(metrics, [100, 1, 2], group="assets")
+        emit_values(metrics, [5], group="system")
+        summary = {x["labels"]["group"]: x for x in aggregator.summary()}
+
+        assets = summary["assets"]["values"]["seconds"]
+        assert assets["count"] == 3
+        assert assets["max"] == 100
+        assert assets["p99"] == 2
+        assert summary["system"]["values"]["seconds"]["p50"] == 5
+
+    def test_non_numbers(self):
+        """Test values that are not numbers are ignored."""
+        aggregator = MetricsAggregator()
+        aggregator({"event": "x", "labels": {}, "values": {"a": True, "b": "c"}})
+        assert aggregator.summary()[0]["values"] == {}
+
+    def test_prometheus(self, tmp_path):
+        """Test the summary is exported in the Prometheus text format."""
+        metrics = Metrics()
+        aggregator = MetricsAggregator(labels=["group"])
+        metrics.subscribe(aggregator)
+        emit_values(metrics, [1, 2, 3], group='a"b')
+
+        text = aggregator.to_prometheus(prefix="test")
+        lines = text.splitlines()
+
+        assert "# TYPE test_badwolf_total counter" in lines
+        assert 'test_badwolf_total{group="a\\"b"} 3' in lines
+        assert "# TYPE test_badwolf_seconds summary" in lines
+        assert 'test_badwolf_seconds{group="a\\"b",quantile="0.5"} 2' in lines
+        assert 'test_badwolf_seconds_sum{group="a\\"b"} 6' in lines
+        assert 'test_badwolf_seconds_count{group="a\\"b"} 3' in lines
+
+        path = aggregator.write_prometheus(path=tmp_path / "metrics.prom", prefix="test")
+        assert path.read_text() == text
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_prometheus_empty(self):
+        """Test nothing is exported without events."""
+        assert MetricsAggregator().to_prometheus() == ""
+
+
+class TestTools:
+    """Test metrics tools."""
+
+    def test_get_quantile(self):
+        """Pass."""
+        assert get_quantile(samples=[], quantile=0.5) is None
+        assert get_quantile(samples=[1], quantile=0.99) == 1
+        assert get_quantile(samples=[1, 2, 3, 4], quantile=0.5) == 2
+
+    def test_timed_iter(self):
+        """Test only the time spent in the iterable is counted."""
+
+        def slow():
+            for x in range(2):
+                time.sleep(0.05)
+                yield x
+
+        timings = {}
+        for _ in timed_iter(iterable=slow(), timings=timings, key="seconds"):
+            time.sleep(0.1)
+
+        assert 0.1 <= timings["seconds"] < 0.2
+
+
+class TestHttpMetrics:
+    """Test events emitted by Http."""
+
+    def test_http_request(self, httpbin):
+        """Test an http_request event with timings is emitted for each response."""
+        http = Http(url=httpbin.url)
+        events = []
+        http.METRICS.subscribe(events.append)
+
+        response = http(path="bytes/100", limit_group="badwolf")
+
+        assert len(events) == 1
+        event = events[0]
+        assert event["event"] == "http_request"
+        assert event["labels"] == {
+            "method": "GET",
+            "group": "badwolf",
+            "status_code": "200",
+        }
+
+        values = event["values"]
+        assert values["response_bytes"] == 100
+        assert values["retries"] == 0
+        assert values["reused"] is False
+        assert values["connect_seconds"] > 0
+        assert values["seconds"] >= values["ttfb_seconds"]
+        for key in ["wait_seconds", "tls_seconds", "download_seconds"]:
+            assert values[key] >= 0
+        assert response.timings == {
+            k: v
+            for k, v in values.items()
+            if k not in ["retries", "request_bytes", "response_bytes"]
+        }
+
+    def test_http_error(self):
+        """Test an http_error event is emitted for a request that failed."""
+        http = Http(url="http://127.0.0.1:1")
+        events = []
+        http.METRICS.subscribe(events.append)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http(path="get")
+
+        assert [x["event"] for x in events] == ["http_error"]
+        assert events[0]["labels"]["error"] == "ConnectionError"
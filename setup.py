@@ -31,6 +31,13 @@ install_requires = [
     "tabulate>=0.8.7",
 ]
 
+extras_require = {
+    "async": ["aiohttp>=3.6.2"],
+    "fast": ["orjson>=3.0.0"],
+    "compress": ["zstandard>=0.13.0", "lz4>=3.0.0"],
+    "columnar": ["pyarrow>=1.0.0"],
+}
+
 setup(
     name=ABOUT["__title__"],
     version=ABOUT["__version__"],
@@ -45,6 +52,7 @@ setup(
     include_package_data=True,
     python_requires=">=3.5",
     install_requires=install_requires,
+    extras_require=extras_require,
     keywords=["Axonius", "API Library"],
     tests_require=["pytest", "pytest-cov", "pytest-httpbin", "coverage"],
     license=ABOUT["__license__"],